@@ -0,0 +1,36 @@
+"""
+Analytics benchmarks: streaming aggregation over recorded discovery sessions.
+"""
+
+import json
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+from analytics.session_analytics import aggregate, build_summary
+from discovery.session_log import iter_responses
+from harness import benchmark
+
+SESSIONS = 500
+QUESTIONS = 20
+
+def write_sessions(directory: Path):
+    rng = random.Random(42)
+    for session in range(SESSIONS):
+        with open(directory / f"{session:06d}.jsonl", "w", encoding="utf-8") as f:
+            f.write(json.dumps({"header": {"session": str(session)}}) + "\n")
+            for question in range(QUESTIONS):
+                answer = rng.choice(["", "ok", "Web browser", "Within a month", f"free text {rng.randint(0, 999)}"])
+                f.write(json.dumps({
+                    "question_id": f"q{question}", "question": f"Question {question}?",
+                    "answer": answer, "category": "synthetic",
+                    "seconds": rng.uniform(0.5, 90), "skipped": not answer
+                }) + "\n")
+
+@benchmark("analytics.scan_500_sessions", number=3)
+def scan_sessions():
+    directory = Path(tempfile.mkdtemp())
+    write_sessions(directory)
+    yield lambda: build_summary(*aggregate(iter_responses([directory])))
+    shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,71 @@
+"""
+Technology scoring benchmarks: the NumPy matrix scorer against the
+equivalent per-candidate Python loop, on a synthetic catalog of 500
+candidates and a batch of 1000 requirement sets.
+"""
+
+import random
+
+from decision.technology_selector import ANSWER_WEIGHTS, CRITERIA, TechnologySelector
+from harness import benchmark
+
+CATALOG_SIZE = 500
+BATCH_SIZE = 1000
+
+def synthetic_catalog(size, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"candidate-{i}",
+            "tech_stack": f"Stack {i}",
+            "project_type": "web_app",
+            "architecture": "monolith",
+            "template": None,
+            "capabilities": {criterion: rng.random() for criterion in CRITERIA if rng.random() < 0.7},
+        }
+        for i in range(size)
+    ]
+
+def synthetic_requirements(count, seed=1):
+    rng = random.Random(seed)
+    return [
+        {question_id: rng.choice(options)[0] for question_id, options in ANSWER_WEIGHTS.items()}
+        for _ in range(count)
+    ]
+
+def rank_with_loops(selector, requirements, k=3):
+    """Reference scorer: dict lookups per candidate, then a full sort"""
+    weights = dict(zip(CRITERIA, selector.requirement_vector(requirements).tolist()))
+    scored = []
+    for candidate in selector.catalog:
+        score = 0.0
+        for criterion, capability in candidate["capabilities"].items():
+            score += capability * weights[criterion]
+        scored.append((candidate, score))
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return scored[:k]
+
+def selector_and_requirements():
+    selector = TechnologySelector(catalog=synthetic_catalog(CATALOG_SIZE))
+    selector.candidate_matrix  # Built once, outside the timed region
+    return selector, synthetic_requirements(BATCH_SIZE)
+
+@benchmark("decision.rank_matrix_500", number=200)
+def rank_matrix():
+    selector, requirements = selector_and_requirements()
+    return lambda: selector.rank(requirements[0])
+
+@benchmark("decision.rank_loop_500", number=200)
+def rank_loop():
+    selector, requirements = selector_and_requirements()
+    return lambda: rank_with_loops(selector, requirements[0])
+
+@benchmark("decision.rank_batch_matrix_1000x500", repeat=5)
+def rank_batch_matrix():
+    selector, requirements = selector_and_requirements()
+    return lambda: selector.rank_batch(requirements)
+
+@benchmark("decision.rank_batch_loop_1000x500", repeat=3)
+def rank_batch_loop():
+    selector, requirements = selector_and_requirements()
+    return lambda: [rank_with_loops(selector, r) for r in requirements]
@@ -0,0 +1,100 @@
+"""
+Discovery benchmarks: ConversationEngine sessions driven by synthetic
+answers, and batch-response parsing at scale.
+"""
+
+import builtins
+import contextlib
+import io
+import shutil
+import tempfile
+from pathlib import Path
+
+from discovery.conversation_engine import ConversationEngine
+from discovery.question_library import QuestionLibraryLoader, LIBRARY_DIR
+from harness import benchmark
+
+SYNTHETIC_ANSWERS = [
+    "An internal tool to track equipment loans across three offices",
+    "5",
+    "Intermediate",
+    "Staff in every office plus two administrators",
+    "Slack, GitHub and Google Workspace",
+    "Needs to post notifications to Slack",
+    "Cloud (AWS/GCP/Azure)",
+    "Web browser",
+    "Within a month",
+    "Small budget ($10-100/month)",
+    "The platform team",
+    "Department (20-100)",
+    "Every loan is tracked and overdue items are flagged",
+    "Check-out, check-in, overdue reminders",
+    "Barcode scanning",
+]
+
+def synthetic_input(prompt=""):
+    """Answer any prompt the engine shows with plausible text"""
+    if "Your answers" in prompt:
+        # List style: numbered answers cover every category's questions
+        return "\n".join(f"{i}. {answer}" for i, answer in enumerate(SYNTHETIC_ANSWERS, 1))
+    if "expand" in prompt:
+        return "About twelve people, mostly engineers"
+    return SYNTHETIC_ANSWERS[0]
+
+def run_session(style):
+    engine = ConversationEngine(style=style)
+    original = builtins.input
+    builtins.input = synthetic_input
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return engine.conduct_discovery_interview()
+    finally:
+        builtins.input = original
+
+@benchmark("discovery.session_list", number=50)
+def session_list():
+    return lambda: run_session("list")
+
+@benchmark("discovery.session_single", number=50)
+def session_single():
+    return lambda: run_session("single")
+
+@benchmark("discovery.engine_init", number=500)
+def engine_init():
+    return lambda: ConversationEngine(style="list")
+
+@benchmark("discovery.library_compile_cold", number=20)
+def library_compile_cold():
+    cache_dir = Path(tempfile.mkdtemp())
+    def run():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        QuestionLibraryLoader(LIBRARY_DIR, cache_dir).load("core")
+    yield run
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+@benchmark("discovery.library_load_cached", number=200)
+def library_load_cached():
+    cache_dir = Path(tempfile.mkdtemp())
+    QuestionLibraryLoader(LIBRARY_DIR, cache_dir).load("core")
+    yield lambda: QuestionLibraryLoader(LIBRARY_DIR, cache_dir).load("core")
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+def batch_questions(count):
+    return [{"id": f"q{i}", "question": f"Question {i}?"} for i in range(count)]
+
+@benchmark("discovery.parse_batch_numbered_1000", number=5)
+def parse_batch_numbered():
+    engine = ConversationEngine(style="list")
+    questions = batch_questions(1000)
+    # "1." first marks the response as numbered; the rest come in reverse so
+    # every lookup has to search for its number
+    order = [1] + list(range(1000, 1, -1))
+    response = "\n".join(f"{i}. Answer number {i}" for i in order)
+    return lambda: engine._parse_batch_response(response, questions)
+
+@benchmark("discovery.parse_batch_in_order_10000", number=20)
+def parse_batch_in_order():
+    engine = ConversationEngine(style="list")
+    questions = batch_questions(10000)
+    response = "\n".join(f"Answer for question {i}" for i in range(10000))
+    return lambda: engine._parse_batch_response(response, questions)
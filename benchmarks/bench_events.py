@@ -0,0 +1,30 @@
+"""
+Event bus benchmarks: emit cost with nobody listening, and with the
+buffered NDJSON sink writing to /dev/null.
+"""
+
+import os
+
+from events.event_bus import EventBus, NDJSONSink
+from harness import benchmark
+
+EVENTS = 10000
+
+def emit_answers(bus):
+    for i in range(EVENTS):
+        bus.emit("answer_recorded", question_id="team_size", category="user_context",
+                 seconds=1.5, skipped=False, answer_length=i)
+
+@benchmark("events.emit_no_sinks_10000", number=20)
+def emit_no_sinks():
+    bus = EventBus()
+    return lambda: emit_answers(bus)
+
+@benchmark("events.emit_ndjson_10000", number=5)
+def emit_ndjson():
+    fd = os.open(os.devnull, os.O_WRONLY)
+    bus = EventBus()
+    bus.subscribe(NDJSONSink(fd))
+    yield lambda: emit_answers(bus)
+    bus.close()
+    os.close(fd)
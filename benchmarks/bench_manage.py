@@ -0,0 +1,91 @@
+"""
+ProjectManager benchmark: `start` until /health answers, on a throwaway
+copy of manage.py serving a minimal stdlib app.
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+from harness import Skip, benchmark
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+HEALTH_APP = '''
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b'{"status": "healthy"}'
+        self.send_response(200 if self.path == "/health" else 404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+ThreadingHTTPServer(("127.0.0.1", int(os.environ["PORT"])), Handler).serve_forever()
+'''
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def wait_ready(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.01)
+    raise TimeoutError(f"service on port {port} never became ready")
+
+@benchmark("manage.start_to_ready", repeat=3, warmup=0, self_timed=True)
+def start_to_ready():
+    try:
+        import psutil  # noqa: F401  (manage.py needs it)
+    except ImportError:
+        raise Skip("psutil not installed")
+    if os.name == "nt":
+        raise Skip("benchmark uses a POSIX venv layout")
+
+    project = Path(tempfile.mkdtemp(prefix="bench-manage-"))
+    port = free_port()
+    source = (REPO_ROOT / "manage.py").read_text()
+    for placeholder, value in {"PROJECT_NAME": "bench", "SERVICE_NAME": "bench",
+                               "PORT": str(port), "PYTHON_COMMAND": "app.py"}.items():
+        source = source.replace("{{" + placeholder + "}}", value)
+    (project / "manage.py").write_text(source)
+    (project / "app.py").write_text(HEALTH_APP)
+    (project / ".venv" / "bin").mkdir(parents=True)
+    os.symlink(sys.executable, project / ".venv" / "bin" / "python")
+
+    spec = importlib.util.spec_from_file_location("bench_manage_copy", project / "manage.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    manager = module.ProjectManager()
+
+    def start_and_wait():
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            manager.start_service()
+            wait_ready(port)
+            elapsed = time.perf_counter() - start
+            manager.stop_service()
+        return elapsed
+
+    yield start_and_wait
+    shutil.rmtree(project, ignore_errors=True)
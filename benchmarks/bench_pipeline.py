@@ -0,0 +1,68 @@
+"""
+Inception pipeline benchmarks: technology selection and full project
+generation into a temporary directory. Each one skips while the
+component it measures isn't present in the tree.
+"""
+
+import contextlib
+import io
+import shutil
+import tempfile
+
+from harness import Skip, benchmark
+
+REQUIREMENTS = {
+    "project_goal": "An internal tool to track equipment loans across three offices",
+    "team_size": "5",
+    "technical_comfort": "Intermediate",
+    "end_users": "Staff in every office",
+    "existing_tools": "Slack, GitHub and Google Workspace",
+    "integration_needs": "Needs to post notifications to Slack",
+    "deployment_preference": "Cloud (AWS/GCP/Azure)",
+    "access_patterns": "Web browser",
+    "timeline": "Within a month",
+    "budget": "Small budget ($10-100/month)",
+    "maintenance": "The platform team",
+    "scalability": "Department (20-100)",
+    "success_definition": "Every loan is tracked",
+    "must_have_features": "Check-out, check-in, overdue reminders",
+}
+
+def load_selector():
+    try:
+        from decision.technology_selector import TechnologySelector
+    except ImportError:
+        raise Skip("TechnologySelector not implemented yet")
+    return TechnologySelector()
+
+@benchmark("decision.analyze_and_recommend", number=200)
+def technology_selection():
+    selector = load_selector()
+    with contextlib.redirect_stdout(io.StringIO()):
+        selector.analyze_and_recommend(dict(REQUIREMENTS))
+
+    def select():
+        with contextlib.redirect_stdout(io.StringIO()):
+            selector.analyze_and_recommend(dict(REQUIREMENTS))
+    return select
+
+@benchmark("generation.create_project", repeat=5)
+def create_project():
+    try:
+        from generation.project_generator import ProjectGenerator
+    except ImportError:
+        raise Skip("ProjectGenerator not implemented yet")
+    selector = load_selector()
+    with contextlib.redirect_stdout(io.StringIO()):
+        decisions = selector.analyze_and_recommend(dict(REQUIREMENTS))
+
+    output = tempfile.mkdtemp(prefix="bench-generate-")
+    runs = iter(range(1_000_000))
+
+    def generate():
+        generator = ProjectGenerator(output_dir=f"{output}/run-{next(runs)}")
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator.create_project(dict(REQUIREMENTS), decisions)
+
+    yield generate
+    shutil.rmtree(output, ignore_errors=True)
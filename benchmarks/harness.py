@@ -0,0 +1,94 @@
+"""
+Benchmark harness
+
+Benchmarks are functions registered with @benchmark. A benchmark does its
+setup, then either returns the zero-argument callable to time, or yields
+it (anything after the yield runs as teardown). Raise Skip when a
+benchmark can't run in this tree or environment. A target that needs
+untimed work around each call (e.g. stopping a service it started) is
+registered with self_timed=True and returns its own measurement as a
+float number of seconds; any other target's return value is ignored.
+
+    @benchmark("parse.numbered_1000", number=20)
+    def parse_numbered():
+        engine = ConversationEngine(style="list")
+        response = ...
+        return lambda: engine._parse_batch_response(response, questions)
+"""
+
+import inspect
+import statistics
+import time
+
+BENCHMARKS = []
+
+class Skip(Exception):
+    """Raised by a benchmark that can't run here"""
+
+class Benchmark:
+    def __init__(self, name, func, repeat, number, warmup, self_timed):
+        self.name = name
+        self.func = func
+        self.repeat = repeat
+        self.number = number
+        self.warmup = warmup
+        self.self_timed = self_timed
+
+def benchmark(name, repeat=5, number=1, warmup=1, self_timed=False):
+    """
+    Register a benchmark; `number` calls per timed sample, `repeat` samples.
+    With self_timed=True the target returns its own timing in seconds.
+    """
+    def decorator(func):
+        BENCHMARKS.append(Benchmark(name, func, repeat, number, warmup, self_timed))
+        return func
+    return decorator
+
+def run_benchmark(bench, repeat=None):
+    """
+    Time one benchmark. Returns a result dict with per-call seconds
+    (median/min/max/stdev over samples), or {"skipped": reason}.
+    """
+    try:
+        if inspect.isgeneratorfunction(bench.func):
+            generator = bench.func()
+            target = next(generator)
+        else:
+            generator = None
+            target = bench.func()
+    except Skip as e:
+        return {"skipped": str(e)}
+
+    try:
+        for _ in range(bench.warmup):
+            target()
+
+        samples = []
+        for _ in range(repeat or bench.repeat):
+            if bench.self_timed:
+                elapsed = sum(float(target()) for _ in range(bench.number))
+            else:
+                start = time.perf_counter()
+                for _ in range(bench.number):
+                    target()
+                elapsed = time.perf_counter() - start
+            samples.append(elapsed / bench.number)
+    finally:
+        if generator is not None:
+            next(generator, None)
+
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "samples": len(samples),
+        "number": bench.number
+    }
+
+def format_seconds(seconds):
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} µs"
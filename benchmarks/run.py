@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Inception Benchmark Suite
+
+Runs every benchmark in benchmarks/bench_*.py and compares the median
+time per call against the stored baseline for this machine. Exits
+non-zero when any benchmark is slower than its baseline by more than the
+tolerance, so performance can be gated like the test suite.
+
+Usage:
+    python benchmarks/run.py                     # Run and compare
+    python benchmarks/run.py --save-baseline     # Run and store as the new baseline
+    python benchmarks/run.py --filter discovery  # Only matching benchmarks
+    python benchmarks/run.py --tolerance 0.10 --json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(1, str(REPO_ROOT / "inception"))
+
+from harness import BENCHMARKS, format_seconds, run_benchmark
+
+BASELINE_FILE = BENCH_DIR / "baselines.json"
+DEFAULT_TOLERANCE = 0.25
+
+def machine_id():
+    """Baselines are only comparable on the same machine and interpreter"""
+    return f"{platform.node()}-{platform.system()}-{platform.machine()}-py{platform.python_version()}"
+
+def load_benchmarks():
+    for path in sorted(BENCH_DIR.glob("bench_*.py")):
+        importlib.import_module(path.stem)
+    return BENCHMARKS
+
+def load_baselines(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"machines": {}}
+
+def save_baselines(path, baselines):
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp, path)
+
+def compare(result, baseline, tolerance):
+    """'regression', 'improved', 'ok' or 'new'"""
+    if baseline is None:
+        return "new"
+    ratio = result["median"] / baseline["median"]
+    if ratio > 1 + tolerance:
+        return "regression"
+    if ratio < 1 - tolerance:
+        return "improved"
+    return "ok"
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the inception benchmark suite")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Allowed slowdown vs baseline as a fraction (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--repeat", type=int, help="Override the number of samples per benchmark")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    baselines = load_baselines(args.baseline)
+    machine = machine_id()
+    stored = baselines["machines"].get(machine, {})
+
+    benchmarks = [bench for bench in load_benchmarks() if args.filter in bench.name]
+    if not args.json:
+        print("⏱️  Inception Benchmark Suite")
+        print("============================")
+        print(f"🖥️  {machine}")
+        print(f"📏 Tolerance: ±{args.tolerance:.0%}" + ("" if stored else " (no baseline for this machine yet)"))
+        print("")
+
+    results = {}
+    start = time.perf_counter()
+    for bench in benchmarks:
+        result = run_benchmark(bench, args.repeat)
+        if "skipped" not in result:
+            baseline = stored.get(bench.name)
+            result["baseline"] = baseline["median"] if baseline else None
+            result["status"] = compare(result, baseline, args.tolerance)
+        results[bench.name] = result
+
+        if not args.json:
+            if "skipped" in result:
+                print(f"⏭️  {bench.name:<40} skipped: {result['skipped']}")
+                continue
+            icon = {"regression": "❌", "improved": "🚀", "ok": "✅", "new": "🆕"}[result["status"]]
+            line = f"{icon} {bench.name:<40} {format_seconds(result['median']):>10} ±{format_seconds(result['stdev'])}"
+            if result["baseline"]:
+                line += f"  (baseline {format_seconds(result['baseline'])}, {result['median'] / result['baseline'] - 1:+.0%})"
+            print(line)
+
+    regressions = [name for name, result in results.items() if result.get("status") == "regression"]
+
+    if args.save_baseline:
+        stored = dict(stored)
+        for name, result in results.items():
+            if "skipped" not in result:
+                stored[name] = {"median": result["median"], "min": result["min"], "number": result["number"],
+                                "recorded_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+        baselines["machines"][machine] = stored
+        save_baselines(args.baseline, baselines)
+
+    if args.json:
+        print(json.dumps({"machine": machine, "tolerance": args.tolerance,
+                          "regressions": regressions, "results": results}, indent=2))
+    else:
+        print("")
+        print(f"🏁 {len(results)} benchmarks in {time.perf_counter() - start:.1f}s")
+        if args.save_baseline:
+            print(f"💾 Baseline saved to {args.baseline}")
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        else:
+            print("✅ No regressions")
+
+    return 1 if regressions and not args.save_baseline else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
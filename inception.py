@@ -11,6 +11,9 @@ Usage:
     python inception.py                    # Start interactive session
     python inception.py --conversation-style list  # Get multiple questions at once
     python inception.py --conversation-style single # One question at a time
+    python inception.py analyze            # Statistics over recorded discovery sessions
+    python inception.py --events-fd 3 3>events.ndjson  # Structured progress events
+    python inception.py --memory-report --memory-budget 64MB  # Per-phase memory use
 """
 
 import argparse
@@ -23,17 +26,23 @@ sys.path.insert(0, str(Path(__file__).parent / "inception"))
 from discovery.conversation_engine import ConversationEngine
 from decision.technology_selector import TechnologySelector
 from generation.project_generator import ProjectGenerator
+from discovery.session_log import SESSION_DIR
+from events.event_bus import EventBus, NDJSONSink
+from profiling.memory_profiler import MemoryProfiler, MemoryBudgetExceeded, parse_budget
 
 class ProjectInceptionOrchestrator:
     """
     Main orchestrator for the AI Project Inception process
     """
     
-    def __init__(self, conversation_style="ask_user"):
+    def __init__(self, conversation_style="ask_user", session_log_dir=SESSION_DIR, events=None,
+                 output_dir="./generated_projects"):
         self.conversation_style = conversation_style
-        self.conversation_engine = ConversationEngine(style=conversation_style)
+        self.session_log_dir = session_log_dir
+        self.events = events or EventBus()
+        self.conversation_engine = ConversationEngine(style=conversation_style, events=self.events)
         self.technology_selector = TechnologySelector()
-        self.project_generator = ProjectGenerator()
+        self.project_generator = ProjectGenerator(output_dir=output_dir)
         
         # Store the complete project context
         self.project_context = {
@@ -56,28 +65,67 @@ class ProjectInceptionOrchestrator:
         # Phase 1: Requirements Discovery
         print("📋 Phase 1: Requirements Discovery")
         print("----------------------------------")
-        requirements = self.conversation_engine.conduct_discovery_interview()
-        self.project_context["requirements"] = requirements
+        with self.events.phase("discovery"):
+            requirements = self.conversation_engine.conduct_discovery_interview()
+            self.project_context["requirements"] = requirements
+            if self.session_log_dir:
+                self.conversation_engine.save_session_log(self.session_log_dir)
         
         # Phase 2: Technology Decision
         print("\n⚙️ Phase 2: Technology Selection")
         print("--------------------------------")
-        technology_decisions = self.technology_selector.analyze_and_recommend(requirements)
-        self.project_context["technology_decisions"] = technology_decisions
+        with self.events.phase("decision"):
+            technology_decisions = self.technology_selector.analyze_and_recommend(requirements)
+            self.project_context["technology_decisions"] = technology_decisions
+            self.events.emit(
+                "decision_made",
+                candidate_id=technology_decisions.get("candidate_id"),
+                tech_stack=technology_decisions.get("tech_stack"),
+                project_type=technology_decisions.get("project_type"),
+                score=technology_decisions.get("score"),
+                alternatives=[alt.get("candidate_id") for alt in technology_decisions.get("alternatives", [])]
+            )
         
         # Phase 3: Project Generation
         print("\n🏗️ Phase 3: Project Generation")
         print("------------------------------")
-        generated_project = self.project_generator.create_project(
-            requirements, 
-            technology_decisions
-        )
-        self.project_context["generated_project"] = generated_project
+        with self.events.phase("generation"):
+            generated_project = self.project_generator.create_project(
+                requirements, 
+                technology_decisions
+            )
+            self.project_context["generated_project"] = generated_project
+            self._emit_generated_files(generated_project)
         
         # Summary and next steps
         self.display_project_summary()
         return self.project_context
     
+    def memory_objects(self):
+        """
+        What this run holds on to, for the memory report
+        """
+        return {
+            "project_context": self.project_context,
+            "conversation_history": self.conversation_engine.conversation_history,
+            "generated_project": self.project_context["generated_project"],
+        }
+    
+    def _emit_generated_files(self, generated_project):
+        """
+        One file_generated event per file the generator reports writing
+        """
+        if not self.events.sinks:
+            return
+        root = Path(generated_project.get("path", "."))
+        for relative in generated_project.get("files", []):
+            path = root / relative
+            try:
+                size = path.stat().st_size
+            except OSError:
+                size = None
+            self.events.emit("file_generated", path=str(path), bytes=size)
+    
     def display_project_summary(self):
         """
         Display a summary of what was created
@@ -102,8 +150,13 @@ def main():
     """
     Command line interface for the AI Project Inception System
     """
+    if sys.argv[1:2] == ["analyze"]:
+        from analytics.session_analytics import main as analyze
+        return analyze(sys.argv[2:])
+    
     parser = argparse.ArgumentParser(
-        description="AI Project Inception System - From Requirements to Working Project"
+        description="AI Project Inception System - From Requirements to Working Project",
+        epilog="Run 'inception.py analyze --help' for session analytics."
     )
     
     parser.add_argument(
@@ -120,6 +173,39 @@ def main():
         help="Directory where generated projects will be created"
     )
     
+    parser.add_argument(
+        "--session-log-dir",
+        type=str,
+        default=str(SESSION_DIR),
+        help=f"Where discovery sessions are recorded for 'analyze' (default: {SESSION_DIR})"
+    )
+    
+    parser.add_argument(
+        "--no-session-log",
+        action="store_true",
+        help="Don't record this discovery session"
+    )
+    
+    parser.add_argument(
+        "--events-fd",
+        type=int,
+        metavar="FD",
+        help="Write NDJSON progress events to this already-open file descriptor (e.g. 3 with 3>events.ndjson)"
+    )
+    
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="Trace allocations and report current/peak memory and top allocation sites per phase"
+    )
+    
+    parser.add_argument(
+        "--memory-budget",
+        type=str,
+        metavar="SIZE",
+        help="Fail the run if a phase's peak memory exceeds SIZE (e.g. 64MB, or discovery=16MB,generation=128MB)"
+    )
+    
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -128,11 +214,36 @@ def main():
     
     args = parser.parse_args()
     
+    events = EventBus()
+    if args.events_fd is not None:
+        try:
+            events.subscribe(NDJSONSink(args.events_fd))
+        except OSError as e:
+            print(f"❌ Can't write events to fd {args.events_fd}: {e.strerror}")
+            return 1
+    
+    profiler = None
+    if args.memory_report or args.memory_budget:
+        try:
+            budgets = parse_budget(args.memory_budget) if args.memory_budget else {}
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        # Subscribed last, so other sinks still see a phase_end that blows the budget
+        profiler = events.subscribe(MemoryProfiler(budgets=budgets))
+        profiler.start()
+    
     try:
         # Initialize and run the inception process
-        orchestrator = ProjectInceptionOrchestrator(
-            conversation_style=args.conversation_style
-        )
+        with events.phase("setup"):
+            orchestrator = ProjectInceptionOrchestrator(
+                conversation_style=args.conversation_style,
+                session_log_dir=None if args.no_session_log else Path(args.session_log_dir),
+                events=events,
+                output_dir=args.output_dir
+            )
+        if profiler:
+            profiler.objects = orchestrator.memory_objects
         
         project_context = orchestrator.start_inception()
         
@@ -147,12 +258,20 @@ def main():
     except KeyboardInterrupt:
         print("\n\n👋 Project inception cancelled by user.")
         return 1
+    except MemoryBudgetExceeded as e:
+        print(f"\n❌ Memory budget exceeded: {e}")
+        return 1
     except Exception as e:
         print(f"\n❌ Error during project inception: {e}")
         if args.verbose:
             import traceback
             traceback.print_exc()
         return 1
+    finally:
+        if profiler:
+            profiler.print_report()
+            profiler.stop()
+        events.close()
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,252 @@
+"""
+AI Project Inception - Session Analytics
+
+Aggregates recorded discovery sessions (see discovery/session_log.py) into
+per-question statistics: how often each question is skipped or needs
+clarification, which answers dominate, and how long people take to
+answer. Sessions are streamed, and every aggregate has a fixed size (a
+bounded heavy-hitters counter for answers, fixed histogram buckets for
+time), so memory stays flat no matter how many sessions are scanned.
+
+The result is written as a columnar JSON summary (one array per metric,
+one row per question) that `inception.py analyze --from-summary` can
+re-query without touching the logs again.
+
+Usage:
+    python inception.py analyze                          # scan .inception/sessions
+    python inception.py analyze logs/ --sort clarification
+    python inception.py analyze --from-summary .inception/session-summary.json --question team_size
+"""
+
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+
+from discovery.session_log import SESSION_DIR, iter_responses
+
+SUMMARY_FILE = SESSION_DIR.parent / "session-summary.json"
+SUMMARY_VERSION = 1
+
+# Upper edges, in seconds, of the time-per-question histogram buckets
+TIME_BUCKETS = [1, 2, 5, 10, 20, 30, 60, 120, 300, 600, float("inf")]
+TOP_ANSWER_CAPACITY = 32
+ANSWER_LENGTH = 60
+
+# Same rule as ConversationEngine._clarification_round
+CLARIFICATION_LENGTH = 5
+
+SORT_COLUMNS = {
+    "responses": "responses",
+    "skipped": "skip_rate",
+    "clarification": "clarification_rate",
+    "seconds": "mean_seconds",
+}
+
+WHITESPACE = re.compile(r"\s+")
+
+def normalize_answer(answer: str) -> str:
+    return WHITESPACE.sub(" ", answer.strip().lower())[:ANSWER_LENGTH]
+
+class TopAnswers:
+    """
+    Space-saving heavy-hitters counter: tracks at most `capacity` answers,
+    and any answer more frequent than 1/capacity of the total is guaranteed
+    to be among them (counts may be overestimated by at most the minimum)
+    """
+
+    def __init__(self, capacity: int = TOP_ANSWER_CAPACITY):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+
+    def add(self, answer: str):
+        if answer in self.counts:
+            self.counts[answer] += 1
+        elif len(self.counts) < self.capacity:
+            self.counts[answer] = 1
+        else:
+            evicted = min(self.counts, key=self.counts.get)
+            self.counts[answer] = self.counts.pop(evicted) + 1
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        ranked = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:n] if n else ranked
+
+class QuestionStats:
+    """
+    Fixed-size running aggregates for one question
+    """
+
+    def __init__(self, question_id: str):
+        self.question_id = question_id
+        self.question = ""
+        self.category = ""
+        self.responses = 0
+        self.skipped = 0
+        self.clarifications = 0
+        self.timed = 0
+        self.total_seconds = 0.0
+        self.time_histogram = [0] * len(TIME_BUCKETS)
+        self.answers = TopAnswers()
+
+    def add(self, response):
+        self.question = response.question
+        self.category = response.category or self.category
+        self.responses += 1
+        if response.skipped or not response.answer:
+            self.skipped += 1
+        else:
+            self.answers.add(normalize_answer(response.answer))
+            if response.needs_clarification or len(response.answer) < CLARIFICATION_LENGTH:
+                self.clarifications += 1
+        if response.seconds > 0:
+            self.timed += 1
+            self.total_seconds += response.seconds
+            for bucket, edge in enumerate(TIME_BUCKETS):
+                if response.seconds <= edge:
+                    self.time_histogram[bucket] += 1
+                    break
+
+def time_percentile(histogram: List[int], fraction: float,
+                    buckets: List[float] = TIME_BUCKETS) -> Optional[float]:
+    """
+    Upper bucket edge below which `fraction` of the timed answers fall
+    """
+    total = sum(histogram)
+    if not total:
+        return None
+    seen = 0
+    for edge, count in zip(buckets, histogram):
+        seen += count
+        if seen >= fraction * total:
+            return edge
+    return buckets[-1]
+
+def aggregate(records: Iterable[Any]) -> Tuple[int, Dict[str, QuestionStats]]:
+    """
+    Consume a record stream; returns (session count, stats per question)
+    """
+    sessions = 0
+    stats: Dict[str, QuestionStats] = {}
+    for record in records:
+        if isinstance(record, dict):
+            sessions += 1
+            continue
+        if record.question_id not in stats:
+            stats[record.question_id] = QuestionStats(record.question_id)
+        stats[record.question_id].add(record)
+    return sessions, stats
+
+def build_summary(sessions: int, stats: Dict[str, QuestionStats]) -> Dict[str, Any]:
+    rows = list(stats.values())
+
+    def rate(part, whole):
+        return round(part / whole, 4) if whole else 0.0
+
+    return {
+        "version": SUMMARY_VERSION,
+        "generated_at": time.time(),
+        "sessions": sessions,
+        "time_buckets": [edge if edge != float("inf") else None for edge in TIME_BUCKETS],
+        "columns": {
+            "question_id": [s.question_id for s in rows],
+            "category": [s.category for s in rows],
+            "question": [s.question for s in rows],
+            "responses": [s.responses for s in rows],
+            "skip_rate": [rate(s.skipped, s.responses) for s in rows],
+            # Of the questions that were answered at all
+            "clarification_rate": [rate(s.clarifications, s.responses - s.skipped) for s in rows],
+            "mean_seconds": [round(s.total_seconds / s.timed, 2) if s.timed else None for s in rows],
+            "time_histogram": [s.time_histogram for s in rows],
+            "top_answers": [s.answers.most_common(10) for s in rows],
+        }
+    }
+
+def write_summary(summary: Dict[str, Any], path: Path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, separators=(",", ":"))
+
+def load_summary(path: Path) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        summary = json.load(f)
+    if summary.get("version") != SUMMARY_VERSION:
+        raise ValueError(f"{path} is not a version {SUMMARY_VERSION} session summary")
+    summary["time_buckets"] = [float("inf") if edge is None else edge for edge in summary["time_buckets"]]
+    return summary
+
+def format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds == float("inf"):
+        return "long"
+    return f"{seconds:g}s"
+
+def print_summary(summary: Dict[str, Any], sort: str = "responses", question: Optional[str] = None,
+                  answers: int = 3):
+    columns = summary["columns"]
+    rows = range(len(columns["question_id"]))
+    if question:
+        rows = [i for i in rows if columns["question_id"][i] == question]
+        if not rows:
+            print(f"❌ No data for question '{question}'")
+            return
+    key = SORT_COLUMNS[sort]
+    rows = sorted(rows, key=lambda i: columns[key][i] or 0, reverse=True)
+
+    print(f"📊 {summary['sessions']} sessions, {len(columns['question_id'])} questions")
+    print()
+    print(f"{'question':<24} {'answers':>8} {'skipped':>8} {'clarify':>8} {'mean':>7} {'p50':>6} {'p90':>6}")
+    for i in rows:
+        histogram = columns["time_histogram"][i]
+        buckets = summary["time_buckets"]
+        print(f"{columns['question_id'][i]:<24} {columns['responses'][i]:>8} "
+              f"{columns['skip_rate'][i]:>8.0%} {columns['clarification_rate'][i]:>8.0%} "
+              f"{format_seconds(columns['mean_seconds'][i]):>7} "
+              f"{format_seconds(time_percentile(histogram, 0.5, buckets)):>6} "
+              f"{format_seconds(time_percentile(histogram, 0.9, buckets)):>6}")
+        for answer, count in columns["top_answers"][i][:answers]:
+            share = count / columns["responses"][i]
+            print(f"    {share:>4.0%}  {answer}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="inception.py analyze",
+        description="Aggregate recorded discovery sessions into per-question statistics"
+    )
+    parser.add_argument("paths", nargs="*", default=[str(SESSION_DIR)],
+                        help=f"Session logs or directories of them (default: {SESSION_DIR})")
+    parser.add_argument("--output", default=str(SUMMARY_FILE),
+                        help=f"Where to write the columnar summary (default: {SUMMARY_FILE})")
+    parser.add_argument("--from-summary", metavar="FILE",
+                        help="Re-query an existing summary instead of scanning logs")
+    parser.add_argument("--question", help="Only show this question id")
+    parser.add_argument("--sort", choices=sorted(SORT_COLUMNS), default="responses",
+                        help="Column to rank questions by (default: responses)")
+    parser.add_argument("--answers", type=int, default=3,
+                        help="Top answers to show per question (default: 3)")
+    args = parser.parse_args(argv)
+
+    if args.from_summary:
+        try:
+            summary = load_summary(Path(args.from_summary))
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read summary: {e}")
+            return 1
+    else:
+        missing = [p for p in args.paths if not Path(p).exists()]
+        if missing:
+            print(f"❌ No session logs at: {', '.join(missing)}")
+            return 1
+        started = time.perf_counter()
+        sessions, stats = aggregate(iter_responses(args.paths))
+        summary = build_summary(sessions, stats)
+        write_summary(summary, Path(args.output))
+        print(f"✅ Scanned {sessions} sessions in {time.perf_counter() - started:.2f}s → {args.output}")
+        print()
+
+    print_summary(summary, sort=args.sort, question=args.question, answers=args.answers)
+    return 0
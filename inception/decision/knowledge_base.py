@@ -0,0 +1,213 @@
+"""
+AI Project Inception - Technology Knowledge Base
+
+Stacks, capability scores, tool integrations, cost tiers and compatibility
+rules live in SQLite. knowledge_base.sql is compiled into knowledge.sqlite
+the first time it's needed (and again whenever the source changes), then
+the database is opened read-only. Nothing is loaded until the first query,
+and every query result is memoized, so inception startup doesn't pay for
+the size of the catalog.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+SOURCE_FILE = Path(__file__).with_name("knowledge_base.sql")
+DATABASE_FILE = Path(__file__).with_name("knowledge.sqlite")
+
+WORD = re.compile(r"[a-z0-9][a-z0-9.+#-]*")
+
+class KnowledgeBase:
+    """
+    Lazily compiled, read-only, memoized view of the knowledge base
+    """
+
+    def __init__(self, source: Path = SOURCE_FILE, database: Path = DATABASE_FILE):
+        self.source = Path(source)
+        self.database = Path(database)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._cache: Dict[Tuple, Any] = {}
+        self._lock = threading.RLock()
+
+    # --- Connection ---
+
+    def _source_hash(self) -> str:
+        return hashlib.sha256(self.source.read_bytes()).hexdigest()
+
+    def _compiled_hash(self) -> Optional[str]:
+        try:
+            connection = sqlite3.connect(f"file:{self.database}?mode=ro", uri=True)
+            try:
+                row = connection.execute("SELECT value FROM meta WHERE key = 'source_hash'").fetchone()
+            finally:
+                connection.close()
+            return row[0] if row else None
+        except sqlite3.Error:
+            return None
+
+    def _compile(self, source_hash: str) -> Optional[Path]:
+        """
+        Build the database next to the source; falls back to memory if that isn't writable
+        """
+        script = self.source.read_text(encoding="utf-8")
+        try:
+            fd, tmp = tempfile.mkstemp(prefix=".knowledge-", suffix=".sqlite", dir=self.database.parent)
+            os.close(fd)
+        except OSError:
+            return None
+        try:
+            connection = sqlite3.connect(tmp)
+            connection.executescript(script)
+            connection.execute("INSERT INTO meta VALUES ('source_hash', ?)", (source_hash,))
+            connection.commit()
+            connection.execute("ANALYZE")
+            connection.close()
+            # Atomic, so concurrent inception runs never see a half-built file
+            os.replace(tmp, self.database)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return self.database
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            with self._lock:
+                if self._connection is None:
+                    self._connection = self._open()
+        return self._connection
+
+    def _open(self) -> sqlite3.Connection:
+        source_hash = self._source_hash()
+        if self._compiled_hash() != source_hash and self._compile(source_hash) is None:
+            connection = sqlite3.connect(":memory:", check_same_thread=False)
+            connection.executescript(self.source.read_text(encoding="utf-8"))
+            return connection
+        connection = sqlite3.connect(f"file:{self.database}?mode=ro", uri=True, check_same_thread=False)
+        connection.execute("PRAGMA query_only = ON")
+        return connection
+
+    def _memoized(self, key: Tuple, query):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        with self._lock:
+            value = query(self.connection)
+        self._cache[key] = value
+        return value
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    # --- Queries ---
+
+    def stacks(self) -> List[Dict[str, Any]]:
+        """
+        Every stack as a selector catalog entry (with its capabilities)
+        """
+        def query(connection):
+            catalog = {}
+            for row in connection.execute(
+                "SELECT id, tech_stack, language, project_type, architecture, template, cost_tier "
+                "FROM stacks ORDER BY id"
+            ):
+                catalog[row[0]] = {
+                    "id": row[0], "tech_stack": row[1], "language": row[2], "project_type": row[3],
+                    "architecture": row[4], "template": row[5], "cost_tier": row[6], "capabilities": {}
+                }
+            for stack_id, criterion, score in connection.execute(
+                "SELECT stack_id, criterion, score FROM capabilities"
+            ):
+                catalog[stack_id]["capabilities"][criterion] = score
+            return list(catalog.values())
+        return self._memoized(("stacks",), query)
+
+    def resolve_tools(self, text: str) -> Tuple[str, ...]:
+        """
+        Canonical tool ids mentioned in a free-text answer (single words and word pairs)
+        """
+        words = WORD.findall(text.lower())
+        terms = sorted(set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])})
+        if not terms:
+            return ()
+
+        def query(connection):
+            placeholders = ",".join("?" * len(terms))
+            rows = connection.execute(
+                f"SELECT DISTINCT tool_id FROM tool_aliases WHERE alias IN ({placeholders}) ORDER BY tool_id",
+                terms
+            )
+            return tuple(row[0] for row in rows)
+        return self._memoized(("tools", tuple(terms)), query)
+
+    def tool_names(self, tool_ids: Iterable[str]) -> Dict[str, str]:
+        names = self._memoized(("tool_names",),
+                               lambda connection: dict(connection.execute("SELECT id, name FROM tools")))
+        return {tool_id: names[tool_id] for tool_id in tool_ids if tool_id in names}
+
+    def integration_scores(self, tool_ids: Tuple[str, ...]) -> Dict[str, Dict[str, float]]:
+        """
+        {stack_id: {tool_id: score}} for the given tools
+        """
+        if not tool_ids:
+            return {}
+
+        def query(connection):
+            placeholders = ",".join("?" * len(tool_ids))
+            scores: Dict[str, Dict[str, float]] = {}
+            for tool_id, stack_id, score in connection.execute(
+                f"SELECT tool_id, stack_id, score FROM integrations WHERE tool_id IN ({placeholders})",
+                tool_ids
+            ):
+                scores.setdefault(stack_id, {})[tool_id] = score
+            return scores
+        return self._memoized(("integrations", tool_ids), query)
+
+    def budget_tier(self, budget_option: str) -> Optional[int]:
+        """
+        Highest cost tier a discovery budget answer allows (None = unknown answer)
+        """
+        tiers = self._memoized(("budget_tiers",), lambda connection: dict(connection.execute(
+            "SELECT budget_option, tier FROM cost_tiers WHERE budget_option IS NOT NULL"
+        )))
+        return tiers.get(budget_option)
+
+    def cost_tier_names(self) -> Dict[int, str]:
+        return self._memoized(("cost_tier_names",), lambda connection: dict(connection.execute(
+            "SELECT tier, name FROM cost_tiers"
+        )))
+
+    def compatibility(self, subjects: Tuple[str, ...]) -> List[Tuple[str, str, float, str]]:
+        """
+        (subject, stack_id, effect, note) rules triggered by the given answer subjects
+        """
+        if not subjects:
+            return []
+
+        def query(connection):
+            placeholders = ",".join("?" * len(subjects))
+            return connection.execute(
+                f"SELECT subject, stack_id, effect, note FROM compatibility WHERE subject IN ({placeholders})",
+                subjects
+            ).fetchall()
+        return self._memoized(("compatibility", subjects), query)
+
+_default: Optional[KnowledgeBase] = None
+
+def default_knowledge_base() -> KnowledgeBase:
+    """
+    Shared instance; creating it is free, the database opens on first query
+    """
+    global _default
+    if _default is None:
+        _default = KnowledgeBase()
+    return _default
@@ -0,0 +1,223 @@
+-- Technology knowledge base source
+--
+-- Compiled into knowledge.sqlite on first use (and whenever this file
+-- changes) by knowledge_base.py, then opened read-only. Add stacks, tools
+-- and rules here; the selector never scans this data in Python.
+
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE cost_tiers (
+    tier INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    monthly_min INTEGER NOT NULL,
+    monthly_max INTEGER,           -- NULL = no ceiling
+    budget_option TEXT UNIQUE      -- discovery "budget" answer this tier is the ceiling for
+);
+
+CREATE TABLE stacks (
+    id TEXT PRIMARY KEY,
+    tech_stack TEXT NOT NULL,
+    language TEXT NOT NULL,
+    project_type TEXT NOT NULL,
+    architecture TEXT NOT NULL,
+    template TEXT,
+    cost_tier INTEGER NOT NULL REFERENCES cost_tiers(tier)
+) WITHOUT ROWID;
+CREATE INDEX idx_stacks_project_type ON stacks(project_type);
+CREATE INDEX idx_stacks_language ON stacks(language);
+
+-- Capability score (0-1) per selector criterion; missing rows mean 0
+CREATE TABLE capabilities (
+    stack_id TEXT NOT NULL REFERENCES stacks(id),
+    criterion TEXT NOT NULL,
+    score REAL NOT NULL,
+    PRIMARY KEY (stack_id, criterion)
+) WITHOUT ROWID;
+
+-- Canonical tools and the spellings people use for them in free text
+CREATE TABLE tools (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE tool_aliases (
+    alias TEXT PRIMARY KEY,        -- lower case, one or two words
+    tool_id TEXT NOT NULL REFERENCES tools(id)
+) WITHOUT ROWID;
+
+-- How well a stack integrates with a tool (0-1)
+CREATE TABLE integrations (
+    tool_id TEXT NOT NULL REFERENCES tools(id),
+    stack_id TEXT NOT NULL REFERENCES stacks(id),
+    support TEXT NOT NULL CHECK (support IN ('native', 'sdk', 'webhook')),
+    score REAL NOT NULL,
+    PRIMARY KEY (tool_id, stack_id)
+) WITHOUT ROWID;
+CREATE INDEX idx_integrations_stack ON integrations(stack_id);
+
+-- Score adjustments that apply when a discovery answer matches
+-- (subject is "<question_id>=<option text>")
+CREATE TABLE compatibility (
+    subject TEXT NOT NULL,
+    stack_id TEXT NOT NULL REFERENCES stacks(id),
+    effect REAL NOT NULL,          -- added to the score; large negative = incompatible
+    note TEXT NOT NULL,
+    PRIMARY KEY (subject, stack_id)
+) WITHOUT ROWID;
+CREATE INDEX idx_compatibility_stack ON compatibility(stack_id);
+
+INSERT INTO cost_tiers VALUES
+    (0, 'Free / open source', 0, 0, 'Minimal cost (free/open source)'),
+    (1, 'Small', 10, 100, 'Small budget ($10-100/month)'),
+    (2, 'Medium', 100, 500, 'Medium budget ($100-500/month)'),
+    (3, 'Flexible', 500, NULL, 'Flexible budget');
+
+INSERT INTO stacks VALUES
+    ('python-flask-web', 'Python + Flask', 'python', 'web_app', 'monolith', 'python_web', 0),
+    ('python-django-web', 'Python + Django', 'python', 'web_app', 'monolith', 'python_web', 0),
+    ('python-fastapi-api', 'Python + FastAPI', 'python', 'api_service', 'monolith', 'python_web', 0),
+    ('python-click-cli', 'Python + Click', 'python', 'cli_tool', 'single_module', 'python_cli', 0),
+    ('python-pandas-pipeline', 'Python + pandas', 'python', 'data_pipeline', 'pipeline', 'data_pipeline', 0),
+    ('python-slack-bot', 'Python + Slack Bolt', 'python', 'chat_bot', 'event_driven', 'python_web', 0),
+    ('nodejs-express-web', 'Node.js + Express', 'javascript', 'web_app', 'monolith', 'nodejs_web', 0),
+    ('nodejs-react-fullstack', 'Node.js + React', 'javascript', 'web_app', 'spa_with_api', 'nodejs_web', 1),
+    ('react-native-mobile', 'React Native', 'javascript', 'mobile_app', 'client_with_api', 'nodejs_web', 2),
+    ('electron-desktop', 'Electron', 'javascript', 'desktop_app', 'monolith', 'nodejs_web', 0),
+    ('go-microservices', 'Go + gRPC', 'go', 'api_service', 'microservices', NULL, 2),
+    ('python-serverless-api', 'Python + AWS Lambda', 'python', 'api_service', 'serverless', NULL, 1);
+
+INSERT INTO capabilities VALUES
+    ('python-flask-web', 'fast_delivery', 0.8), ('python-flask-web', 'low_cost', 0.9),
+    ('python-flask-web', 'scalability', 0.5), ('python-flask-web', 'beginner_friendly', 0.8),
+    ('python-flask-web', 'expert_power', 0.5), ('python-flask-web', 'local_deploy', 0.9),
+    ('python-flask-web', 'cloud_deploy', 0.8), ('python-flask-web', 'web_ui', 0.9),
+    ('python-flask-web', 'api', 0.7),
+
+    ('python-django-web', 'fast_delivery', 0.6), ('python-django-web', 'low_cost', 0.8),
+    ('python-django-web', 'scalability', 0.7), ('python-django-web', 'beginner_friendly', 0.5),
+    ('python-django-web', 'expert_power', 0.8), ('python-django-web', 'local_deploy', 0.8),
+    ('python-django-web', 'cloud_deploy', 0.8), ('python-django-web', 'web_ui', 1.0),
+    ('python-django-web', 'api', 0.6),
+
+    ('python-fastapi-api', 'fast_delivery', 0.7), ('python-fastapi-api', 'low_cost', 0.9),
+    ('python-fastapi-api', 'scalability', 0.7), ('python-fastapi-api', 'beginner_friendly', 0.6),
+    ('python-fastapi-api', 'expert_power', 0.7), ('python-fastapi-api', 'local_deploy', 0.8),
+    ('python-fastapi-api', 'cloud_deploy', 0.9), ('python-fastapi-api', 'web_ui', 0.2),
+    ('python-fastapi-api', 'api', 1.0),
+
+    ('python-click-cli', 'fast_delivery', 1.0), ('python-click-cli', 'low_cost', 1.0),
+    ('python-click-cli', 'scalability', 0.2), ('python-click-cli', 'beginner_friendly', 0.8),
+    ('python-click-cli', 'expert_power', 0.5), ('python-click-cli', 'local_deploy', 1.0),
+    ('python-click-cli', 'cloud_deploy', 0.2), ('python-click-cli', 'cli', 1.0),
+
+    ('python-pandas-pipeline', 'fast_delivery', 0.7), ('python-pandas-pipeline', 'low_cost', 0.9),
+    ('python-pandas-pipeline', 'scalability', 0.4), ('python-pandas-pipeline', 'beginner_friendly', 0.6),
+    ('python-pandas-pipeline', 'expert_power', 0.7), ('python-pandas-pipeline', 'local_deploy', 0.9),
+    ('python-pandas-pipeline', 'cloud_deploy', 0.5), ('python-pandas-pipeline', 'cli', 0.8),
+    ('python-pandas-pipeline', 'api', 0.2),
+
+    ('python-slack-bot', 'fast_delivery', 0.8), ('python-slack-bot', 'low_cost', 0.8),
+    ('python-slack-bot', 'scalability', 0.4), ('python-slack-bot', 'beginner_friendly', 0.7),
+    ('python-slack-bot', 'expert_power', 0.4), ('python-slack-bot', 'local_deploy', 0.5),
+    ('python-slack-bot', 'cloud_deploy', 0.8), ('python-slack-bot', 'web_ui', 0.2),
+    ('python-slack-bot', 'api', 0.8),
+
+    ('nodejs-express-web', 'fast_delivery', 0.8), ('nodejs-express-web', 'low_cost', 0.9),
+    ('nodejs-express-web', 'scalability', 0.6), ('nodejs-express-web', 'beginner_friendly', 0.7),
+    ('nodejs-express-web', 'expert_power', 0.6), ('nodejs-express-web', 'local_deploy', 0.8),
+    ('nodejs-express-web', 'cloud_deploy', 0.9), ('nodejs-express-web', 'web_ui', 0.8),
+    ('nodejs-express-web', 'api', 0.9),
+
+    ('nodejs-react-fullstack', 'fast_delivery', 0.5), ('nodejs-react-fullstack', 'low_cost', 0.7),
+    ('nodejs-react-fullstack', 'scalability', 0.8), ('nodejs-react-fullstack', 'beginner_friendly', 0.4),
+    ('nodejs-react-fullstack', 'expert_power', 0.9), ('nodejs-react-fullstack', 'local_deploy', 0.6),
+    ('nodejs-react-fullstack', 'cloud_deploy', 0.9), ('nodejs-react-fullstack', 'web_ui', 1.0),
+    ('nodejs-react-fullstack', 'mobile', 0.3), ('nodejs-react-fullstack', 'api', 0.8),
+
+    ('react-native-mobile', 'fast_delivery', 0.4), ('react-native-mobile', 'low_cost', 0.6),
+    ('react-native-mobile', 'scalability', 0.7), ('react-native-mobile', 'beginner_friendly', 0.3),
+    ('react-native-mobile', 'expert_power', 0.8), ('react-native-mobile', 'cloud_deploy', 0.7),
+    ('react-native-mobile', 'mobile', 1.0), ('react-native-mobile', 'api', 0.5),
+
+    ('electron-desktop', 'fast_delivery', 0.5), ('electron-desktop', 'low_cost', 0.8),
+    ('electron-desktop', 'scalability', 0.2), ('electron-desktop', 'beginner_friendly', 0.5),
+    ('electron-desktop', 'expert_power', 0.6), ('electron-desktop', 'local_deploy', 1.0),
+    ('electron-desktop', 'desktop', 1.0), ('electron-desktop', 'web_ui', 0.3),
+
+    ('go-microservices', 'fast_delivery', 0.2), ('go-microservices', 'low_cost', 0.6),
+    ('go-microservices', 'scalability', 1.0), ('go-microservices', 'beginner_friendly', 0.2),
+    ('go-microservices', 'expert_power', 1.0), ('go-microservices', 'local_deploy', 0.6),
+    ('go-microservices', 'cloud_deploy', 1.0), ('go-microservices', 'api', 1.0),
+
+    ('python-serverless-api', 'fast_delivery', 0.6), ('python-serverless-api', 'low_cost', 0.7),
+    ('python-serverless-api', 'scalability', 0.9), ('python-serverless-api', 'beginner_friendly', 0.4),
+    ('python-serverless-api', 'expert_power', 0.6), ('python-serverless-api', 'cloud_deploy', 1.0),
+    ('python-serverless-api', 'api', 0.9);
+
+INSERT INTO tools VALUES
+    ('slack', 'Slack'), ('github', 'GitHub'), ('jira', 'Jira'), ('aws', 'AWS'),
+    ('gcp', 'Google Cloud'), ('azure', 'Azure'), ('google_workspace', 'Google Workspace'),
+    ('postgres', 'PostgreSQL'), ('mysql', 'MySQL'), ('salesforce', 'Salesforce'),
+    ('stripe', 'Stripe'), ('teams', 'Microsoft Teams'), ('discord', 'Discord'),
+    ('notion', 'Notion'), ('trello', 'Trello'), ('excel', 'Excel');
+
+INSERT INTO tool_aliases VALUES
+    ('slack', 'slack'), ('github', 'github'), ('gh', 'github'), ('jira', 'jira'),
+    ('atlassian', 'jira'), ('aws', 'aws'), ('amazon', 'aws'), ('lambda', 'aws'),
+    ('gcp', 'gcp'), ('google cloud', 'gcp'), ('azure', 'azure'),
+    ('google workspace', 'google_workspace'), ('gsuite', 'google_workspace'),
+    ('g suite', 'google_workspace'), ('google sheets', 'google_workspace'),
+    ('gmail', 'google_workspace'), ('postgres', 'postgres'), ('postgresql', 'postgres'),
+    ('mysql', 'mysql'), ('salesforce', 'salesforce'), ('stripe', 'stripe'),
+    ('teams', 'teams'), ('microsoft teams', 'teams'), ('discord', 'discord'),
+    ('notion', 'notion'), ('trello', 'trello'), ('excel', 'excel'),
+    ('spreadsheets', 'excel'), ('csv', 'excel');
+
+-- Every Python and JavaScript stack has maintained SDKs for every tool...
+INSERT INTO integrations (tool_id, stack_id, support, score)
+    SELECT tools.id, stacks.id, 'sdk', 0.5
+    FROM tools CROSS JOIN stacks
+    WHERE stacks.language IN ('python', 'javascript');
+
+-- ...and some are a particularly good fit
+INSERT OR REPLACE INTO integrations VALUES
+    ('slack', 'python-slack-bot', 'native', 1.0),
+    ('teams', 'python-slack-bot', 'webhook', 0.6),
+    ('discord', 'python-slack-bot', 'webhook', 0.6),
+    ('github', 'python-slack-bot', 'webhook', 0.7),
+    ('jira', 'python-slack-bot', 'webhook', 0.7),
+    ('excel', 'python-pandas-pipeline', 'native', 1.0),
+    ('google_workspace', 'python-pandas-pipeline', 'sdk', 0.8),
+    ('postgres', 'python-pandas-pipeline', 'native', 0.9),
+    ('mysql', 'python-pandas-pipeline', 'native', 0.9),
+    ('postgres', 'python-django-web', 'native', 0.9),
+    ('mysql', 'python-django-web', 'native', 0.9),
+    ('aws', 'python-serverless-api', 'native', 1.0),
+    ('stripe', 'nodejs-express-web', 'sdk', 0.8),
+    ('stripe', 'nodejs-react-fullstack', 'sdk', 0.8),
+    ('github', 'python-click-cli', 'sdk', 0.7),
+    ('aws', 'go-microservices', 'sdk', 0.7),
+    ('gcp', 'go-microservices', 'sdk', 0.8),
+    ('azure', 'go-microservices', 'sdk', 0.6),
+    ('postgres', 'go-microservices', 'sdk', 0.7);
+
+INSERT INTO compatibility VALUES
+    ('deployment_preference=Local/On-premise', 'python-serverless-api', -100,
+     'AWS Lambda cannot run on-premise'),
+    ('deployment_preference=Local/On-premise', 'react-native-mobile', -1.0,
+     'Mobile apps still need app store distribution'),
+    ('technical_comfort=Beginner', 'go-microservices', -2.0,
+     'Microservices carry heavy operational overhead for new teams'),
+    ('technical_comfort=Beginner', 'react-native-mobile', -1.0,
+     'Native build tooling is hard to set up'),
+    ('timeline=This week', 'go-microservices', -2.0,
+     'Service boundaries, RPC contracts and deployment take weeks'),
+    ('timeline=This week', 'react-native-mobile', -1.0,
+     'App store review alone can take days'),
+    ('scalability=Just my team (1-20)', 'go-microservices', -1.0,
+     'Microservices are overkill for a team-sized user base'),
+    ('access_patterns=Command line', 'python-click-cli', 0.5,
+     'Purpose-built for command-line tools');
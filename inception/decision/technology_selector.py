@@ -0,0 +1,333 @@
+"""
+AI Project Inception - Technology Selector
+
+Chooses a technology stack and architecture from discovered requirements.
+Candidates and requirements share one set of criteria: every candidate is
+a row of capability scores, every requirement set is a vector of criterion
+weights. Ranking is a single matrix-vector product followed by a top-k
+partition, and batches of requirement sets are scored with one
+matrix-matrix product.
+
+The catalog, tool integrations, cost tiers and compatibility rules come
+from the SQLite knowledge base (knowledge_base.py), which is only opened
+when the first recommendation is made.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+from decision.knowledge_base import KnowledgeBase, default_knowledge_base
+
+CRITERIA = [
+    "fast_delivery",
+    "low_cost",
+    "scalability",
+    "beginner_friendly",
+    "expert_power",
+    "local_deploy",
+    "cloud_deploy",
+    "web_ui",
+    "mobile",
+    "cli",
+    "desktop",
+    "api",
+]
+
+CRITERION_LABELS = {
+    "fast_delivery": "quick to get working",
+    "low_cost": "cheap to run",
+    "scalability": "scales with your user base",
+    "beginner_friendly": "approachable for your team",
+    "expert_power": "room for advanced customisation",
+    "local_deploy": "runs on your own machines",
+    "cloud_deploy": "deploys easily to the cloud",
+    "web_ui": "works in a web browser",
+    "mobile": "reaches mobile users",
+    "cli": "fits a command-line workflow",
+    "desktop": "ships as a desktop app",
+    "api": "integrates through an API",
+}
+
+# Discovery answer -> criterion weights. Each entry is
+# (option text, extra keywords for free-text answers, weights).
+ANSWER_WEIGHTS = {
+    "timeline": [
+        ("This week", ("asap", "days", "urgent"), {"fast_delivery": 1.0}),
+        ("Within 2 weeks", ("two weeks", "2 weeks"), {"fast_delivery": 0.7}),
+        ("Within a month", ("month",), {"fast_delivery": 0.4}),
+        ("2-3 months", ("months", "quarter"), {"fast_delivery": 0.1, "scalability": 0.2}),
+        ("No rush", ("no deadline", "whenever"), {"scalability": 0.3, "expert_power": 0.1}),
+    ],
+    "budget": [
+        ("Minimal cost (free/open source)", ("free", "open source", "no budget", "minimal"), {"low_cost": 1.0}),
+        ("Small budget ($10-100/month)", ("small",), {"low_cost": 0.6}),
+        ("Medium budget ($100-500/month)", ("medium",), {"low_cost": 0.3, "scalability": 0.2}),
+        ("Flexible budget", ("flexible", "large", "enterprise"), {"scalability": 0.3}),
+    ],
+    "scalability": [
+        ("Just my team (1-20)", ("my team", "just me", "small team"), {"fast_delivery": 0.2}),
+        ("Department (20-100)", ("department",), {"scalability": 0.3}),
+        ("Company (100-1000)", ("company", "organisation", "organization"), {"scalability": 0.7}),
+        ("Public/Many users (1000+)", ("public", "many users", "thousands", "millions"), {"scalability": 1.0}),
+    ],
+    "technical_comfort": [
+        ("Beginner", ("new to", "non-technical", "novice"), {"beginner_friendly": 1.0}),
+        ("Intermediate", ("some experience", "moderate"), {"beginner_friendly": 0.5, "expert_power": 0.2}),
+        ("Advanced", ("experienced", "senior"), {"expert_power": 0.6}),
+        ("Expert", ("expert",), {"expert_power": 1.0}),
+    ],
+    "deployment_preference": [
+        ("Local/On-premise", ("local", "on-prem", "on prem", "self-host"), {"local_deploy": 1.0}),
+        ("Cloud (AWS/GCP/Azure)", ("cloud", "aws", "gcp", "azure"), {"cloud_deploy": 1.0}),
+        ("No preference", ("no preference", "either"), {}),
+        ("Don't know", ("don't know", "not sure", "unsure"), {"beginner_friendly": 0.3}),
+    ],
+    "access_patterns": [
+        ("Web browser", ("web", "browser", "website"), {"web_ui": 1.5}),
+        ("Mobile app", ("mobile", "phone", "ios", "android"), {"mobile": 1.5}),
+        ("Command line", ("command line", "cli", "terminal"), {"cli": 1.5}),
+        ("Desktop app", ("desktop",), {"desktop": 1.5}),
+        ("API/Integration", ("api", "integration", "webhook"), {"api": 1.5}),
+        ("Multiple ways", ("multiple", "several", "both"), {"web_ui": 0.8, "api": 0.8, "mobile": 0.4}),
+    ],
+}
+
+# How much tool integrations, budget overruns and compatibility rules from
+# the knowledge base move a candidate's score
+INTEGRATION_WEIGHT = 1.0
+COST_TIER_PENALTY = 1.0
+INCOMPATIBLE = -50.0
+
+class TechnologySelector:
+    """
+    Ranks technology candidates against discovered requirements
+    """
+
+    def __init__(self, catalog: Optional[List[Dict[str, Any]]] = None,
+                 knowledge_base: Optional[KnowledgeBase] = None):
+        # An explicit catalog is scored on capabilities alone unless a knowledge base is given too
+        self.knowledge_base = knowledge_base or (default_knowledge_base() if catalog is None else None)
+        self._catalog = catalog
+        self._row_index: Optional[Dict[str, int]] = None
+        self.criterion_index = {name: i for i, name in enumerate(CRITERIA)}
+        self._matrix: Optional[np.ndarray] = None
+        self._cost_tiers: Optional[np.ndarray] = None
+
+    @property
+    def catalog(self) -> List[Dict[str, Any]]:
+        if self._catalog is None:
+            self._catalog = self.knowledge_base.stacks()
+        return self._catalog
+
+    @property
+    def row_index(self) -> Dict[str, int]:
+        if self._row_index is None:
+            self._row_index = {candidate["id"]: row for row, candidate in enumerate(self.catalog)}
+        return self._row_index
+
+    @property
+    def cost_tiers(self) -> np.ndarray:
+        if self._cost_tiers is None:
+            self._cost_tiers = np.array([candidate.get("cost_tier", 0) for candidate in self.catalog])
+        return self._cost_tiers
+
+    @property
+    def candidate_matrix(self) -> np.ndarray:
+        """
+        Candidates x criteria capability matrix, built once on first use
+        """
+        if self._matrix is None:
+            matrix = np.zeros((len(self.catalog), len(CRITERIA)))
+            for row, candidate in enumerate(self.catalog):
+                for criterion, score in candidate["capabilities"].items():
+                    matrix[row, self.criterion_index[criterion]] = score
+            self._matrix = matrix
+        return self._matrix
+
+    def _matched_options(self, requirements: Dict[str, Any]) -> List[Tuple[str, str, Dict[str, float]]]:
+        """
+        (question_id, option, weights) for every answer that maps onto an option
+        """
+        matched = []
+        for question_id, options in ANSWER_WEIGHTS.items():
+            answer = requirements.get(question_id)
+            if answer:
+                option = self._match_option(str(answer), options)
+                if option:
+                    matched.append((question_id, option[0], option[2]))
+        return matched
+
+    def requirement_vector(self, requirements: Dict[str, Any]) -> np.ndarray:
+        """
+        Map discovery answers onto criterion weights
+        """
+        weights = np.zeros(len(CRITERIA))
+        for _, _, option_weights in self._matched_options(requirements):
+            for criterion, weight in option_weights.items():
+                weights[self.criterion_index[criterion]] += weight
+        return weights
+
+    def _match_option(self, answer: str, options: List[Tuple]) -> Optional[Tuple]:
+        """
+        Exact option text first, then keywords for free-text answers
+        """
+        text = answer.strip().lower()
+        for option in options:
+            if text == option[0].lower():
+                return option
+        for option in options:
+            if any(keyword in text for keyword in option[1]):
+                return option
+        return None
+
+    def _subjects(self, matched: List[Tuple[str, str, Dict[str, float]]]) -> Tuple[str, ...]:
+        """
+        Compatibility rule subjects ("question_id=option") for matched answers
+        """
+        return tuple(sorted(f"{question_id}={option}" for question_id, option, _ in matched))
+
+    def mentioned_tools(self, requirements: Dict[str, Any]) -> Tuple[str, ...]:
+        """
+        Tools named in the existing_tools / integration_needs answers
+        """
+        if self.knowledge_base is None:
+            return ()
+        text = " ".join(str(requirements.get(key) or "") for key in ("existing_tools", "integration_needs"))
+        return self.knowledge_base.resolve_tools(text)
+
+    def adjustment_vector(self, requirements: Dict[str, Any]) -> np.ndarray:
+        """
+        Per-candidate score adjustments from the knowledge base: integration
+        support for the team's tools, cost tiers above the budget, and
+        compatibility rules triggered by the answers
+        """
+        adjustments = np.zeros(len(self.catalog))
+        if self.knowledge_base is None:
+            return adjustments
+        kb = self.knowledge_base
+        rows = self.row_index
+
+        tools = self.mentioned_tools(requirements)
+        for stack_id, scores in kb.integration_scores(tools).items():
+            if stack_id in rows:
+                adjustments[rows[stack_id]] += INTEGRATION_WEIGHT * sum(scores.values()) / len(tools)
+
+        matched = self._matched_options(requirements)
+        for question_id, option, _ in matched:
+            if question_id == "budget":
+                ceiling = kb.budget_tier(option)
+                if ceiling is not None:
+                    adjustments -= COST_TIER_PENALTY * np.maximum(self.cost_tiers - ceiling, 0)
+
+        subjects = self._subjects(matched)
+        for _, stack_id, effect, _ in kb.compatibility(subjects):
+            if stack_id in rows:
+                adjustments[rows[stack_id]] += max(effect, INCOMPATIBLE)
+        return adjustments
+
+    def rank(self, requirements: Dict[str, Any], k: int = 3) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Top-k candidates for one requirement set, best first
+        """
+        scores = self.candidate_matrix @ self.requirement_vector(requirements) + self.adjustment_vector(requirements)
+        top = self._top_k(scores, k)
+        return [(self.catalog[i], float(scores[i])) for i in top]
+
+    def rank_batch(self, requirement_sets: List[Dict[str, Any]], k: int = 3) -> List[List[Tuple[Dict[str, Any], float]]]:
+        """
+        Top-k candidates for many requirement sets with one matrix product
+        """
+        if not requirement_sets:
+            return []
+        weights = np.vstack([self.requirement_vector(requirements) for requirements in requirement_sets])
+        scores = weights @ self.candidate_matrix.T
+        if self.knowledge_base is not None:
+            scores += np.vstack([self.adjustment_vector(requirements) for requirements in requirement_sets])
+        top = self._top_k(scores, k)
+        ranked_scores = np.take_along_axis(scores, top, axis=1)
+        return [
+            [(self.catalog[i], float(score)) for i, score in zip(row, row_scores)]
+            for row, row_scores in zip(top, ranked_scores)
+        ]
+
+    def _top_k(self, scores: np.ndarray, k: int) -> np.ndarray:
+        """
+        Indices of the k highest scores along the last axis, best first
+        """
+        n = scores.shape[-1]
+        k = min(k, n)
+        if k < n:
+            top = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+        else:
+            top = np.broadcast_to(np.arange(n), scores.shape).copy()
+        order = np.argsort(-np.take_along_axis(scores, top, axis=-1), axis=-1, kind="stable")
+        return np.take_along_axis(top, order, axis=-1)
+
+    def explain(self, candidate: Dict[str, Any], requirements: Dict[str, Any], limit: int = 3) -> List[str]:
+        """
+        The criteria that contributed most to a candidate's score, plus
+        integrations and rules from the knowledge base
+        """
+        row = self.candidate_matrix[self.row_index[candidate["id"]]]
+        contributions = row * self.requirement_vector(requirements)
+        strongest = np.argsort(-contributions)[:limit]
+        reasons = [CRITERION_LABELS[CRITERIA[i]] for i in strongest if contributions[i] > 0]
+        if self.knowledge_base is None:
+            return reasons
+
+        tools = self.mentioned_tools(requirements)
+        supported = self.knowledge_base.integration_scores(tools).get(candidate["id"], {})
+        names = self.knowledge_base.tool_names(tool for tool, score in supported.items() if score > 0)
+        if names:
+            reasons.append(f"works with {', '.join(sorted(names.values()))}")
+
+        subjects = self._subjects(self._matched_options(requirements))
+        reasons.extend(note for _, stack_id, effect, note in self.knowledge_base.compatibility(subjects)
+                       if stack_id == candidate["id"] and effect > 0)
+        return reasons
+
+    def caveats(self, candidate: Dict[str, Any], requirements: Dict[str, Any]) -> List[str]:
+        """
+        Knowledge base rules that count against a candidate
+        """
+        if self.knowledge_base is None:
+            return []
+        subjects = self._subjects(self._matched_options(requirements))
+        return [note for _, stack_id, effect, note in self.knowledge_base.compatibility(subjects)
+                if stack_id == candidate["id"] and effect < 0]
+
+    def analyze_and_recommend(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Recommend a stack with 2 alternatives and the reasoning behind it
+        """
+        ranked = self.rank(requirements, k=3)
+        best, score = ranked[0]
+        rationale = self.explain(best, requirements)
+
+        print(f"🏆 Recommended: {best['tech_stack']} ({best['project_type'].replace('_', ' ')}, "
+              f"{best['architecture'].replace('_', ' ')})")
+        if rationale:
+            print(f"   Why: {', '.join(rationale)}")
+        caveats = self.caveats(best, requirements)
+        if caveats:
+            print(f"   Watch out: {'; '.join(caveats)}")
+        if len(ranked) > 1:
+            print("   Alternatives:")
+            for candidate, alternative_score in ranked[1:]:
+                print(f"   • {candidate['tech_stack']} (score {alternative_score:.2f} vs {score:.2f})")
+
+        return {
+            "candidate_id": best["id"],
+            "tech_stack": best["tech_stack"],
+            "project_type": best["project_type"],
+            "architecture": best["architecture"],
+            "template": best["template"],
+            "score": score,
+            "rationale": rationale,
+            "caveats": caveats,
+            "alternatives": [
+                {"candidate_id": candidate["id"], "tech_stack": candidate["tech_stack"], "score": alternative_score}
+                for candidate, alternative_score in ranked[1:]
+            ]
+        }
@@ -6,10 +6,16 @@ Adapts questioning based on user responses and project complexity.
 """
 
 import json
+import time
+from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from discovery.question_library import LIBRARY_DIR, evaluate_condition, shared_loader
+from discovery.session_log import SESSION_DIR, write_session_log
+from events.event_bus import EventBus
+
 class ConversationStyle(Enum):
     SINGLE = "single"  # One question at a time
     LIST = "list"      # Multiple questions at once
@@ -23,15 +29,21 @@ class UserResponse:
     answer: str
     confidence: float = 1.0  # How confident we are in understanding the answer
     needs_clarification: bool = False
+    category: str = ""
+    seconds: float = 0.0  # Time the user spent answering
+    skipped: bool = False
 
 class ConversationEngine:
     """
     Manages the requirements discovery conversation process
     """
     
-    def __init__(self, style: str = "adaptive"):
+    def __init__(self, style: str = "adaptive", library_dir: Path = LIBRARY_DIR,
+                 events: Optional[EventBus] = None):
         self.style = ConversationStyle(style) if style != "ask_user" else None
+        self.events = events or EventBus()
         self.conversation_history: List[UserResponse] = []
+        self.skipped_responses: List[UserResponse] = []
         self.requirements: Dict[str, Any] = {
             "project_goal": "",
             "user_context": {},
@@ -41,124 +53,28 @@ class ConversationEngine:
         }
         
         # Question libraries for different discovery areas
+        self.library_loader = shared_loader(library_dir)
         self.question_libraries = self._load_question_libraries()
+        self.asked_categories: List[str] = []
+        self.pending_follow_ups: List[str] = []
     
     def _load_question_libraries(self) -> Dict[str, List[Dict]]:
         """
-        Load structured question libraries for different discovery areas
-        """
-        return {
-            "initial": [
-                {
-                    "id": "project_goal",
-                    "question": "What problem are you trying to solve or what do you want to build?",
-                    "type": "open_text",
-                    "required": True,
-                    "follow_up": True
-                }
-            ],
-            "user_context": [
-                {
-                    "id": "team_size",
-                    "question": "How many people are on your team?",
-                    "type": "number",
-                    "range": [1, 1000],
-                    "follow_up_triggers": {
-                        "1": ["solo_developer_questions"],
-                        ">10": ["large_team_questions"]
-                    }
-                },
-                {
-                    "id": "team_roles",
-                    "question": "What roles do people on your team have? (e.g., engineers, designers, PMs, etc.)",
-                    "type": "open_text",
-                    "condition": lambda ctx: ctx.get("team_size", 1) > 1
-                },
-                {
-                    "id": "technical_comfort",
-                    "question": "How would you rate your team's technical comfort level?",
-                    "type": "choice",
-                    "options": ["Beginner", "Intermediate", "Advanced", "Expert"],
-                    "required": True
-                },
-                {
-                    "id": "end_users",
-                    "question": "Who are the end users of this solution? (team members, customers, public, etc.)",
-                    "type": "open_text",
-                    "required": True
-                }
-            ],
-            "technical_context": [
-                {
-                    "id": "existing_tools",
-                    "question": "What tools and systems does your team currently use?",
-                    "type": "open_text",
-                    "examples": ["Slack, Jira, GitHub, AWS, Google Workspace, etc."]
-                },
-                {
-                    "id": "integration_needs",
-                    "question": "Does this need to integrate with any existing systems?",
-                    "type": "open_text",
-                    "follow_up": True
-                },
-                {
-                    "id": "deployment_preference",
-                    "question": "Where would you prefer to run this?",
-                    "type": "choice",
-                    "options": ["Local/On-premise", "Cloud (AWS/GCP/Azure)", "No preference", "Don't know"]
-                },
-                {
-                    "id": "access_patterns",
-                    "question": "How will people access this solution?",
-                    "type": "choice",
-                    "options": ["Web browser", "Mobile app", "Command line", "Desktop app", "API/Integration", "Multiple ways"]
-                }
-            ],
-            "constraints": [
-                {
-                    "id": "timeline",
-                    "question": "What's your timeline for getting this working?",
-                    "type": "choice",
-                    "options": ["This week", "Within 2 weeks", "Within a month", "2-3 months", "No rush"]
-                },
-                {
-                    "id": "budget",
-                    "question": "What's your budget situation?",
-                    "type": "choice",
-                    "options": ["Minimal cost (free/open source)", "Small budget ($10-100/month)", "Medium budget ($100-500/month)", "Flexible budget"]
-                },
-                {
-                    "id": "maintenance",
-                    "question": "Who will maintain this solution long-term?",
-                    "type": "open_text"
-                },
-                {
-                    "id": "scalability",
-                    "question": "How many users do you expect this to serve?",
-                    "type": "choice",
-                    "options": ["Just my team (1-20)", "Department (20-100)", "Company (100-1000)", "Public/Many users (1000+)"]
-                }
-            ],
-            "success_criteria": [
-                {
-                    "id": "success_definition",
-                    "question": "How will you know this project is successful?",
-                    "type": "open_text",
-                    "required": True
-                },
-                {
-                    "id": "must_have_features",
-                    "question": "What features are absolutely essential for the first version?",
-                    "type": "open_text",
-                    "required": True
-                },
-                {
-                    "id": "nice_to_have",
-                    "question": "What features would be nice to have but aren't critical?",
-                    "type": "open_text"
-                }
-            ]
-        }
+        Load the question libraries every session needs; domain and
+        follow-up libraries are loaded later, only if routing asks for them
+        """
+        libraries: Dict[str, List[Dict]] = {}
+        for name in self.library_loader.always():
+            libraries.update(self.library_loader.load(name))
+        return libraries
+    
+    def _load_library(self, name: str) -> List[str]:
+        """
+        Load a library on demand and return the categories it adds
+        """
+        categories = self.library_loader.load(name)
+        self.question_libraries.update(categories)
+        return list(categories)
     
     def conduct_discovery_interview(self) -> Dict[str, Any]:
         """
@@ -175,6 +91,7 @@ class ConversationEngine:
         
         # Conduct the interview by category
         self._ask_category("initial", "First, let's understand your goal:")
+        self._ask_pending_follow_ups()
         
         # Analyze initial response to determine follow-up focus
         project_goal = self.requirements.get("project_goal", "")
@@ -184,6 +101,7 @@ class ConversationEngine:
         for category in follow_up_categories:
             category_title = category.replace("_", " ").title()
             self._ask_category(category, f"\nNow, let's talk about {category_title.lower()}:")
+            self._ask_pending_follow_ups()
         
         # Final clarification round
         self._clarification_round()
@@ -226,6 +144,7 @@ class ConversationEngine:
         Ask questions from a specific category
         """
         print(intro)
+        self.asked_categories.append(category)
         questions = self.question_libraries.get(category, [])
         
         if self.style == ConversationStyle.LIST:
@@ -239,8 +158,10 @@ class ConversationEngine:
         """
         for question_data in questions:
             if self._should_ask_question(question_data):
+                self.events.emit("question_asked", question_id=question_data["id"], category=category)
+                started = time.perf_counter()
                 answer = self._ask_single_question(question_data)
-                self._process_answer(question_data, answer, category)
+                self._process_answer(question_data, answer, category, time.perf_counter() - started)
     
     def _ask_questions_as_list(self, questions: List[Dict], category: str):
         """
@@ -257,15 +178,32 @@ class ConversationEngine:
             if q.get('examples'):
                 print(f"   Examples: {', '.join(q['examples'])}")
         
+        for q in applicable_questions:
+            self.events.emit("question_asked", question_id=q["id"], category=category)
+        
         print("\nYou can answer with just the numbers (e.g., '1. Answer here, 2. Another answer...')")
         print("Or just answer in order, separated by newlines:")
         
+        started = time.perf_counter()
         response = input("\nYour answers:\n").strip()
+        # A batch is answered in one go, so each question gets an equal share of the time
+        seconds = (time.perf_counter() - started) / len(applicable_questions)
         answers = self._parse_batch_response(response, applicable_questions)
         
         for question_data, answer in zip(applicable_questions, answers):
             if answer:
-                self._process_answer(question_data, answer, category)
+                self._process_answer(question_data, answer, category, seconds)
+            else:
+                self.skipped_responses.append(UserResponse(
+                    question_id=question_data["id"],
+                    question=question_data["question"],
+                    answer="",
+                    category=category,
+                    seconds=seconds,
+                    skipped=True
+                ))
+                self.events.emit("answer_recorded", question_id=question_data["id"], category=category,
+                                 seconds=round(seconds, 6), skipped=True, answer_length=0)
     
     def _ask_single_question(self, question_data: Dict) -> str:
         """
@@ -304,9 +242,9 @@ class ConversationEngine:
         condition = question_data.get("condition")
         if condition and callable(condition):
             return condition(self.requirements)
-        return True
+        return evaluate_condition(condition, self.requirements)
     
-    def _process_answer(self, question_data: Dict, answer: str, category: str):
+    def _process_answer(self, question_data: Dict, answer: str, category: str, seconds: float = 0.0):
         """
         Process and store a question answer
         """
@@ -325,8 +263,13 @@ class ConversationEngine:
         self.conversation_history.append(UserResponse(
             question_id=question_id,
             question=question_data["question"],
-            answer=answer
+            answer=answer,
+            category=category,
+            seconds=seconds,
+            skipped=not answer
         ))
+        self.events.emit("answer_recorded", question_id=question_id, category=category,
+                         seconds=round(seconds, 6), skipped=not answer, answer_length=len(answer))
         
         # Handle follow-up triggers
         self._handle_follow_up_triggers(question_data, answer)
@@ -339,9 +282,21 @@ class ConversationEngine:
         
         for trigger_condition, follow_up_categories in triggers.items():
             if self._check_trigger_condition(trigger_condition, answer):
-                for category in follow_up_categories:
-                    # Add follow-up questions (this is a simplified implementation)
-                    print(f"  → That triggers some follow-up questions about {category}")
+                for library in follow_up_categories:
+                    if not self.library_loader.is_library(library):
+                        continue
+                    for category in self._load_library(library):
+                        if category not in self.asked_categories and category not in self.pending_follow_ups:
+                            print(f"  → That triggers some follow-up questions about {category.replace('_', ' ')}")
+                            self.pending_follow_ups.append(category)
+    
+    def _ask_pending_follow_ups(self):
+        """
+        Ask follow-up categories queued by trigger answers
+        """
+        while self.pending_follow_ups:
+            category = self.pending_follow_ups.pop(0)
+            self._ask_category(category, f"\nA few follow-ups about {category.replace('_', ' ')}:")
     
     def _check_trigger_condition(self, condition: str, answer: str) -> bool:
         """
@@ -388,11 +343,16 @@ class ConversationEngine:
         """
         Determine which follow-up question categories to ask based on initial goal
         """
-        # Simple keyword-based categorization (could be much more sophisticated)
         categories = ["user_context", "technical_context", "constraints", "success_criteria"]
         
-        # All categories for now, but could be smart about this
-        return categories
+        # Domain libraries (web apps, data tools, APIs) are routed by goal
+        # keywords and slot in after the technical questions
+        domain_categories = []
+        for library in self.library_loader.for_goal(project_goal):
+            domain_categories.extend(self._load_library(library))
+        
+        position = categories.index("technical_context") + 1
+        return categories[:position] + domain_categories + categories[position:]
     
     def _clarification_round(self):
         """
@@ -409,6 +369,7 @@ class ConversationEngine:
         if needs_clarification:
             print("Let me clarify a few things:")
             for resp in needs_clarification[:3]:  # Limit to 3 clarifications
+                resp.needs_clarification = True
                 print(f"\nEarlier you said '{resp.answer}' for: {resp.question}")
                 clarification = input("Could you expand on that a bit? ").strip()
                 if clarification:
@@ -418,6 +379,14 @@ class ConversationEngine:
         else:
             print("Everything looks clear! Moving on to technology selection...")
 
+    def save_session_log(self, directory: Path = SESSION_DIR) -> Path:
+        """
+        Record this session's answers (and skipped questions) for later analysis
+        """
+        style = self.style.value if self.style else "ask_user"
+        return write_session_log(self.conversation_history + self.skipped_responses,
+                                 directory, {"style": style})
+
     def get_conversation_summary(self) -> str:
         """
         Generate a summary of the conversation for the technology selector
@@ -425,8 +394,8 @@ class ConversationEngine:
         summary = []
         summary.append(f"Project Goal: {self.requirements.get('project_goal', 'Not specified')}")
         
-        for category in ["user_context", "technical_context", "constraints", "success_criteria"]:
-            if category in self.requirements:
+        for category in self.asked_categories:
+            if self.requirements.get(category) and category != "initial":
                 summary.append(f"\n{category.title()}:")
                 for key, value in self.requirements[category].items():
                     summary.append(f"  {key}: {value}")
@@ -0,0 +1,224 @@
+"""
+AI Project Inception - Question Libraries
+
+Question sets live as JSON files in discovery/libraries/. index.json says
+when each library is needed: always, when the project goal mentions one of
+its keywords, or when an answer fires one of its follow-up triggers. A
+library is only read when it is needed; the first time, it is validated
+and compiled into a pickle cache keyed by the JSON file's hash, so later
+sessions skip parsing and validation entirely.
+
+Conditions are declarative so libraries stay pure data:
+
+    {"field": "team_size", "op": ">", "value": 1}
+    {"all": [...]}, {"any": [...]}, {"not": {...}}
+
+Supported ops: ==, !=, >, >=, <, <=, in, contains, exists. Ordering ops
+compare numerically and are false for answers that aren't numbers.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+LIBRARY_DIR = Path(__file__).with_name("libraries")
+CACHE_DIR_NAME = ".cache"
+INDEX_FILE = "index.json"
+CACHE_VERSION = 1
+
+QUESTION_TYPES = {"open_text", "number", "choice"}
+COMPARISONS = {"==", "!=", ">", ">=", "<", "<="}
+OPS = COMPARISONS | {"in", "contains", "exists"}
+
+WORD = re.compile(r"[a-z0-9]+")
+
+class LibraryError(ValueError):
+    """A question library failed validation"""
+
+def _number(value) -> Optional[float]:
+    try:
+        return float(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+def evaluate_condition(condition: Optional[Dict[str, Any]], context: Dict[str, Any]) -> bool:
+    """
+    Evaluate a declarative condition against the answers collected so far
+    """
+    if not condition:
+        return True
+    if "all" in condition:
+        return all(evaluate_condition(c, context) for c in condition["all"])
+    if "any" in condition:
+        return any(evaluate_condition(c, context) for c in condition["any"])
+    if "not" in condition:
+        return not evaluate_condition(condition["not"], context)
+
+    op = condition["op"]
+    actual = context.get(condition["field"], condition.get("default"))
+    if op == "exists":
+        return actual not in (None, "")
+    if actual is None:
+        return False
+    expected = condition.get("value")
+    if op == "in":
+        return str(actual).strip().lower() in {str(v).lower() for v in expected}
+    if op == "contains":
+        return str(expected).lower() in str(actual).lower()
+
+    left, right = _number(actual), _number(expected)
+    if left is None or right is None:
+        # Non-numeric answers only support equality
+        if op == "==":
+            return str(actual).strip().lower() == str(expected).lower()
+        if op == "!=":
+            return str(actual).strip().lower() != str(expected).lower()
+        return False
+    return {
+        "==": left == right, "!=": left != right,
+        ">": left > right, ">=": left >= right,
+        "<": left < right, "<=": left <= right,
+    }[op]
+
+def _validate_condition(condition: Any, where: str):
+    if not isinstance(condition, dict):
+        raise LibraryError(f"{where}: condition must be an object")
+    for combinator in ("all", "any"):
+        if combinator in condition:
+            if not isinstance(condition[combinator], list):
+                raise LibraryError(f"{where}: '{combinator}' must be a list")
+            for child in condition[combinator]:
+                _validate_condition(child, where)
+            return
+    if "not" in condition:
+        _validate_condition(condition["not"], where)
+        return
+    if not isinstance(condition.get("field"), str):
+        raise LibraryError(f"{where}: condition needs a 'field'")
+    if condition.get("op") not in OPS:
+        raise LibraryError(f"{where}: unknown condition op {condition.get('op')!r}")
+    if condition["op"] == "in" and not isinstance(condition.get("value"), list):
+        raise LibraryError(f"{where}: 'in' needs a list value")
+    if condition["op"] != "exists" and "value" not in condition:
+        raise LibraryError(f"{where}: condition needs a 'value'")
+
+def compile_library(name: str, data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Validate a parsed library file and return its {category: [question]} map
+    """
+    categories = data.get("categories")
+    if not isinstance(categories, dict) or not categories:
+        raise LibraryError(f"{name}: needs a non-empty 'categories' object")
+
+    seen = set()
+    compiled = {}
+    for category, questions in categories.items():
+        if not isinstance(questions, list):
+            raise LibraryError(f"{name}.{category}: must be a list of questions")
+        for question in questions:
+            where = f"{name}.{category}.{question.get('id', '?')}"
+            if not isinstance(question.get("id"), str) or not isinstance(question.get("question"), str):
+                raise LibraryError(f"{where}: questions need string 'id' and 'question'")
+            if question["id"] in seen:
+                raise LibraryError(f"{where}: duplicate question id")
+            seen.add(question["id"])
+            question_type = question.get("type", "open_text")
+            if question_type not in QUESTION_TYPES:
+                raise LibraryError(f"{where}: unknown type {question_type!r}")
+            if question_type == "choice" and not question.get("options"):
+                raise LibraryError(f"{where}: choice questions need 'options'")
+            if "condition" in question:
+                _validate_condition(question["condition"], where)
+            triggers = question.get("follow_up_triggers", {})
+            if not all(isinstance(v, list) for v in triggers.values()):
+                raise LibraryError(f"{where}: follow_up_triggers values must be lists of libraries")
+        compiled[category] = questions
+    return compiled
+
+class QuestionLibraryLoader:
+    """
+    Loads libraries on demand from JSON, through a hash-keyed pickle cache
+    """
+
+    def __init__(self, directory: Path = LIBRARY_DIR, cache_dir: Optional[Path] = None):
+        self.directory = Path(directory)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.directory / CACHE_DIR_NAME
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self.loaded: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+
+    @property
+    def index(self) -> Dict[str, Dict[str, Any]]:
+        if self._index is None:
+            with open(self.directory / INDEX_FILE, "r", encoding="utf-8") as f:
+                self._index = json.load(f)["libraries"]
+        return self._index
+
+    def always(self) -> List[str]:
+        return [name for name, entry in self.index.items() if entry.get("always")]
+
+    def for_goal(self, goal: str) -> List[str]:
+        """
+        Domain libraries whose routing keywords appear in the project goal
+        """
+        text = goal.lower()
+        words = set(WORD.findall(text))
+        # Single words match whole words ("rest" shouldn't fire on "interest"), phrases match anywhere
+        return [name for name, entry in self.index.items()
+                if any(keyword in text if " " in keyword else keyword in words
+                       for keyword in entry.get("keywords", []))]
+
+    def is_library(self, name: str) -> bool:
+        return name in self.index
+
+    def load(self, name: str) -> Dict[str, List[Dict[str, Any]]]:
+        if name not in self.loaded:
+            self.loaded[name] = self._load_compiled(name)
+        return self.loaded[name]
+
+    def _load_compiled(self, name: str) -> Dict[str, List[Dict[str, Any]]]:
+        source = self.directory / self.index[name]["file"]
+        raw = source.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        cache_file = self.cache_dir / f"{name}.pickle"
+
+        try:
+            with open(cache_file, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("version") == CACHE_VERSION and cached.get("hash") == digest:
+                return cached["library"]
+        except Exception:
+            # Unpickling a stale or corrupt cache can raise almost anything; recompile instead
+            pass
+
+        library = compile_library(name, json.loads(raw))
+        self._write_cache(cache_file, {"version": CACHE_VERSION, "hash": digest, "library": library})
+        return library
+
+    def _write_cache(self, cache_file: Path, payload: Dict[str, Any]):
+        """
+        Best effort: a read-only checkout just compiles every session
+        """
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
+
+_loaders: Dict[Path, QuestionLibraryLoader] = {}
+
+def shared_loader(directory: Path = LIBRARY_DIR) -> QuestionLibraryLoader:
+    """
+    One loader per directory, so every engine in a process shares what's been loaded
+    """
+    directory = Path(directory)
+    if directory not in _loaders:
+        _loaders[directory] = QuestionLibraryLoader(directory)
+    return _loaders[directory]
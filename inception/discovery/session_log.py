@@ -0,0 +1,79 @@
+"""
+AI Project Inception - Session Logs
+
+Every discovery session is written as one NDJSON file: a header line with
+the session metadata, then one UserResponse per line. Reading is a chain
+of generators (files → lines → records), so analytics over tens of
+thousands of sessions holds one line in memory at a time. Logs may be
+gzipped (.jsonl.gz) after the fact.
+"""
+
+import gzip
+import json
+import os
+import time
+import uuid
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Any, Optional, Union
+
+SESSION_DIR = Path(os.environ.get("INCEPTION_SESSION_DIR", ".inception/sessions"))
+LOG_PATTERNS = ("*.jsonl", "*.jsonl.gz")
+
+def write_session_log(responses: Iterable[Any], directory: Path = SESSION_DIR,
+                      metadata: Optional[Dict[str, Any]] = None) -> Path:
+    """
+    Write one session's responses; returns the log path
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    session_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    path = directory / f"{session_id}.jsonl"
+    header = {"session": session_id, "recorded_at": time.time(), **(metadata or {})}
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"header": header}) + "\n")
+        for response in responses:
+            f.write(json.dumps(asdict(response)) + "\n")
+    return path
+
+def iter_log_files(paths: Iterable[Union[str, Path]]) -> Iterator[Path]:
+    """
+    Expand directories into their session logs, in name (= time) order
+    """
+    for path in map(Path, paths):
+        if path.is_dir():
+            found = [p for pattern in LOG_PATTERNS for p in path.rglob(pattern)]
+            yield from sorted(found)
+        else:
+            yield path
+
+def iter_lines(files: Iterable[Path]) -> Iterator[str]:
+    for path in files:
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            yield from f
+
+def iter_records(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Decoded lines; truncated or corrupt lines (e.g. an interrupted write) are skipped
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            continue
+
+def iter_responses(paths: Iterable[Union[str, Path]]) -> Iterator[Any]:
+    """
+    Stream UserResponse records (and session headers, as dicts) from session logs
+    """
+    from discovery.conversation_engine import UserResponse
+    known = {f.name for f in fields(UserResponse)}
+    for record in iter_records(iter_lines(iter_log_files(paths))):
+        if "header" in record:
+            yield record
+        elif "question_id" in record:
+            yield UserResponse(**{k: v for k, v in record.items() if k in known})
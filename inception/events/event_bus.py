@@ -0,0 +1,115 @@
+"""
+AI Project Inception - Event Bus
+
+Structured progress events for UIs and wrappers, so they don't have to
+scrape the emoji output. Components emit events on a shared EventBus;
+sinks subscribe to them. A sink is any callable taking the event dict
+(list.append works), optionally with flush() and close().
+
+Every event has:
+    event   - phase_start, phase_end, question_asked, answer_recorded,
+              decision_made or file_generated
+    seq     - 1, 2, 3... in emission order
+    ts      - wall-clock time (time.time())
+    elapsed - seconds since the bus was created (monotonic)
+plus event-specific fields.
+
+With no sinks attached, emit() returns before building anything, so
+instrumented code costs nothing when nobody is listening.
+"""
+
+import contextlib
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List
+
+Event = Dict[str, Any]
+
+# Events after which the process typically blocks (on the user, or at the
+# end of a phase), so buffered sinks flush rather than hold them back
+FLUSH_EVENTS = {"phase_start", "phase_end", "question_asked"}
+
+class EventBus:
+    """
+    Fan-out of structured events to subscribed sinks
+    """
+
+    def __init__(self):
+        self.sinks: List[Callable[[Event], Any]] = []
+        self.seq = 0
+        self.started = time.perf_counter()
+
+    def subscribe(self, sink: Callable[[Event], Any]) -> Callable[[Event], Any]:
+        self.sinks.append(sink)
+        return sink
+
+    def emit(self, event: str, **fields):
+        if not self.sinks:
+            return
+        self.seq += 1
+        record = {"event": event, "seq": self.seq, "ts": round(time.time(), 6),
+                  "elapsed": round(time.perf_counter() - self.started, 6)}
+        record.update(fields)
+        for sink in self.sinks:
+            sink(record)
+            if event in FLUSH_EVENTS and hasattr(sink, "flush"):
+                sink.flush()
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """
+        Emit phase_start / phase_end around a block; phase_end carries the
+        duration, and the error if the block raised
+        """
+        started = time.perf_counter()
+        self.emit("phase_start", phase=name)
+        try:
+            yield
+        except BaseException as e:
+            self.emit("phase_end", phase=name, seconds=round(time.perf_counter() - started, 6),
+                      ok=False, error=type(e).__name__)
+            raise
+        self.emit("phase_end", phase=name, seconds=round(time.perf_counter() - started, 6), ok=True)
+
+    def close(self):
+        for sink in self.sinks:
+            if hasattr(sink, "close"):
+                sink.close()
+        self.sinks = []
+
+class NDJSONSink:
+    """
+    Writes one JSON object per line to a file descriptor, through a
+    userspace buffer; the bus flushes it at phase boundaries and before
+    the process waits on the user
+    """
+
+    def __init__(self, fd: int, buffer_size: int = 64 * 1024):
+        os.fstat(fd)  # Fail early (OSError) on a descriptor that isn't open
+        self.stream = os.fdopen(fd, "wb", buffering=buffer_size, closefd=False)
+        self.encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str).encode
+
+    def __call__(self, event: Event):
+        try:
+            self.stream.write(self.encode(event).encode("utf-8") + b"\n")
+        except BrokenPipeError:
+            self._detach()
+
+    def flush(self):
+        try:
+            self.stream.flush()
+        except BrokenPipeError:
+            self._detach()
+
+    def _detach(self):
+        """
+        The reader went away; progress events are best effort, so carry on without them
+        """
+        with contextlib.suppress(OSError):
+            self.stream.close()
+        self.stream = open(os.devnull, "wb")
+
+    def close(self):
+        self.flush()
+        self.stream.close()
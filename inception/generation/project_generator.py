@@ -0,0 +1,208 @@
+"""
+AI Project Inception - Project Generator
+
+Turns discovered requirements and a technology decision into a project on
+disk: the chosen stack's scaffold from templates/<template>/, plus the
+shared AI-native layer (docs, manage.py, Git/test automation) from the
+repository root. {{VARIABLE}} placeholders are filled from the discovery
+answers and the decision; the ones only a collaborator can write (phase
+tasks, API docs, patterns) are left in place for the AI to complete.
+
+Each template has a template.json with the stack's variables (main file,
+port, commands) overriding the generic defaults, and optionally its
+features: groups of files only generated when the discovery answers call
+for them, e.g.
+
+    "features": {
+        "database": {
+            "keywords": ["database", "store", "track", ...],
+            "files": ["modules/database.py", "tests/test_database.py"]
+        }
+    }
+
+A feature is selected when any keyword appears as a word in the answers
+listed under FEATURE_FIELDS (or the feature's own "fields").
+"""
+
+import datetime
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TEMPLATES_DIR = REPO_ROOT / "templates"
+MANIFEST_FILE = "template.json"
+
+# Shared layer copied into every project: source (repo root) -> destination
+SHARED_FILES = {
+    "PROJECT_README.md": "README.md",
+    "BOOTSTRAP_PROMPT.md": "BOOTSTRAP_PROMPT.md",
+    "PROJECT_GOALS.md": "PROJECT_GOALS.md",
+    "ROADMAP.md": "ROADMAP.md",
+    ".github/copilot-instructions.md": ".github/copilot-instructions.md",
+    "manage.py": "manage.py",
+    "manage.sh": "manage.sh",
+    "manage.bat": "manage.bat",
+    "scripts/check-test-coverage-old.py": "scripts/check-test-coverage.py",
+    "scripts/coverage_trace.py": "scripts/coverage_trace.py",
+    "scripts/change_impact.py": "scripts/change_impact.py",
+    "scripts/result_cache.py": "scripts/result_cache.py",
+    "scripts/timing_history.py": "scripts/timing_history.py",
+    "scripts/git_workflow.py": "scripts/git_workflow.py",
+    "scripts/roadmap.py": "scripts/roadmap.py",
+    "scripts/update-roadmap.py": "scripts/update-roadmap.py",
+    "scripts/update-roadmap.sh": "scripts/update-roadmap.sh",
+    "scripts/create-branch.py": "scripts/create-branch.py",
+    "scripts/create-branch.sh": "scripts/create-branch.sh",
+    "scripts/create-branch.bat": "scripts/create-branch.bat",
+    "scripts/merge-to-main.py": "scripts/merge-to-main.py",
+    "scripts/merge-to-main.sh": "scripts/merge-to-main.sh",
+    "scripts/merge-to-main.bat": "scripts/merge-to-main.bat",
+    "scripts/run-tests.py": "scripts/run-tests.py",
+    "scripts/run-tests.sh": "scripts/run-tests.sh",
+    "scripts/run-tests.bat": "scripts/run-tests.bat",
+}
+
+TEXT_SUFFIXES = {".py", ".sh", ".bat", ".md", ".txt", ".json", ".toml", ".ini", ".cfg",
+                 ".yml", ".yaml", ".html", ".css", ".js", ".env", ""}
+SKIP_NAMES = {MANIFEST_FILE, "__pycache__", ".pytest_cache"}
+
+PLACEHOLDER = re.compile(r"\{\{\{\{([A-Z0-9_]+)\}\}\}\}|\{\{([A-Z0-9_]+)\}\}")
+# Discovery answers that describe what the project does and keeps
+FEATURE_FIELDS = ("project_goal", "must_have_features", "nice_to_have", "success_definition",
+                  "existing_tools", "integration_needs", "data_sources", "data_volume", "output_format")
+STOPWORDS = {"a", "an", "the", "to", "for", "of", "and", "or", "in", "on", "at", "with", "we",
+             "i", "our", "my", "that", "which", "want", "need", "build", "across", "is", "be"}
+
+def slugify(text: str, words: int = 4) -> str:
+    tokens = [t for t in re.findall(r"[a-z0-9]+", text.lower()) if t not in STOPWORDS]
+    return "-".join(tokens[:words]) or "project"
+
+def render(text: str, variables: Dict[str, str]) -> str:
+    """
+    Fill known placeholders; f-string-escaped ones ({{{{VARIABLE}}}}) render to the bare value
+    """
+    def substitute(match):
+        name = match.group(1) or match.group(2)
+        return variables.get(name, match.group(0))
+    return PLACEHOLDER.sub(substitute, text)
+
+def select_features(requirements: Dict[str, Any], manifest: Dict[str, Any]) -> List[str]:
+    """
+    Names of the manifest's features whose keywords appear in the discovery answers
+    """
+    selected = []
+    for name, feature in manifest.get("features", {}).items():
+        fields = feature.get("fields", FEATURE_FIELDS)
+        words = set(re.findall(r"[a-z0-9]+", " ".join(str(requirements.get(f, "")) for f in fields).lower()))
+        if any(keyword.lower() in words for keyword in feature.get("keywords", [])):
+            selected.append(name)
+    return selected
+
+class ProjectGenerator:
+    """
+    Creates a new project from a template and the inception results
+    """
+
+    def __init__(self, output_dir: str = "./generated_projects", templates_dir: Path = TEMPLATES_DIR):
+        self.output_dir = Path(output_dir)
+        self.templates_dir = Path(templates_dir)
+
+    def load_manifest(self, template: Optional[str]) -> Dict[str, Any]:
+        if not template:
+            return {}
+        path = self.templates_dir / template / MANIFEST_FILE
+        if not path.exists():
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def build_variables(self, requirements: Dict[str, Any], decisions: Dict[str, Any],
+                        manifest: Dict[str, Any], name: str) -> Dict[str, str]:
+        today = datetime.date.today().isoformat()
+        variables = {
+            "PROJECT_NAME": name,
+            "SERVICE_NAME": name,
+            "PROJECT_DESCRIPTION": requirements.get("project_goal", ""),
+            "PROJECT_TYPE": decisions.get("project_type", ""),
+            "TECH_STACK": decisions.get("tech_stack", ""),
+            "ARCHITECTURE_PATTERN": decisions.get("architecture", ""),
+            "TECHNOLOGY_RATIONALE": "\n".join(f"- {reason}" for reason in decisions.get("rationale", [])),
+            "CORE_FEATURES": requirements.get("must_have_features", ""),
+            "CREATION_DATE": today,
+            "GENERATION_DATE": today,
+            "DISCOVERY_DATE": today,
+            "LAST_UPDATED": today,
+        }
+        variables.update({key: str(value) for key, value in manifest.get("variables", {}).items()})
+        if "PORT" in variables:
+            variables.setdefault("SERVER_URL", f"http://localhost:{variables['PORT']}")
+        return variables
+
+    def _unique_path(self, name: str) -> Path:
+        path = self.output_dir / name
+        suffix = 2
+        while path.exists():
+            path = self.output_dir / f"{name}-{suffix}"
+            suffix += 1
+        return path
+
+    def _template_files(self, template_dir: Path, excluded: Optional[set] = None) -> Dict[Path, str]:
+        files = {}
+        for source in sorted(template_dir.rglob("*")):
+            relative = source.relative_to(template_dir)
+            if source.is_dir() or any(part in SKIP_NAMES for part in relative.parts) or source.suffix == ".pyc":
+                continue
+            if excluded and relative.as_posix() in excluded:
+                continue
+            files[source] = relative.as_posix()
+        return files
+
+    def _write(self, source: Path, destination: Path, variables: Dict[str, str]):
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        if source.suffix in TEXT_SUFFIXES:
+            destination.write_text(render(source.read_text(encoding="utf-8"), variables), encoding="utf-8")
+            shutil.copymode(source, destination)
+        else:
+            shutil.copy2(source, destination)
+
+    def create_project(self, requirements: Dict[str, Any], decisions: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate the project; returns its name, path, template, selected features and the files written
+        """
+        template = decisions.get("template")
+        manifest = self.load_manifest(template)
+        features = select_features(requirements, manifest)
+        # Files of the features the answers didn't ask for
+        excluded = {path for name, feature in manifest.get("features", {}).items() if name not in features
+                    for path in feature.get("files", [])}
+        name = slugify(requirements.get("project_goal", ""))
+        path = self._unique_path(name)
+        variables = self.build_variables(requirements, decisions, manifest, path.name)
+
+        sources = {REPO_ROOT / source: destination for source, destination in SHARED_FILES.items()
+                   if (REPO_ROOT / source).exists()}
+        template_dir = self.templates_dir / template if template else None
+        if template_dir is not None and template_dir.is_dir():
+            sources.update(self._template_files(template_dir, excluded))
+        else:
+            print(f"⚠️  No '{template}' template yet; generating the shared project layer only")
+
+        print(f"📁 Creating {path}")
+        if features:
+            print(f"🧩 Features: {', '.join(features)}")
+        files: List[str] = []
+        for source, destination in sources.items():
+            self._write(source, path / destination, variables)
+            files.append(destination)
+
+        print(f"✅ Generated {len(files)} files from {'the ' + template + ' template' if template else 'shared files'}")
+        return {
+            "name": path.name,
+            "path": str(path),
+            "template": template,
+            "features": features,
+            "files": files,
+        }
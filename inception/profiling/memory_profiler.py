@@ -0,0 +1,188 @@
+"""
+AI Project Inception - Memory Profiler
+
+Per-phase memory accounting for inception runs. MemoryProfiler is an
+event-bus sink: on phase_start it snapshots tracemalloc and resets the
+peak, on phase_end it snapshots again and records
+
+    - current and peak traced memory for the phase
+    - the top allocation sites still alive at the end of the phase
+    - the top growth sites (end snapshot diffed against the start)
+    - the deep size of the objects the orchestrator says it is holding
+      (project_context, conversation history, generated content)
+
+Budgets are checked at phase_end against the phase's peak; going over
+raises MemoryBudgetExceeded, which fails the run.
+
+Budget syntax (--memory-budget):
+    64MB                          every phase
+    discovery=16MB,generation=1G  per phase ('*' for the rest)
+"""
+
+import os
+import re
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmg]?)(?:i?b)?\s*$", re.IGNORECASE)
+UNITS = {"": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Allocations made by the profiler itself and the import machinery aren't the run's
+IGNORED_FRAMES = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+class MemoryBudgetExceeded(RuntimeError):
+    """A phase's peak traced memory went over its budget"""
+
+def parse_size(text: str) -> int:
+    """
+    '512K', '64MB', '1.5GiB', '1048576' -> bytes
+    """
+    match = SIZE.match(text)
+    if not match:
+        raise ValueError(f"Invalid size '{text}' (expected e.g. 512K, 64MB, 1G)")
+    return int(float(match.group(1)) * UNITS[match.group(2).lower()])
+
+def parse_budget(text: str) -> Dict[str, int]:
+    """
+    '64MB' -> {'*': ...}; 'discovery=16MB,generation=1G' -> per-phase limits
+    """
+    budgets = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        phase, _, size = part.rpartition("=")
+        budgets[phase.strip() or "*"] = parse_size(size)
+    if not budgets:
+        raise ValueError("Empty memory budget")
+    return budgets
+
+def format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.2f} GiB"
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    Size of an object and everything it references (containers, dataclasses,
+    instance dicts), counting shared objects once
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__") and not isinstance(current, type):
+            stack.append(vars(current))
+    return total
+
+def _site(stat) -> str:
+    frame = stat.traceback[0]
+    filename = frame.filename
+    if filename.startswith(ROOT + os.sep):
+        filename = os.path.relpath(filename, ROOT)
+    return f"{filename}:{frame.lineno}"
+
+class MemoryProfiler:
+    """
+    Event sink recording tracemalloc snapshots at phase boundaries
+    """
+
+    def __init__(self, budgets: Optional[Dict[str, int]] = None, top: int = 5,
+                 objects: Optional[Callable[[], Dict[str, Any]]] = None):
+        self.budgets = budgets or {}
+        self.top = top
+        self.objects = objects
+        self.phases: List[Dict[str, Any]] = []
+        self._open: Dict[str, Any] = {}
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self):
+        tracemalloc.stop()
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(IGNORED_FRAMES)
+
+    def __call__(self, event: Dict[str, Any]):
+        if event["event"] == "phase_start":
+            if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+; before that peaks are run-wide
+                tracemalloc.reset_peak()
+            self._open[event["phase"]] = (self._snapshot(), tracemalloc.get_traced_memory()[0])
+        elif event["event"] == "phase_end" and event["phase"] in self._open:
+            self._finish(event["phase"])
+
+    def _finish(self, phase: str):
+        current, peak = tracemalloc.get_traced_memory()
+        start_snapshot, start_current = self._open.pop(phase)
+        end_snapshot = self._snapshot()
+
+        record = {
+            "phase": phase,
+            "start": start_current,
+            "current": current,
+            "peak": peak,
+            "top_sites": [(_site(s), s.size, s.count)
+                          for s in end_snapshot.statistics("lineno")[:self.top]],
+            "growth_sites": [(_site(s), s.size_diff, s.count_diff)
+                             for s in end_snapshot.compare_to(start_snapshot, "lineno")[:self.top]
+                             if s.size_diff],
+            "objects": {name: deep_sizeof(obj) for name, obj in self.objects().items()} if self.objects else {},
+            "budget": self.budgets.get(phase, self.budgets.get("*")),
+        }
+        self.phases.append(record)
+
+        if record["budget"] is not None and peak > record["budget"]:
+            raise MemoryBudgetExceeded(
+                f"phase '{phase}' peaked at {format_bytes(peak)}, "
+                f"over its {format_bytes(record['budget'])} budget"
+            )
+
+    def print_report(self):
+        print("\n🧠 Memory Report")
+        print("================")
+        if not self.phases:
+            print("No phases completed")
+            return
+
+        print(f"{'phase':<12} {'start':>11} {'end':>11} {'change':>11} {'peak':>11} {'budget':>11}")
+        for record in self.phases:
+            budget = record["budget"]
+            status = "" if budget is None else (" ❌" if record["peak"] > budget else " ✅")
+            print(f"{record['phase']:<12} {format_bytes(record['start']):>11} "
+                  f"{format_bytes(record['current']):>11} "
+                  f"{format_bytes(record['current'] - record['start']):>11} "
+                  f"{format_bytes(record['peak']):>11} "
+                  f"{format_bytes(budget) if budget is not None else '-':>11}{status}")
+
+        for record in self.phases:
+            print(f"\n📍 {record['phase']}")
+            if record["objects"]:
+                print("  Held objects:")
+                for name, size in record["objects"].items():
+                    print(f"    {format_bytes(size):>11}  {name}")
+            if record["growth_sites"]:
+                print("  Growth since phase start:")
+                for site, size_diff, count_diff in record["growth_sites"]:
+                    print(f"    {format_bytes(size_diff):>11}  {count_diff:+7} blocks  {site}")
+            print("  Top allocation sites:")
+            for site, size, count in record["top_sites"]:
+                print(f"    {format_bytes(size):>11}  {count:7} blocks  {site}")
@@ -11,9 +11,327 @@ import subprocess
 import time
 import signal
 import json
+import math
+import asyncio
+import gzip
+import urllib.error
+import urllib.request
+import queue
+import shutil
+import threading
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import psutil
 
+class RotatingLogWriter:
+    """
+    Non-blocking log sink used by the log pump.
+
+    Lines are queued into a bounded buffer and written by a background
+    thread, so a slow disk never stalls the pipe reader (and therefore
+    never blocks the service). Lines that arrive while the buffer is full
+    are dropped and counted. Segments rotate on size or age and are
+    gzip-compressed off the writer thread.
+    """
+
+    def __init__(self, path, max_bytes, rotate_seconds, backup_count, buffer_lines):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_seconds
+        self.backup_count = backup_count
+        self.buffer = queue.Queue(maxsize=buffer_lines)
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._stream = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._compressors = []
+        self._segment_seq = 0
+        self._writer = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._writer.start()
+
+    def write_line(self, line):
+        """Queue a line for writing; never blocks"""
+        try:
+            self.buffer.put_nowait(line)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        """Flush everything still buffered and stop the writer"""
+        self.buffer.put(None)
+        self._writer.join()
+        for compressor in self._compressors:
+            compressor.join()
+
+    def _open(self):
+        self._stream = open(self.path, 'ab')
+        self._size = self._stream.tell()
+        self._opened_at = time.time()
+
+    def _run(self):
+        self._open()
+        while True:
+            try:
+                line = self.buffer.get(timeout=1.0)
+            except queue.Empty:
+                self._maybe_rotate()
+                continue
+
+            if line is None:
+                break
+            self._stream.write(line)
+            self._size += len(line)
+
+            if self._size >= self.max_bytes:
+                self._maybe_rotate()
+            elif self.buffer.empty():
+                # Flush once the buffer is drained so writes are batched
+                self._report_dropped()
+                self._stream.flush()
+                self._maybe_rotate()
+
+        self._report_dropped()
+        self._stream.close()
+
+    def _report_dropped(self):
+        dropped = self.dropped
+        if dropped != self._reported_dropped:
+            message = f"[log-pump] dropped {dropped - self._reported_dropped} lines (buffer full, {dropped} total)\n"
+            self._stream.write(message.encode())
+            self._reported_dropped = dropped
+
+    def _maybe_rotate(self):
+        too_big = self._size >= self.max_bytes
+        too_old = time.time() - self._opened_at >= self.rotate_seconds
+        if not (too_big or too_old) or self._size == 0:
+            return
+
+        self._report_dropped()
+        self._stream.close()
+        # Timestamp plus a monotonic sequence keeps names in chronological sort order
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        while True:
+            self._segment_seq += 1
+            segment = self.path.with_name(f"{self.path.name}.{stamp}-{self._segment_seq:04d}")
+            if not (segment.exists() or segment.with_name(segment.name + ".gz").exists()):
+                break
+        os.replace(self.path, segment)
+        self._open()
+
+        compressor = threading.Thread(target=self._compress, args=(segment,), daemon=True)
+        compressor.start()
+        self._compressors = [c for c in self._compressors if c.is_alive()] + [compressor]
+
+    def _compress(self, segment):
+        compressed = segment.with_name(segment.name + ".gz")
+        try:
+            with open(segment, 'rb') as src, gzip.open(compressed, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+        except OSError as e:
+            # Keep the raw segment (clean_up still matches it) rather than a truncated .gz
+            compressed.unlink(missing_ok=True)
+            self.write_line(f"[log-pump] could not compress {segment.name}: {e}\n".encode())
+            return
+        segment.unlink()
+
+        # Keep only the newest backup_count compressed segments
+        segments = sorted(self.path.parent.glob(f"{self.path.name}.*.gz"))
+        for old in segments[:-self.backup_count]:
+            old.unlink(missing_ok=True)
+
+# Runs the service in-process under a wall-clock sampling profiler (see profile_service).
+# Only this bootstrap carries profiling code, so normal starts pay nothing for it.
+PROFILER_BOOTSTRAP = r"""
+import collections, os, runpy, sys, threading, time, _thread
+
+main_file, prefix = sys.argv[1], sys.argv[2]
+duration, max_requests = float(sys.argv[3]), int(sys.argv[4])
+interval, top, all_threads = float(sys.argv[5]), int(sys.argv[6]), sys.argv[7] == "1"
+
+stacks = collections.Counter()
+active = set()
+handled = [0]
+stop = threading.Event()
+
+try:
+    import flask
+except ImportError:
+    flask = None
+    all_threads = True
+
+if flask is not None:
+    # Count requests and remember which threads are serving one
+    original_wsgi_app = flask.Flask.wsgi_app
+
+    def wsgi_app(self, environ, start_response):
+        ident = threading.get_ident()
+        active.add(ident)
+        try:
+            return original_wsgi_app(self, environ, start_response)
+        finally:
+            active.discard(ident)
+            handled[0] += 1
+            if max_requests and handled[0] >= max_requests:
+                stop.set()
+
+    flask.Flask.wsgi_app = wsgi_app
+
+root = os.getcwd() + os.sep
+
+def frame_label(code):
+    filename = code.co_filename
+    if filename.startswith(root):
+        filename = filename[len(root):]
+    else:
+        filename = "/".join(filename.replace(os.sep, "/").split("/")[-2:])
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+def sampler():
+    me = threading.get_ident()
+    deadline = time.monotonic() + duration if duration > 0 else None
+    while not stop.wait(interval):
+        for ident, frame in sys._current_frames().items():
+            if ident == me or not (all_threads or ident in active):
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(frame_label(frame.f_code))
+                frame = frame.f_back
+            stacks[";".join(reversed(stack))] += 1
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+    _thread.interrupt_main()
+
+def write_reports():
+    with open(prefix + ".folded", "w") as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+    own = collections.Counter()
+    inclusive = collections.Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(";")
+        own[frames[-1]] += count
+        for name in set(frames):
+            inclusive[name] += count
+    total = sum(stacks.values()) or 1
+
+    with open(prefix + ".txt", "w") as f:
+        f.write(f"{sum(stacks.values())} samples every {interval * 1000:g}ms, {handled[0]} requests\n\n")
+        f.write(f"{'self %':>7} {'total %':>8}  function\n")
+        for name, count in own.most_common(top):
+            f.write(f"{count * 100 / total:>7.1f} {inclusive[name] * 100 / total:>8.1f}  {name}\n")
+
+threading.Thread(target=sampler, name="profiler-sampler", daemon=True).start()
+sys.argv = [main_file]
+try:
+    runpy.run_path(main_file, run_name="__main__")
+except KeyboardInterrupt:
+    pass
+finally:
+    stop.set()
+    write_reports()
+"""
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (None when empty)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(pct / 100.0 * len(ordered))))
+    return ordered[rank - 1]
+
+def parse_options(args):
+    """Parse '--flag' and '--key=value' command options into a dict"""
+    options = {}
+    for arg in args:
+        if not arg.startswith("--"):
+            continue
+        key, _, value = arg[2:].partition("=")
+        options[key.replace("-", "_")] = value if value else True
+    return options
+
+def require_values(options, *keys):
+    """Exit with an error if any of these --key=value options was given without a value"""
+    for key in keys:
+        if options.get(key) is True:
+            print(f"❌ --{key.replace('_', '-')} needs a value (--{key.replace('_', '-')}=...)")
+            sys.exit(1)
+
+class KeepAliveConnection:
+    """Minimal HTTP/1.1 client connection reused across requests (asyncio streams)"""
+
+    def __init__(self, host, port, timeout):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+
+    async def request(self, path, method="GET"):
+        """Send a request and return (status, body_length), reconnecting when needed"""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout)
+
+        request = (f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                   f"Connection: keep-alive\r\n\r\n").encode()
+        self.writer.write(request)
+        try:
+            return await asyncio.wait_for(self._read_response(method), self.timeout)
+        except BaseException:
+            self.close()
+            raise
+
+    async def _read_head(self):
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ", 2)[1])
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return status, headers
+
+    async def _read_response(self, method):
+        status, headers = await self._read_head()
+        while 100 <= status < 200 and status != 101:
+            # Interim response (100 Continue, 103 Early Hints); the real one follows
+            status, headers = await self._read_head()
+
+        length = 0
+        if method == "HEAD" or status in (101, 204, 304) or 100 <= status < 200:
+            pass  # Never has a body, whatever the headers say
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    break
+                await self.reader.readexactly(size + 2)
+                length += size
+            # Trailer section: header lines up to an empty line
+            while (await self.reader.readline()).strip():
+                pass
+        elif "content-length" in headers:
+            length = int(headers["content-length"])
+            await self.reader.readexactly(length)
+        else:
+            # Body delimited by connection close
+            length = len(await self.reader.read())
+            self.close()
+            return status, length
+
+        if headers.get("connection", "").lower() == "close" or status == 101:
+            self.close()
+        return status, length
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
 class ProjectManager:
     def __init__(self):
         self.project_name = "{{PROJECT_NAME}}"
@@ -30,6 +348,24 @@ class ProjectManager:
         else:
             self.venv_python = self.project_root / ".venv" / "bin" / "python"
             self.venv_pip = self.project_root / ".venv" / "bin" / "pip"
+        
+        # Service log capture (see run_log_pump)
+        self.log_file = self.project_root / f"{self.service_name}.log"
+        self.log_max_bytes = 10 * 1024 * 1024
+        self.log_rotate_seconds = 24 * 60 * 60
+        self.log_backup_count = 5
+        self.log_buffer_lines = 10000
+        
+        # Cleanup walk (see clean_up)
+        # Raw rotated segments (<svc>.log.<stamp>-NNNN) are left behind if compression fails
+        self.clean_root_patterns = ["*.pid", "*.log", "*.log.*.gz", "*.log.*-[0-9][0-9][0-9][0-9]", ".env_port"]
+        self.clean_cache_dirs = {"__pycache__", ".pytest_cache"}
+        self.clean_excluded_dirs = {".venv", "venv", "node_modules", ".git", ".tox", ".nox"}
+        
+        # Grace period between SIGTERM and kill on stop, so the service can drain in-flight work
+        self.stop_timeout = 30
+        # How long start waits for /health to answer
+        self.start_timeout = 30
     
     def show_help(self):
         """Display help information"""
@@ -42,16 +378,24 @@ class ProjectManager:
         print("  stop      - Stop service")
         print("  restart   - Restart service")
         print("  status    - Check service status")
+        print("              --metrics [--window=5] [--interval=0.5] [--json] [--watch]")
+        print("  bench     - Load test the running service")
+        print("              [--endpoints=/api/a,/api/b] [--concurrency=10] [--duration=10 | --requests=N]")
+        print("              [--port=N] [--output=results.json] [--compare=previous.json]")
+        print("  profile   - Run the service under a sampling profiler")
+        print("              [--duration=30 | --requests=N] [--interval=0.005] [--top=25] [--all-threads]")
         print("  logs      - View service logs")
-        print("  clean     - Clean up temporary files")
+        print("  clean     - Clean up temporary files [--dry-run]")
         print("")
         print("Examples:")
         if self.is_windows:
             print("  python manage.py setup")
             print("  python manage.py start")
+            print("  python manage.py status --metrics --window=10")
         else:
             print("  ./manage.py setup")
             print("  ./manage.py start")
+            print("  ./manage.py status --metrics --window=10")
     
     def setup_environment(self):
         """Set up development environment"""
@@ -156,29 +500,63 @@ class ProjectManager:
         # Set environment variable and start service
         env = os.environ.copy()
         env['PORT'] = str(available_port)
+        env['PYTHONUNBUFFERED'] = '1'
         
-        # Start the service
+        # Log pump outlives this script and writes the service output to the log file
+        log_pump = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "_log-pump"],
+            cwd=self.project_root,
+            stdin=subprocess.PIPE
+        )
+        
+        # Start the service with stdout/stderr piped into the log pump
         process = subprocess.Popen(
             [str(self.venv_python), self.python_command],
             cwd=self.project_root,
-            env=env
+            env=env,
+            stdout=log_pump.stdin,
+            stderr=subprocess.STDOUT
         )
+        log_pump.stdin.close()
         
         # Save PID
         with open(pid_file, 'w') as f:
             f.write(str(process.pid))
         
-        # Wait a moment and verify it started
-        time.sleep(2)
-        if psutil.pid_exists(process.pid):
+        # Ready once /health answers; give up early if the process exits
+        ready = self._wait_until_ready(process, available_port)
+        if ready is None:
+            print(f"⚠️  {self.service_name} is running (PID: {process.pid}) but /health did not answer "
+                  f"within {self.start_timeout}s")
+            print(f"📜 Check the logs: {self.log_file.name}")
+        elif ready:
             print(f"✅ {self.service_name} started successfully (PID: {process.pid})")
             print(f"🌐 Server: http://localhost:{available_port}")
             print(f"🔍 Health check: http://localhost:{available_port}/health")
+            print(f"📜 Logs: {self.log_file.name}")
         else:
             print(f"❌ Failed to start {self.service_name}")
             pid_file.unlink(missing_ok=True)
             sys.exit(1)
     
+    def run_log_pump(self):
+        """Copy service output from stdin into the rotating log file"""
+        # The service gets SIGINT/SIGTERM; keep draining until its pipe closes
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        
+        writer = RotatingLogWriter(
+            self.log_file,
+            max_bytes=self.log_max_bytes,
+            rotate_seconds=self.log_rotate_seconds,
+            backup_count=self.log_backup_count,
+            buffer_lines=self.log_buffer_lines
+        )
+        try:
+            for line in sys.stdin.buffer:
+                writer.write_line(line)
+        finally:
+            writer.close()
+    
     def stop_service(self):
         """Stop the service"""
         print(f"🛑 Stopping {self.service_name}...")
@@ -194,8 +572,9 @@ class ProjectManager:
                     process = psutil.Process(pid)
                     process.terminate()
                     try:
-                        process.wait(timeout=10)
+                        process.wait(timeout=self.stop_timeout)
                     except psutil.TimeoutExpired:
+                        print(f"⚠️  Still running after {self.stop_timeout}s; killing it")
                         process.kill()
                     
                     pid_file.unlink()
@@ -209,6 +588,23 @@ class ProjectManager:
         else:
             print("⚠️  No PID file found")
     
+    def _wait_until_ready(self, process, port):
+        """True once /health answers, False if the process exits first, None at the deadline"""
+        url = f"http://127.0.0.1:{port}/health"
+        opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))  # Never via a proxy
+        deadline = time.monotonic() + self.start_timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                return False
+            try:
+                with opener.open(url, timeout=1):
+                    return True
+            except urllib.error.HTTPError:
+                return True  # Answering, even if unhealthy; check_status shows the details
+            except (urllib.error.URLError, OSError):
+                time.sleep(0.05)
+        return None
+    
     def check_status(self):
         """Check service status"""
         # Check port availability
@@ -245,9 +641,434 @@ class ProjectManager:
         else:
             print(f"❌ {self.service_name} is not running")
     
+    def _read_running_pid(self):
+        """Return the service PID if it is running, otherwise None"""
+        pid_file = self.project_root / f"{self.service_name}.pid"
+        try:
+            with open(pid_file, 'r') as f:
+                pid = int(f.read().strip())
+        except (ValueError, FileNotFoundError):
+            return None
+        return pid if psutil.pid_exists(pid) else None
+    
+    def _sample_processes(self, root, tracked):
+        """Take one resource sample summed over the service and its children"""
+        try:
+            current = [root] + root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return None
+        
+        sample = {
+            "processes": 0, "cpu_percent": 0.0, "rss_mb": 0.0, "uss_mb": 0.0,
+            "threads": 0, "open_fds": 0, "connections": 0, "established": 0,
+            "ctx_switches": 0
+        }
+        uss_available = True
+        
+        for proc in current:
+            # Reuse Process objects so cpu_percent measures since the previous sample
+            proc = tracked.setdefault(proc.pid, proc)
+            try:
+                with proc.oneshot():
+                    sample["cpu_percent"] += proc.cpu_percent(interval=None)
+                    sample["threads"] += proc.num_threads()
+                    ctx = proc.num_ctx_switches()
+                    sample["ctx_switches"] += ctx.voluntary + ctx.involuntary
+                    if uss_available:
+                        try:
+                            memory = proc.memory_full_info()
+                            sample["uss_mb"] += memory.uss / (1024 * 1024)
+                        except psutil.AccessDenied:
+                            uss_available = False
+                            memory = proc.memory_info()
+                    else:
+                        memory = proc.memory_info()
+                    sample["rss_mb"] += memory.rss / (1024 * 1024)
+                    sample["open_fds"] += proc.num_handles() if self.is_windows else proc.num_fds()
+                
+                get_connections = getattr(proc, "net_connections", None) or proc.connections
+                connections = get_connections(kind="inet")
+                sample["connections"] += len(connections)
+                sample["established"] += sum(1 for c in connections if c.status == psutil.CONN_ESTABLISHED)
+                sample["processes"] += 1
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                tracked.pop(proc.pid, None)
+            except psutil.AccessDenied:
+                pass
+        
+        if not uss_available:
+            sample["uss_mb"] = None
+        return sample
+    
+    def collect_metrics(self, pid, window, interval):
+        """Sample the service for `window` seconds and summarise with percentiles"""
+        root = psutil.Process(pid)
+        tracked = {}
+        
+        # Prime cpu_percent so the first real sample covers a full interval
+        self._sample_processes(root, tracked)
+        samples = []
+        started = time.time()
+        while True:
+            time.sleep(interval)
+            sample = self._sample_processes(root, tracked)
+            if sample is None:
+                break  # Exited; no samples at all means it was already gone
+            sample["time"] = time.time()
+            samples.append(sample)
+            if time.time() - started >= window:
+                break
+        
+        # Context switches are cumulative counters; report them as a rate
+        rates = []
+        for previous, current in zip(samples, samples[1:]):
+            elapsed = current["time"] - previous["time"]
+            if elapsed > 0:
+                rates.append(max(0, current["ctx_switches"] - previous["ctx_switches"]) / elapsed)
+        
+        metrics = {}
+        for name in ["cpu_percent", "rss_mb", "uss_mb", "threads", "open_fds", "connections", "established"]:
+            values = [s[name] for s in samples if s[name] is not None]
+            metrics[name] = self._summarise(values)
+        metrics["ctx_switches_per_sec"] = self._summarise(rates)
+        
+        return {
+            "service": self.service_name,
+            "pid": pid,
+            "timestamp": started,
+            "window_seconds": window,
+            "interval_seconds": interval,
+            "samples": len(samples),
+            "processes": samples[-1]["processes"] if samples else 0,
+            "metrics": metrics
+        }
+    
+    def _summarise(self, values):
+        if not values:
+            return None
+        return {
+            "p50": percentile(values, 50),
+            "p90": percentile(values, 90),
+            "p99": percentile(values, 99),
+            "max": max(values)
+        }
+    
+    def show_metrics(self, window=5.0, interval=0.5, as_json=False, watch=False):
+        """Report sampled resource usage for the running service"""
+        if interval <= 0 or window < interval:
+            print(f"❌ --window ({window:g}s) must be at least --interval ({interval:g}s), "
+                  f"and --interval must be above 0")
+            sys.exit(1)
+        pid = self._read_running_pid()
+        if pid is None:
+            print(f"❌ {self.service_name} is not running")
+            sys.exit(1)
+        
+        if not watch:
+            report = self.collect_metrics(pid, window, interval)
+            if as_json:
+                print(json.dumps(report, indent=2))
+            else:
+                self._print_metrics(report)
+            return
+        
+        # Watch mode: one line per window, with RSS drift from the first window to spot leaks
+        if not as_json:
+            print(f"👀 Watching {self.service_name} (PID: {pid}) every {window:g}s - Ctrl+C to stop")
+            print(f"{'time':>8}  {'procs':>5}  {'cpu% p50/p99':>14}  {'rss MB p99':>10}  {'rss drift':>9}  "
+                  f"{'threads':>7}  {'fds':>5}  {'conns':>5}  {'ctxsw/s':>8}")
+        baseline_rss = None
+        try:
+            while True:
+                report = self.collect_metrics(pid, window, interval)
+                if report["samples"] == 0:
+                    print(f"❌ {self.service_name} exited")
+                    sys.exit(1)
+                
+                metrics = report["metrics"]
+                rss = metrics["rss_mb"]["p99"]
+                if baseline_rss is None:
+                    baseline_rss = rss
+                report["rss_drift_mb"] = rss - baseline_rss
+                
+                if as_json:
+                    print(json.dumps(report), flush=True)
+                    continue
+                
+                ctx = metrics["ctx_switches_per_sec"]
+                print(f"{time.strftime('%H:%M:%S'):>8}  {report['processes']:>5}  "
+                      f"{metrics['cpu_percent']['p50']:>6.1f}/{metrics['cpu_percent']['p99']:<7.1f}  "
+                      f"{rss:>10.1f}  {report['rss_drift_mb']:>+9.1f}  "
+                      f"{metrics['threads']['max']:>7}  {metrics['open_fds']['max']:>5}  "
+                      f"{metrics['connections']['max']:>5}  {(ctx['p50'] if ctx else 0):>8.0f}", flush=True)
+        except KeyboardInterrupt:
+            print("")
+    
+    def _print_metrics(self, report):
+        print(f"📈 {self.service_name} resource metrics (PID: {report['pid']}, "
+              f"{report['processes']} processes, {report['samples']} samples over {report['window_seconds']:g}s)")
+        print("")
+        print(f"  {'metric':<22}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}")
+        labels = {
+            "cpu_percent": "CPU %",
+            "rss_mb": "RSS (MB)",
+            "uss_mb": "USS (MB)",
+            "threads": "Threads",
+            "open_fds": "Open handles" if self.is_windows else "Open fds",
+            "connections": "Connections",
+            "established": "  established",
+            "ctx_switches_per_sec": "Context switches/s"
+        }
+        for name, label in labels.items():
+            summary = report["metrics"].get(name)
+            if summary is None:
+                print(f"  {label:<22}{'n/a':>10}")
+                continue
+            row = "".join(f"{summary[key]:>10.1f}" for key in ["p50", "p90", "p99", "max"])
+            print(f"  {label:<22}{row}")
+    
+    def _service_port(self):
+        """Port of the running service (.env_port overrides the default PORT)"""
+        env_port_file = self.project_root / ".env_port"
+        if env_port_file.exists():
+            with open(env_port_file, 'r') as f:
+                return int(f.read().strip())
+        return int(self.port)
+    
+    async def _drive_load(self, port, endpoints, concurrency, duration, total_requests, timeout):
+        """Run `concurrency` workers, each on its own keep-alive connection"""
+        results = {path: {"latencies": [], "statuses": {}, "errors": {}, "bytes": 0} for path in endpoints}
+        deadline = time.perf_counter() + duration
+        remaining = [total_requests]
+        
+        async def worker(offset):
+            connection = KeepAliveConnection("127.0.0.1", port, timeout)
+            index = offset
+            try:
+                while True:
+                    if total_requests:
+                        if remaining[0] <= 0:
+                            break
+                        remaining[0] -= 1
+                    elif time.perf_counter() >= deadline:
+                        break
+                    
+                    path = endpoints[index % len(endpoints)]
+                    index += 1
+                    stats = results[path]
+                    started = time.perf_counter()
+                    try:
+                        status, length = await connection.request(path)
+                    except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError,
+                            asyncio.LimitOverrunError, ValueError, IndexError) as e:
+                        name = type(e).__name__
+                        stats["errors"][name] = stats["errors"].get(name, 0) + 1
+                        continue
+                    stats["latencies"].append((time.perf_counter() - started) * 1000)
+                    stats["statuses"][status] = stats["statuses"].get(status, 0) + 1
+                    stats["bytes"] += length
+            finally:
+                connection.close()
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        return results, time.perf_counter() - started
+    
+    def _latency_summary(self, latencies):
+        summary = {"p50": percentile(latencies, 50), "p90": percentile(latencies, 90),
+                   "p99": percentile(latencies, 99), "p99.9": percentile(latencies, 99.9)}
+        if latencies:
+            summary["mean"] = sum(latencies) / len(latencies)
+            summary["max"] = max(latencies)
+        return summary
+    
+    def _latency_histogram(self, latencies):
+        """Fixed millisecond buckets, comparable across runs"""
+        bounds = [0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+        counts = [0] * (len(bounds) + 1)
+        for value in latencies:
+            for i, bound in enumerate(bounds):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        labels = [f"<={b:g}ms" for b in bounds] + [f">{bounds[-1]:g}ms"]
+        return dict(zip(labels, counts))
+    
+    def _git_commit(self):
+        try:
+            result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=self.project_root,
+                                    capture_output=True, text=True, check=True)
+            return result.stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    
+    def run_benchmark(self, endpoints=None, concurrency=10, duration=10.0, total_requests=0,
+                      warmup=1.0, timeout=5.0, output=None, compare=None, port=None):
+        """Drive HTTP load at the running service and report throughput and latency"""
+        if port is None:
+            if self._read_running_pid() is None:
+                print(f"❌ {self.service_name} is not running")
+                print("💡 Start it first: python manage.py start")
+                sys.exit(1)
+            port = self._service_port()
+        endpoints = ["/health"] + [e for e in (endpoints or []) if e != "/health"]
+        
+        print(f"🏋️  Benchmarking {self.service_name} on port {port}")
+        print(f"   Endpoints: {', '.join(endpoints)}")
+        limit = f"{total_requests} requests" if total_requests else f"{duration:g}s"
+        print(f"   Concurrency: {concurrency} keep-alive connections, {limit}")
+        
+        if warmup > 0:
+            asyncio.run(self._drive_load(port, endpoints, concurrency, warmup, 0, timeout))
+        results, elapsed = asyncio.run(
+            self._drive_load(port, endpoints, concurrency, duration, total_requests, timeout))
+        
+        all_latencies = []
+        report_endpoints = {}
+        total_errors = 0
+        for path, stats in results.items():
+            latencies = stats["latencies"]
+            failed_status = sum(n for code, n in stats["statuses"].items() if code >= 400)
+            errors = failed_status + sum(stats["errors"].values())
+            attempts = len(latencies) + sum(stats["errors"].values())
+            total_errors += errors
+            all_latencies.extend(latencies)
+            report_endpoints[path] = {
+                "requests": attempts,
+                "errors": errors,
+                "error_rate": errors / attempts if attempts else 0.0,
+                "throughput_rps": attempts / elapsed if elapsed else 0.0,
+                "statuses": {str(code): n for code, n in sorted(stats["statuses"].items())},
+                "exceptions": stats["errors"],
+                "bytes": stats["bytes"],
+                "latency_ms": self._latency_summary(latencies)
+            }
+        
+        total = sum(e["requests"] for e in report_endpoints.values())
+        report = {
+            "service": self.service_name,
+            "commit": self._git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "config": {"concurrency": concurrency, "duration": duration, "requests": total_requests,
+                       "warmup": warmup, "endpoints": endpoints},
+            "elapsed_seconds": elapsed,
+            "requests": total,
+            "errors": total_errors,
+            "error_rate": total_errors / total if total else 0.0,
+            "throughput_rps": total / elapsed if elapsed else 0.0,
+            "latency_ms": self._latency_summary(all_latencies),
+            "histogram": self._latency_histogram(all_latencies),
+            "endpoints": report_endpoints
+        }
+        
+        self._print_benchmark(report)
+        
+        if output is None:
+            results_dir = self.project_root / "bench-results"
+            results_dir.mkdir(exist_ok=True)
+            output = results_dir / f"bench-{time.strftime('%Y%m%d-%H%M%S')}-{report['commit'] or 'nogit'}.json"
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Results saved to {output}")
+        
+        if compare:
+            self._compare_benchmarks(compare, report)
+        return report
+    
+    def _print_benchmark(self, report):
+        latency = report["latency_ms"]
+        print("")
+        print(f"📊 {report['requests']} requests in {report['elapsed_seconds']:.2f}s "
+              f"({report['throughput_rps']:.1f} req/s), errors: {report['errors']} "
+              f"({report['error_rate'] * 100:.2f}%)")
+        if latency["p50"] is not None:
+            print(f"   Latency ms: p50 {latency['p50']:.2f}  p90 {latency['p90']:.2f}  "
+                  f"p99 {latency['p99']:.2f}  p99.9 {latency['p99.9']:.2f}  max {latency['max']:.2f}")
+        
+        print("")
+        print("   Latency histogram:")
+        peak = max(report["histogram"].values()) or 1
+        for label, count in report["histogram"].items():
+            if count:
+                print(f"   {label:>10} {count:>8}  {'#' * max(1, int(40 * count / peak))}")
+        
+        print("")
+        for path, stats in report["endpoints"].items():
+            p99 = stats["latency_ms"]["p99"]
+            p99_text = f"{p99:.2f}ms" if p99 is not None else "n/a"
+            print(f"   {path:<30} {stats['throughput_rps']:>9.1f} req/s  p99 {p99_text:>10}  "
+                  f"errors {stats['error_rate'] * 100:.2f}%")
+        print("")
+    
+    def _compare_benchmarks(self, baseline_path, report):
+        """Print throughput and latency deltas against a previous results file"""
+        with open(baseline_path, 'r') as f:
+            baseline = json.load(f)
+        
+        print(f"🔍 Compared with {baseline_path} (commit {baseline.get('commit') or 'unknown'}):")
+        
+        def delta(new, old):
+            if new is None or not old:
+                return "n/a"
+            return f"{(new - old) / old * 100:+.1f}%"
+        
+        print(f"   throughput: {baseline['throughput_rps']:.1f} -> {report['throughput_rps']:.1f} req/s "
+              f"({delta(report['throughput_rps'], baseline['throughput_rps'])})")
+        for key in ["p50", "p90", "p99", "p99.9"]:
+            old = baseline["latency_ms"].get(key)
+            new = report["latency_ms"].get(key)
+            if old is not None and new is not None:
+                print(f"   {key:>5}: {old:.2f} -> {new:.2f} ms ({delta(new, old)})")
+        print(f"   error rate: {baseline['error_rate'] * 100:.2f}% -> {report['error_rate'] * 100:.2f}%")
+    
+    def profile_service(self, duration=30.0, requests=0, interval=0.005, top=25, all_threads=False):
+        """Run a separate service instance under the sampling profiler"""
+        if self._read_running_pid() is not None:
+            print(f"ℹ️  {self.service_name} is already running; profiling a separate instance")
+        
+        port = self.find_available_port(self.port)
+        profiles_dir = self.project_root / "profiles"
+        profiles_dir.mkdir(exist_ok=True)
+        prefix = profiles_dir / f"{self.service_name}-{time.strftime('%Y%m%d-%H%M%S')}"
+        
+        env = os.environ.copy()
+        env['PORT'] = str(port)
+        
+        limits = []
+        if duration > 0:
+            limits.append(f"{duration:g}s")
+        if requests:
+            limits.append(f"{requests} requests")
+        print(f"🔬 Profiling {self.service_name} on port {port} (until {' or '.join(limits)} - Ctrl+C to stop early)")
+        print(f"💡 Drive traffic meanwhile, e.g. python manage.py bench --port={port} --duration={duration or 10:g}")
+        
+        process = subprocess.Popen(
+            [str(self.venv_python), "-c", PROFILER_BOOTSTRAP, self.python_command, str(prefix),
+             str(duration), str(requests), str(interval), str(top), "1" if all_threads else "0"],
+            cwd=self.project_root,
+            env=env
+        )
+        try:
+            process.wait()
+        except KeyboardInterrupt:
+            # The child got the same SIGINT and is writing its reports
+            process.wait()
+        
+        report = Path(f"{prefix}.txt")
+        if not report.exists():
+            print(f"❌ Profiling failed (exit code {process.returncode})")
+            sys.exit(1)
+        
+        print("")
+        print(report.read_text())
+        print(f"🔥 Collapsed stacks: {prefix}.folded (flamegraph.pl / speedscope ready)")
+        print(f"📄 Hot functions: {report}")
+    
     def view_logs(self):
         """View service logs"""
-        log_file = self.project_root / f"{self.service_name}.log"
+        log_file = self.log_file
         
         if log_file.exists():
             try:
@@ -261,29 +1082,129 @@ class ProjectManager:
         else:
             print("⚠️  No log file found")
     
-    def clean_up(self):
-        """Clean up temporary files"""
-        print("🧹 Cleaning up temporary files...")
+    def _dir_size(self, path):
+        """Total size in bytes of the files under path (os.scandir, no symlink following)"""
+        total = 0
+        pending = [path]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            else:
+                                total += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+        return total
+    
+    def _find_cleanup_targets(self):
+        """
+        Single pruned walk of the project tree.
         
-        # Remove PID and log files
-        for pattern in ["*.pid", "*.log"]:
-            for file in self.project_root.glob(pattern):
-                file.unlink()
+        Returns (path, is_dir) pairs: root-level runtime files plus cache
+        directories anywhere, without descending into excluded directories.
+        """
+        targets = []
+        pending = [str(self.project_root)]
+        while pending:
+            current = pending.pop()
+            at_root = current == str(self.project_root)
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        
+                        if is_dir:
+                            if entry.name in self.clean_cache_dirs:
+                                targets.append((entry.path, True))
+                            elif entry.name not in self.clean_excluded_dirs:
+                                pending.append(entry.path)
+                        elif at_root and any(fnmatch.fnmatch(entry.name, p) for p in self.clean_root_patterns):
+                            targets.append((entry.path, False))
+            except OSError:
+                continue
+        return targets
+    
+    def _remove_target(self, target):
+        """Remove one entry; returns (size, None), or (0, reason) if it was skipped"""
+        path, is_dir = target
+        try:
+            size = self._dir_size(path) if is_dir else os.lstat(path).st_size
+            if is_dir:
+                failures = self._rmtree(path)
+                if failures and os.path.lexists(path):
+                    error = failures[0]
+                    reason = "permission denied" if isinstance(error, PermissionError) else str(error)
+                    return 0, f"{len(failures)} entries could not be removed ({reason})"
+            else:
+                Path(path).unlink()
+        except FileNotFoundError:
+            # Removed since the scan, e.g. by a concurrent stop
+            return 0, "already gone"
+        except PermissionError:
+            return 0, "permission denied"
+        return size, None
+    
+    def _rmtree(self, path):
+        """Remove a directory tree, carrying on past errors; returns the errors, minus vanished entries"""
+        failures = []
+        def record(error):
+            if not isinstance(error, FileNotFoundError):
+                failures.append(error)
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=lambda func, failed, error: record(error))
+        else:
+            shutil.rmtree(path, onerror=lambda func, failed, exc_info: record(exc_info[1]))
+        return failures
+    
+    def _format_bytes(self, size):
+        for unit in ["B", "KB", "MB", "GB"]:
+            if size < 1024 or unit == "GB":
+                return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+            size /= 1024
+    
+    def clean_up(self, dry_run=False):
+        """Clean up temporary files"""
+        if dry_run:
+            print("🧹 Cleanup dry run - nothing will be removed")
+        else:
+            print("🧹 Cleaning up temporary files...")
         
-        # Remove environment port file
-        (self.project_root / ".env_port").unlink(missing_ok=True)
+        targets = self._find_cleanup_targets()
         
-        # Remove Python cache directories
-        for cache_dir in self.project_root.rglob("__pycache__"):
-            import shutil
-            shutil.rmtree(cache_dir, ignore_errors=True)
+        if dry_run:
+            total = 0
+            for path, is_dir in sorted(targets):
+                try:
+                    size = self._dir_size(path) if is_dir else os.lstat(path).st_size
+                except FileNotFoundError:
+                    continue
+                total += size
+                suffix = os.sep if is_dir else ""
+                print(f"  {self._format_bytes(size):>10}  {os.path.relpath(path, self.project_root)}{suffix}")
+            print(f"ℹ️  Would remove {len(targets)} entries ({self._format_bytes(total)})")
+            return
         
-        pytest_cache = self.project_root / ".pytest_cache"
-        if pytest_cache.exists():
-            import shutil
-            shutil.rmtree(pytest_cache, ignore_errors=True)
+        # Removal is I/O bound, so a thread pool overlaps the filesystem calls
+        total = 0
+        skipped = []
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            for (path, _), (size, reason) in zip(targets, executor.map(self._remove_target, targets)):
+                total += size
+                if reason is not None:
+                    skipped.append((path, reason))
         
-        print("✅ Cleanup complete")
+        for path, reason in sorted(skipped):
+            print(f"⚠️  Skipped {os.path.relpath(path, self.project_root)}: {reason}")
+        removed = len(targets) - len(skipped)
+        print(f"✅ Cleanup complete: removed {removed} entries ({self._format_bytes(total)})")
 
 def main():
     """Main entry point"""
@@ -306,11 +1227,50 @@ def main():
         time.sleep(1)
         manager.start_service()
     elif command in ['status']:
-        manager.check_status()
+        options = parse_options(sys.argv[2:])
+        if options.get("metrics") or options.get("watch"):
+            require_values(options, "window", "interval")
+            manager.show_metrics(
+                window=float(options.get("window", 5)),
+                interval=float(options.get("interval", 0.5)),
+                as_json=bool(options.get("json")),
+                watch=bool(options.get("watch"))
+            )
+        else:
+            manager.check_status()
+    elif command in ['bench']:
+        options = parse_options(sys.argv[2:])
+        require_values(options, "concurrency", "duration", "requests", "warmup", "timeout",
+                       "output", "compare", "port")
+        endpoints = [e for e in str(options.get("endpoints", "")).split(",") if e and e != "True"]
+        manager.run_benchmark(
+            endpoints=endpoints,
+            concurrency=int(options.get("concurrency", 10)),
+            duration=float(options.get("duration", 10)),
+            total_requests=int(options.get("requests", 0)),
+            warmup=float(options.get("warmup", 1)),
+            timeout=float(options.get("timeout", 5)),
+            output=options.get("output"),
+            compare=options.get("compare"),
+            port=int(options["port"]) if "port" in options else None
+        )
+    elif command in ['profile']:
+        options = parse_options(sys.argv[2:])
+        requests = int(options.get("requests", 0))
+        manager.profile_service(
+            duration=float(options.get("duration", 0 if requests else 30)),
+            requests=requests,
+            interval=float(options.get("interval", 0.005)),
+            top=int(options.get("top", 25)),
+            all_threads=bool(options.get("all_threads"))
+        )
     elif command in ['logs']:
         manager.view_logs()
     elif command in ['clean']:
-        manager.clean_up()
+        options = parse_options(sys.argv[2:])
+        manager.clean_up(dry_run=bool(options.get("dry_run")))
+    elif command == '_log-pump':
+        manager.run_log_pump()
     elif command in ['help', '--help', '-h']:
         manager.show_help()
     else:
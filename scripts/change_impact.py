@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Change-impact test selection
+
+Builds a static import graph of modules/, tests/ and the top-level Python
+files with ast (cached by file hash), then selects the tests that can reach
+files changed against a base branch. Used by run-tests.py --impact.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+CACHE_FILE = ".test-impact-cache.json"
+CACHE_VERSION = 1
+GRAPH_DIRS = ["modules", "tests"]
+
+# Changes to these affect test collection or the environment as a whole
+GLOBAL_FILES = {"conftest.py", "pytest.ini", "setup.cfg", "tox.ini", "pyproject.toml"}
+GLOBAL_PREFIXES = ("requirements",)
+
+# Changes no test can observe; any other file outside the import graph runs the full suite
+HARMLESS_SUFFIXES = (".md", ".rst")
+HARMLESS_NAMES = {"LICENSE", ".gitignore"}
+# The test tooling's own caches, in case a project doesn't ignore them
+TOOL_FILES = {CACHE_FILE, ".test-results-cache.json", ".test-durations.json", ".test-history.sqlite",
+              ".coverage-index.json"}
+
+def git_lines(args, cwd):
+    """Run a git command (no shell) and return its output lines, or None on failure"""
+    try:
+        result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return [line for line in result.stdout.splitlines() if line]
+
+def changed_files(project_root, base="main"):
+    """Files changed against the merge-base with `base`, including uncommitted and untracked files"""
+    merge_base = git_lines(["merge-base", base, "HEAD"], project_root)
+    if not merge_base:
+        return None
+
+    diff = git_lines(["diff", "--name-only", merge_base[0]], project_root)
+    untracked = git_lines(["ls-files", "--others", "--exclude-standard"], project_root)
+    if diff is None or untracked is None:
+        return None
+    return set(diff) | set(untracked)
+
+def graph_files(project_root):
+    """Python files that take part in the import graph, as posix paths"""
+    files = [p.name for p in project_root.glob("*.py")]
+    for directory in GRAPH_DIRS:
+        root = project_root / directory
+        if root.exists():
+            files.extend(p.relative_to(project_root).as_posix() for p in root.rglob("*.py"))
+    return sorted(files)
+
+def module_name(path):
+    """Dotted module name for a posix path (package __init__ maps to the package)"""
+    parts = path[:-3].split("/")
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+def extract_imports(source, path):
+    """Absolute dotted names imported by a module (relative imports resolved)"""
+    tree = ast.parse(source, filename=path)
+    package = module_name(path).split(".")
+    if not path.endswith("__init__.py"):
+        package = package[:-1]
+
+    imports = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package[:len(package) - node.level + 1] if node.level > 1 else package
+                prefix = ".".join(base + ([node.module] if node.module else []))
+            else:
+                prefix = node.module or ""
+            if prefix:
+                imports.add(prefix)
+            # "from pkg import name" may import the submodule pkg.name
+            imports.update(f"{prefix}.{alias.name}" if prefix else alias.name for alias in node.names)
+    return sorted(imports)
+
+def load_cache(project_root):
+    try:
+        with open(project_root / CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        if cache.get("version") == CACHE_VERSION:
+            return cache["files"]
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+    return {}
+
+def save_cache(project_root, files):
+    path = project_root / CACHE_FILE
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, 'w') as f:
+        json.dump({"version": CACHE_VERSION, "files": files}, f)
+    os.replace(tmp, path)
+
+def build_import_graph(project_root):
+    """
+    Map each graph file to the graph files it imports.
+
+    Files are only re-parsed when their content hash changes. Returns None
+    if any file fails to parse, since the graph can't be trusted then.
+    """
+    return scan_graph(project_root)[0]
+
+def scan_graph(project_root):
+    """Return (graph, content hashes) for the graph files, or (None, None) on a parse error"""
+    cached = load_cache(project_root)
+    entries = {}
+    for path in graph_files(project_root):
+        data = (project_root / path).read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        entry = cached.get(path)
+        if entry is None or entry["hash"] != digest:
+            try:
+                entry = {"hash": digest, "imports": extract_imports(data, path)}
+            except SyntaxError:
+                return None, None
+        entries[path] = entry
+    save_cache(project_root, entries)
+
+    modules = {module_name(path): path for path in entries}
+    graph = {}
+    for path, entry in entries.items():
+        graph[path] = {modules[name] for name in entry["imports"] if name in modules and modules[name] != path}
+    return graph, {path: entry["hash"] for path, entry in entries.items()}
+
+def dependency_closure(graph, path):
+    """Every graph file reachable from path through imports (path excluded)"""
+    seen = set()
+    pending = list(graph.get(path, ()))
+    while pending:
+        current = pending.pop()
+        if current not in seen:
+            seen.add(current)
+            pending.extend(graph.get(current, ()))
+    seen.discard(path)
+    return seen
+
+def is_test_entry(path):
+    name = path.rsplit("/", 1)[-1]
+    return path.startswith("tests/") and (name.startswith("test_") or name == "quick_test.py")
+
+def select_tests(project_root, base="main"):
+    """
+    Return (test_files, reason). test_files is None when the full suite must run.
+    """
+    changed = changed_files(project_root, base)
+    if changed is None:
+        return None, f"could not diff against '{base}'"
+
+    graph = build_import_graph(project_root)
+    if graph is None:
+        return None, "import graph could not be built (syntax error)"
+
+    changed_sources = set()
+    for path in changed:
+        name = path.rsplit("/", 1)[-1]
+        if name in GLOBAL_FILES or name.startswith(GLOBAL_PREFIXES):
+            return None, f"{path} affects the whole suite"
+        if path in graph:
+            changed_sources.add(path)
+        elif name in HARMLESS_NAMES or name in TOOL_FILES or name.endswith(HARMLESS_SUFFIXES):
+            continue
+        elif not (project_root / path).exists():
+            # A deleted module invalidates anything that imported it
+            return None, f"{path} was removed"
+        else:
+            # Templates, static files, config and scripts can be read by anything; imports can't tell us who
+            return None, f"{path} is not in the import graph"
+
+    # Walk the reverse graph from the changed files to everything that reaches them
+    importers = {path: set() for path in graph}
+    for path, imports in graph.items():
+        for target in imports:
+            importers[target].add(path)
+
+    impacted = set(changed_sources)
+    pending = list(changed_sources)
+    while pending:
+        for importer in importers[pending.pop()]:
+            if importer not in impacted:
+                impacted.add(importer)
+                pending.append(importer)
+
+    tests = sorted(path for path in impacted if is_test_entry(path))
+    return tests, f"{len(changed_sources)} changed source files reach {len(tests)} test files"
+
+def main():
+    base = sys.argv[1] if len(sys.argv) > 1 else "main"
+    tests, reason = select_tests(Path(__file__).parent.parent, base)
+    print(f"ℹ️  {reason}")
+    if tests is None:
+        print("🧪 Full suite required")
+    else:
+        for test in tests:
+            print(test)
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,30 @@ check-test-coverage.py: Enforce 4-phase test coverage for business logic feature
 
 Fails if any backend function or API endpoint is missing from any test phase.
 Automatically excludes utility functions that don't need comprehensive testing.
+
+With --runtime, also runs the tests under a tracer (scripts/coverage_trace.py)
+and fails if a required function or endpoint never actually executed during
+its phase's tests.
 """
 import sys
 import os
 import ast
 import re
+import json
+import hashlib
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
 # --- Configuration ---
 MODULES_DIR = 'modules'
 TEST_SUITE = 'tests/test_suite.py'
 API_FILE = '{{MAIN_FILE}}'  # Will be replaced in generated project
 
+# Infrastructure modules shipped with the service template; each is covered
+# by its own tests/test_<module>.py, not by the 4-phase business-logic suite
+EXCLUDE_MODULES = ['database.py', 'jobs.py', 'metrics.py', 'response_cache.py']
+
 # Functions matching these patterns are excluded from mandatory testing
 EXCLUDE_PATTERNS = [
     '__init__',
@@ -50,74 +63,191 @@ def should_exclude_function(func_name):
     """Exclude utility functions that don't need comprehensive testing"""
     return any(pattern in func_name for pattern in EXCLUDE_PATTERNS)
 
-def get_functions_from_module(module_path):
-    with open(module_path, 'r') as f:
-        content = f.read()
-    # Sanitize content to handle template strings before AST parsing
-    sanitized_content = sanitize_for_parsing(content)
+# --- Index ---
+# Every file is parsed once and the answers to all four phase queries are
+# kept in a sidecar cache keyed by mtime/size, then content hash.
+
+INDEX_CACHE = '.coverage-index.json'
+INDEX_VERSION = 2
+PARALLEL_THRESHOLD = 8  # below this many stale files a process pool costs more than it saves
+TEST_DICTS = ['backend_tests', 'api_tests', 'contract_tests', 'frontend_tests']
+
+def _route_paths(decorator):
+    """'/api/...' paths from an @app.route(...) decorator node"""
+    if (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Attribute)
+            and decorator.func.attr == 'route' and decorator.args
+            and isinstance(decorator.args[0], ast.Constant) and isinstance(decorator.args[0].value, str)):
+        path = decorator.args[0].value
+        if path.startswith('/api/'):
+            return [path]
+    return []
+
+def index_source(path, content):
+    """
+    Extract functions, API routes and test dict keys from one file in a
+    single ast pass. Falls back to regexes over sanitized text when the
+    file isn't valid Python (e.g. unreplaced template syntax).
+    """
+    entry = {'functions': [], 'routes': {}, 'dict_keys': {}}
     try:
-        tree = ast.parse(sanitized_content, filename=module_path)
-        all_functions = [n.name for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]
-        # Filter out utility functions that don't need comprehensive testing
-        return [f for f in all_functions if not should_exclude_function(f)]
+        tree = ast.parse(content, filename=path)
     except SyntaxError as e:
-        print(f"⚠️  Warning: Could not parse {module_path}: {e}")
-        return []
+        sanitized = sanitize_for_parsing(content)
+        for m in re.finditer(r'@app\.route\(["\'](/api/[^"\']*)', sanitized):
+            entry['routes'][m.group(1)] = None
+        for name in TEST_DICTS:
+            m = re.search(rf'{name}\s*=\s*{{(.*?)}}', content, re.DOTALL)
+            if m:
+                entry['dict_keys'][name] = re.findall(r'"([^"]+)":', m.group(1))
+        entry['error'] = str(e)
+        return entry
 
-def get_api_endpoints(api_path):
-    endpoints = set()
-    if not os.path.exists(api_path):
-        return endpoints
-    
-    with open(api_path, 'r') as f:
-        content = f.read()
-    
-    # Sanitize content before regex parsing
-    sanitized_content = sanitize_for_parsing(content)
-    
-    for line in sanitized_content.split('\n'):
-        m = re.search(r'@app\.route\(["\'](/api/[^"\']*)', line)
-        if m:
-            endpoints.add(m.group(1))
-    return endpoints
-
-def get_test_dict_keys(test_path, dict_name):
-    with open(test_path, 'r') as f:
-        content = f.read()
-    m = re.search(rf'{dict_name}\s*=\s*{{(.*?)}}', content, re.DOTALL)
-    if not m:
-        return set()
-    dict_body = m.group(1)
-    keys = re.findall(r'"([^"]+)":', dict_body)
-    return set(keys)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            entry['functions'].append(node.name)
+            for decorator in node.decorator_list:
+                for route in _route_paths(decorator):
+                    entry['routes'][route] = node.name
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)) and isinstance(node.value, ast.Dict):
+            # backend_tests = {...} or backend_tests: dict = {...}
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name) and target.id in TEST_DICTS:
+                    entry['dict_keys'][target.id] = [
+                        k.value for k in node.value.keys
+                        if isinstance(k, ast.Constant) and isinstance(k.value, str)
+                    ]
+    return entry
+
+def index_file(path):
+    """Worker: read, hash and index one file (top-level so a process pool can pickle it)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return path, hashlib.sha256(data).hexdigest(), index_source(path, data.decode('utf-8', errors='replace'))
+
+def load_index_cache():
+    try:
+        with open(INDEX_CACHE, 'r') as f:
+            cache = json.load(f)
+        if cache.get('version') == INDEX_VERSION:
+            return cache['files']
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+    return {}
+
+def save_index_cache(files):
+    tmp = INDEX_CACHE + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({'version': INDEX_VERSION, 'files': files}, f)
+    os.replace(tmp, INDEX_CACHE)
+
+def build_index(paths):
+    """Index paths, reusing cache entries whose mtime/size or content hash still match"""
+    cached = load_index_cache()
+    index = {}
+    stale = []
+    for path in paths:
+        st = os.stat(path)
+        entry = cached.get(path)
+        if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+            index[path] = entry
+        else:
+            stale.append((path, st, entry))
+
+    if len(stale) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(index_file, [path for path, _, _ in stale]))
+    else:
+        results = [index_file(path) for path, _, _ in stale]
+
+    for (path, st, old), (_, digest, data) in zip(stale, results):
+        # Touched but unchanged files keep their old index data
+        if old and old['hash'] == digest:
+            data = old['data']
+        index[path] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'hash': digest, 'data': data}
+
+    if stale or set(cached) != set(index):
+        save_index_cache(index)
+    return {path: entry['data'] for path, entry in index.items()}
+
+# --- Runtime tracing ---
+
+def run_traced_tests(traced_files):
+    """Run the test suite under the coverage_trace plugin; returns {phase: {file: [functions]}}"""
+    scripts_dir = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory(prefix='coverage-trace-') as tmp:
+        output = os.path.join(tmp, 'trace.json')
+        env = os.environ.copy()
+        env['COVERAGE_TRACE_OUTPUT'] = output
+        env['COVERAGE_TRACE_FILES'] = os.pathsep.join(os.path.abspath(p) for p in traced_files)
+        env['PYTHONPATH'] = os.pathsep.join(p for p in [scripts_dir, env.get('PYTHONPATH')] if p)
+
+        print("🔬 Running tests under the runtime tracer...")
+        result = subprocess.run([sys.executable, '-m', 'pytest', '-q', '-p', 'coverage_trace', 'tests/'], env=env)
+        if result.returncode not in (0, 1):
+            print(f"⚠️  pytest exited with code {result.returncode}")
+        try:
+            with open(output, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+def runtime_errors(executed, module_paths, backend_funcs, routes):
+    """Requirements that were declared but never executed during their phase"""
+    def ran(phase, paths):
+        names = set()
+        for path in paths:
+            names.update(executed.get(phase, {}).get(os.path.abspath(path), []))
+        return names
+
+    errors = []
+    missing = backend_funcs - ran('backend', module_paths)
+    if missing:
+        errors.append(f"Backend functions never executed by backend tests: {sorted(missing)}")
+
+    for phase in ['api', 'contract', 'frontend']:
+        views = ran(phase, [API_FILE])
+        missing = sorted(route for route, view in routes.items() if view is not None and view not in views)
+        if missing:
+            errors.append(f"Endpoints never executed by {phase} tests: {missing}")
+
+    unverifiable = sorted(route for route, view in routes.items() if view is None)
+    if unverifiable:
+        print(f"⚠️  Could not map endpoints to view functions (unparseable {API_FILE}): {unverifiable}")
+    return errors
 
 # --- Main check ---
 def main():
+    module_paths = sorted(
+        os.path.join(MODULES_DIR, fname) for fname in os.listdir(MODULES_DIR)
+        if fname.endswith('.py') and fname not in EXCLUDE_MODULES
+    )
+    paths = module_paths + [p for p in (API_FILE, TEST_SUITE) if os.path.exists(p)]
+    index = build_index(paths)
+
     # Backend functions (excluding utility functions)
     all_backend_funcs = set()
     excluded_funcs = set()
     
-    for fname in os.listdir(MODULES_DIR):
-        if fname.endswith('.py'):
-            module_path = os.path.join(MODULES_DIR, fname)
-            with open(module_path, 'r') as f:
-                tree = ast.parse(f.read(), filename=module_path)
-            all_funcs = [n.name for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]
-            
-            for func in all_funcs:
-                if should_exclude_function(func):
-                    excluded_funcs.add(func)
-                else:
-                    all_backend_funcs.add(func)
+    for module_path in module_paths:
+        entry = index[module_path]
+        if 'error' in entry:
+            print(f"⚠️  Warning: Could not parse {module_path}: {entry['error']}")
+        for func in entry['functions']:
+            if should_exclude_function(func):
+                excluded_funcs.add(func)
+            else:
+                all_backend_funcs.add(func)
     
     # API endpoints
-    api_endpoints = get_api_endpoints(API_FILE)
+    api_endpoints = set(index[API_FILE]['routes']) if API_FILE in index else set()
     
     # Test suite dicts
-    backend_tests = get_test_dict_keys(TEST_SUITE, 'backend_tests')
-    api_tests = get_test_dict_keys(TEST_SUITE, 'api_tests')
-    contract_tests = get_test_dict_keys(TEST_SUITE, 'contract_tests')
-    frontend_tests = get_test_dict_keys(TEST_SUITE, 'frontend_tests')
+    test_keys = index[TEST_SUITE]['dict_keys'] if TEST_SUITE in index else {}
+    backend_tests = set(test_keys.get('backend_tests', []))
+    api_tests = set(test_keys.get('api_tests', []))
+    contract_tests = set(test_keys.get('contract_tests', []))
+    frontend_tests = set(test_keys.get('frontend_tests', []))
     
     # Check coverage
     missing_backend = all_backend_funcs - backend_tests
@@ -133,6 +263,15 @@ def main():
         print()
     
     errors = []
+    if '--runtime' in sys.argv:
+        executed = run_traced_tests(module_paths + [API_FILE])
+        if executed is None:
+            errors.append("Runtime trace produced no data (did pytest start?)")
+        else:
+            routes = index[API_FILE]['routes'] if API_FILE in index else {}
+            errors.extend(runtime_errors(executed, module_paths, all_backend_funcs, routes))
+        print()
+
     if missing_backend:
         errors.append(f"Missing backend tests for: {sorted(missing_backend)}")
     if missing_api:
@@ -0,0 +1,127 @@
+"""
+Runtime coverage tracer (pytest plugin)
+
+Loaded by check-test-coverage --runtime via `pytest -p coverage_trace`.
+Records which functions in the project's files actually execute while the
+tests of each phase run, and writes them as JSON to COVERAGE_TRACE_OUTPUT.
+
+A test's phase comes from a `backend`/`api`/`contract`/`frontend` marker,
+or failing that from the phase name as a whole word of its path or test
+name (tests/api/..., test_api_health, TestContract...), never a substring
+(test_rapid_* is not an API test).
+
+On Python 3.12+ this uses sys.monitoring PY_START events; every code
+object is reported at most once per phase and code outside the project is
+disabled after its first call, so steady-state overhead is close to zero.
+Older interpreters fall back to a call-only sys.settrace hook (no line
+events) that filters on filename.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+
+import pytest
+
+PHASES = ["backend", "api", "contract", "frontend"]
+# Words of a node id: path components and snake_case / CamelCase parts, parametrize ids dropped
+NODE_WORD = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+
+class PhaseTracer:
+    def __init__(self, project_files):
+        self.project_files = set(project_files)
+        self.phase = None
+        self.executed = {}  # phase -> {filename: set(function names)}
+        self._seen = set()
+        self._tool = None
+
+    def set_phase(self, phase):
+        if phase == self.phase:
+            return
+        self.phase = phase
+        self._seen = set()
+        if hasattr(sys, "monitoring") and self._tool is not None:
+            # Re-arm code objects disabled while the previous phase ran
+            sys.monitoring.restart_events()
+
+    def _record(self, code):
+        functions = self.executed.setdefault(self.phase, {}).setdefault(code.co_filename, set())
+        functions.add(code.co_name)
+
+    # --- sys.monitoring (3.12+) ---
+
+    def _on_start(self, code, offset):
+        if self.phase is not None and code.co_filename in self.project_files:
+            self._record(code)
+        return sys.monitoring.DISABLE
+
+    # --- settrace fallback ---
+
+    def _on_trace(self, frame, event, arg):
+        if event == "call" and self.phase is not None:
+            code = frame.f_code
+            if code not in self._seen and code.co_filename in self.project_files:
+                self._seen.add(code)
+                self._record(code)
+        return None
+
+    def start(self):
+        if hasattr(sys, "monitoring"):
+            for tool in (sys.monitoring.COVERAGE_ID, sys.monitoring.OPTIMIZER_ID):
+                if sys.monitoring.get_tool(tool) is None:
+                    self._tool = tool
+                    break
+        if self._tool is not None:
+            sys.monitoring.use_tool_id(self._tool, "check-test-coverage")
+            sys.monitoring.register_callback(self._tool, sys.monitoring.events.PY_START, self._on_start)
+            sys.monitoring.set_events(self._tool, sys.monitoring.events.PY_START)
+        else:
+            threading.settrace(self._on_trace)
+            sys.settrace(self._on_trace)
+
+    def stop(self):
+        if self._tool is not None:
+            sys.monitoring.set_events(self._tool, 0)
+            sys.monitoring.register_callback(self._tool, sys.monitoring.events.PY_START, None)
+            sys.monitoring.free_tool_id(self._tool)
+        else:
+            sys.settrace(None)
+            threading.settrace(None)
+
+def phase_of(item):
+    for phase in PHASES:
+        if item.get_closest_marker(phase) is not None:
+            return phase
+    words = {word.lower() for word in NODE_WORD.findall(item.nodeid.split("[", 1)[0])}
+    for phase in PHASES:
+        if phase in words:
+            return phase
+    return "unphased"
+
+_tracer = None
+
+def pytest_configure(config):
+    global _tracer
+    for phase in PHASES:
+        config.addinivalue_line("markers", f"{phase}: {phase} phase of the 4-phase coverage requirement")
+    files = [os.path.abspath(p) for p in os.environ.get("COVERAGE_TRACE_FILES", "").split(os.pathsep) if p]
+    _tracer = PhaseTracer(files)
+    _tracer.start()
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    _tracer.set_phase(phase_of(item))
+    yield
+
+def pytest_sessionfinish(session, exitstatus):
+    _tracer.stop()
+    output = os.environ.get("COVERAGE_TRACE_OUTPUT")
+    if output:
+        data = {
+            phase: {filename: sorted(names) for filename, names in files.items()}
+            for phase, files in _tracer.executed.items()
+        }
+        with open(output, "w") as f:
+            json.dump(data, f)
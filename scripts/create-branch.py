@@ -8,15 +8,13 @@ import sys
 import subprocess
 from pathlib import Path
 
+from git_workflow import GitError, GitWorkflow, fail
+
 def run_command(command, cwd=None):
-    """Run a command and handle errors"""
-    try:
-        result = subprocess.run(command, shell=True, cwd=cwd, check=True, 
-                              capture_output=True, text=True)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Command failed: {command}")
-        print(f"Error: {e.stderr}")
+    """Run a command (no shell), streaming its output, and exit if it fails"""
+    result = subprocess.run(command, cwd=cwd)
+    if result.returncode != 0:
+        print(f"❌ Command failed: {' '.join(str(part) for part in command)}")
         sys.exit(1)
 
 def main():
@@ -36,22 +34,36 @@ def main():
     print("")
     
     project_root = Path(__file__).parent.parent
+    git = GitWorkflow(project_root)
     
-    # Ensure we're on main and up to date
-    print("📥 Pulling latest changes...")
-    run_command("git checkout main", cwd=project_root)
-    run_command("git pull origin main", cwd=project_root)
-    
-    # Create and switch to feature branch
-    print(f"🆕 Creating feature branch: {branch_name}")
-    run_command(f"git checkout -b {branch_name}", cwd=project_root)
+    try:
+        # Ensure we're on main and up to date
+        print("📥 Pulling latest changes...")
+        with git.step("status"):
+            status = git.status()
+        if status.branch != "main":
+            with git.step("checkout main"):
+                git.run("checkout", "-q", "main")
+        with git.step("pull"):
+            git.run("pull", "-q", "origin", "main")
+        
+        # Create and switch to feature branch
+        print(f"🆕 Creating feature branch: {branch_name}")
+        with git.step("create branch"):
+            git.run("checkout", "-q", "-b", branch_name)
+    except GitError as e:
+        git.print_timings()
+        fail(e)
     
     # Update roadmap to mark branch as in progress
     update_roadmap_script = project_root / "scripts" / "update-roadmap.py"
     if update_roadmap_script.exists():
-        run_command(f"python {update_roadmap_script} \"{branch_name}\" \"{commit_message}\" \"in-progress\"", 
-                   cwd=project_root)
+        with git.step("roadmap"):
+            run_command([sys.executable, str(update_roadmap_script), branch_name, commit_message, "in-progress"],
+                        cwd=project_root)
     
+    print("")
+    git.print_timings()
     print("")
     print("✅ Development branch ready!")
     print("👨‍💻 Make your changes, then when ready, use:")
@@ -0,0 +1,113 @@
+"""
+Git workflow layer for merge-to-main.py and create-branch.py
+
+Runs git directly (no shell), answers read-only questions (branch name,
+upstream, ahead/behind, staged/unstaged/untracked changes) with a single
+`git status --porcelain=v2 --branch` call, and times every step so the
+workflow's overhead can be seen at the end of a run.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+# Number of space-separated fields before the path in each porcelain v2 entry kind
+PATH_FIELD = {"1 ": 8, "2 ": 9, "u ": 10}
+
+class GitError(Exception):
+    """A git command exited non-zero"""
+
+    def __init__(self, args, returncode, stderr):
+        self.args_list = args
+        self.returncode = returncode
+        self.stderr = stderr
+        super().__init__(f"git {' '.join(args)} exited with {returncode}")
+
+class RepoStatus:
+    """Parsed `git status --porcelain=v2 --branch` output"""
+
+    def __init__(self, output):
+        self.branch = None
+        self.upstream = None
+        self.ahead = 0
+        self.behind = 0
+        self.staged = []
+        self.unstaged = []
+        self.untracked = []
+
+        for line in output.splitlines():
+            if line.startswith("# branch.head "):
+                head = line[len("# branch.head "):]
+                self.branch = None if head == "(detached)" else head
+            elif line.startswith("# branch.upstream "):
+                self.upstream = line[len("# branch.upstream "):]
+            elif line.startswith("# branch.ab "):
+                ahead, behind = line[len("# branch.ab "):].split()
+                self.ahead, self.behind = int(ahead), -int(behind)
+            elif line[:2] in PATH_FIELD:
+                kind, xy = line[0], line[2:4]
+                # Paths may contain spaces, so split off exactly the fixed fields
+                path = line.split(" ", PATH_FIELD[line[:2]])[-1].split("\t")[0]
+                if kind == "u" or xy[1] != ".":
+                    self.unstaged.append(path)
+                if kind != "u" and xy[0] != ".":
+                    self.staged.append(path)
+            elif line.startswith("? "):
+                self.untracked.append(line[2:])
+
+    @property
+    def clean(self):
+        return not (self.staged or self.unstaged or self.untracked)
+
+class GitWorkflow:
+    def __init__(self, project_root):
+        self.project_root = project_root
+        self.timings = []  # (label, seconds, git processes)
+        self.spawns = 0
+
+    def run(self, *args, check=True):
+        """Run git with args; returns stdout, or the CompletedProcess when check=False"""
+        self.spawns += 1
+        # Read-only queries shouldn't take optional locks (e.g. index refresh)
+        env = dict(os.environ, GIT_OPTIONAL_LOCKS="0") if args[0] == "status" else None
+        result = subprocess.run(["git", *args], cwd=self.project_root, env=env,
+                                capture_output=True, text=True)
+        if not check:
+            return result
+        if result.returncode != 0:
+            raise GitError(list(args), result.returncode, result.stderr.strip())
+        return result.stdout.strip()
+
+    def status(self):
+        """Branch, upstream, ahead/behind and changes in one git call"""
+        return RepoStatus(self.run("status", "--porcelain=v2", "--branch", "--untracked-files=all"))
+
+    def has_staged_changes(self):
+        return self.run("diff", "--cached", "--quiet", check=False).returncode == 1
+
+    @contextmanager
+    def step(self, label):
+        """Time a workflow step (wall clock and git processes spawned)"""
+        start, spawns = time.perf_counter(), self.spawns
+        try:
+            yield
+        finally:
+            self.timings.append((label, time.perf_counter() - start, self.spawns - spawns))
+
+    def print_timings(self):
+        if not self.timings:
+            return
+        total = sum(seconds for _, seconds, _ in self.timings)
+        width = max(len(label) for label, _, _ in self.timings)
+        print("⏱️  Step timings:")
+        for label, seconds, spawns in self.timings:
+            print(f"   {label:<{width}}  {seconds * 1000:8.1f} ms  ({spawns} git)")
+        print(f"   {'total':<{width}}  {total * 1000:8.1f} ms  ({self.spawns} git)")
+
+def fail(error):
+    """Report a GitError the way the workflow scripts always have, then exit"""
+    print(f"❌ Command failed: git {' '.join(error.args_list)}")
+    print(f"Error: {error.stderr}")
+    sys.exit(1)
@@ -8,32 +8,60 @@ import sys
 import subprocess
 from pathlib import Path
 
+from git_workflow import GitError, GitWorkflow, fail
+
 def run_command(command, cwd=None):
-    """Run a command and handle errors"""
-    try:
-        result = subprocess.run(command, shell=True, cwd=cwd, check=True, 
-                              capture_output=True, text=True)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Command failed: {command}")
-        print(f"Error: {e.stderr}")
+    """Run a command (no shell), streaming its output, and exit if it fails"""
+    result = subprocess.run(command, cwd=cwd)
+    if result.returncode != 0:
+        print(f"❌ Command failed: {' '.join(str(part) for part in command)}")
         sys.exit(1)
 
 def main():
-    if len(sys.argv) != 2:
-        print("❌ Usage: python merge-to-main.py <commit-message>")
+    flags = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    
+    jobs_flags = [flag for flag in flags if flag.startswith("--jobs=")]
+    jobs = jobs_flags[-1].partition("=")[2] if jobs_flags else "0"
+    
+    if len(args) != 1 or set(flags) - {"--impact"} - set(jobs_flags) or not jobs.isdigit():
+        print("❌ Usage: python merge-to-main.py <commit-message> [--impact] [--jobs=N]")
+        print("")
+        print("  --impact  Only run tests affected by changes against main")
+        print("  --jobs=N  Parallel test processes (default 0: one per CPU; 1 runs serially)")
         print("")
         print("Examples:")
         print("  python merge-to-main.py \"Add user authentication: JWT-based login system\"")
-        print("  python merge-to-main.py \"Fix: API endpoint validation and error handling\"")
+        print("  python merge-to-main.py \"Fix: API endpoint validation and error handling\" --impact")
+        print("  python merge-to-main.py \"Tune request metrics\" --jobs=1")
         sys.exit(1)
     
-    commit_message = sys.argv[1]
+    commit_message = args[0]
+    impact_only = "--impact" in flags
     project_root = Path(__file__).parent.parent
+    git = GitWorkflow(project_root)
     
-    # Get current branch name
-    current_branch = run_command("git branch --show-current", cwd=project_root)
+    try:
+        merge(git, project_root, commit_message, impact_only, jobs)
+    except GitError as e:
+        git.print_timings()
+        fail(e)
     
+    print("")
+    git.print_timings()
+    print("")
+    print("✅ Feature successfully merged to main!")
+    print("🎉 Development workflow complete")
+
+def merge(git, project_root, commit_message, impact_only, jobs):
+    # Branch name and pending changes in a single status call
+    with git.step("status"):
+        status = git.status()
+    current_branch = status.branch
+    
+    if current_branch is None:
+        print("❌ HEAD is detached. Check out your feature branch first.")
+        sys.exit(1)
     if current_branch == "main":
         print("❌ Already on main branch. Create a feature branch first.")
         sys.exit(1)
@@ -44,55 +72,63 @@ def main():
     
     # Run tests before merging
     print("🧪 Running tests...")
-    test_script = project_root / "scripts" / "run-tests.py"
-    if test_script.exists():
-        run_command(f"python {test_script}", cwd=project_root)
-    else:
-        # Fallback to original shell script
-        test_script_sh = project_root / "scripts" / "run-tests.sh"
-        if test_script_sh.exists():
-            run_command(f"bash {test_script_sh}", cwd=project_root)
+    with git.step("tests"):
+        test_script = project_root / "scripts" / "run-tests.py"
+        if test_script.exists():
+            command = [sys.executable, str(test_script), "--jobs", jobs]
+            if impact_only:
+                command.append("--impact")
+            run_command(command, cwd=project_root)
+        else:
+            # Fallback to original shell script
+            test_script_sh = project_root / "scripts" / "run-tests.sh"
+            if test_script_sh.exists():
+                run_command(["bash", str(test_script_sh)], cwd=project_root)
     
-    # Stage all changes
-    print("📦 Staging changes...")
-    run_command("git add .", cwd=project_root)
-    
-    # Check if there are changes to commit
-    try:
-        run_command("git diff --staged --exit-code", cwd=project_root)
+    if status.clean:
         print("ℹ️  No changes to commit")
-    except subprocess.CalledProcessError:
-        # There are changes to commit
-        print("💾 Committing changes...")
-        run_command(f"git commit -m \"{commit_message}\"", cwd=project_root)
+    else:
+        # Stage all changes
+        print("📦 Staging changes...")
+        with git.step("stage"):
+            git.run("add", "-A")
+            staged = git.has_staged_changes()
+        
+        if staged:
+            print("💾 Committing changes...")
+            with git.step("commit"):
+                git.run("commit", "-q", "-m", commit_message)
+        else:
+            print("ℹ️  No changes to commit")
     
     # Switch to main and merge
     print("🔄 Switching to main branch...")
-    run_command("git checkout main", cwd=project_root)
+    with git.step("checkout main"):
+        git.run("checkout", "-q", "main")
     
     print("📥 Pulling latest changes...")
-    run_command("git pull origin main", cwd=project_root)
+    with git.step("pull"):
+        git.run("pull", "-q", "origin", "main")
     
     print(f"🔀 Merging {current_branch}...")
-    run_command(f"git merge {current_branch} --no-ff -m \"Merge {current_branch}: {commit_message}\"", 
-               cwd=project_root)
+    with git.step("merge"):
+        git.run("merge", "-q", current_branch, "--no-ff", "-m", f"Merge {current_branch}: {commit_message}")
     
     print("🚀 Pushing to main...")
-    run_command("git push origin main", cwd=project_root)
+    with git.step("push"):
+        git.run("push", "-q", "origin", "main")
     
     # Clean up feature branch
     print(f"🧹 Cleaning up feature branch: {current_branch}")
-    run_command(f"git branch -d {current_branch}", cwd=project_root)
+    with git.step("delete branch"):
+        git.run("branch", "-d", current_branch)
     
     # Update roadmap
     update_roadmap_script = project_root / "scripts" / "update-roadmap.py"
     if update_roadmap_script.exists():
-        run_command(f"python {update_roadmap_script} \"{current_branch}\" \"{commit_message}\" \"completed\"", 
-                   cwd=project_root)
-    
-    print("")
-    print("✅ Feature successfully merged to main!")
-    print("🎉 Development workflow complete")
+        with git.step("roadmap"):
+            run_command([sys.executable, str(update_roadmap_script), current_branch, commit_message, "completed"],
+                        cwd=project_root)
 
 if __name__ == "__main__":
     main()
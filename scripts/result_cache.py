@@ -0,0 +1,103 @@
+"""
+Persistent test-result cache
+
+A test file's outcome is keyed by a hash of the file itself, every project
+file it transitively imports, and an environment fingerprint (interpreter
+version plus requirements and pytest configuration). A cached pass means
+the exact same code already passed in the same environment, so run-tests.py
+can skip it. Used by run-tests.py unless --no-cache is given.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import time
+
+from change_impact import GLOBAL_FILES, GLOBAL_PREFIXES, dependency_closure, scan_graph
+
+CACHE_FILE = ".test-results-cache.json"
+CACHE_VERSION = 1
+MAX_ENTRIES = 2000
+
+def environment_fingerprint(project_root, python_exe):
+    """Hash of the interpreter version and every file that shapes the test environment"""
+    digest = hashlib.sha256()
+    try:
+        result = subprocess.run([str(python_exe), "-c", "import sys; print(sys.version)"],
+                                capture_output=True, text=True, check=True)
+        digest.update(result.stdout.encode())
+    except (OSError, subprocess.CalledProcessError):
+        digest.update(str(python_exe).encode())
+
+    for entry in sorted(os.listdir(project_root)):
+        if entry in GLOBAL_FILES or entry.startswith(GLOBAL_PREFIXES):
+            path = project_root / entry
+            if path.is_file():
+                digest.update(entry.encode())
+                digest.update(path.read_bytes())
+    conftest = project_root / "tests" / "conftest.py"
+    if conftest.exists():
+        digest.update(conftest.read_bytes())
+    return digest.hexdigest()
+
+class ResultCache:
+    """Content-addressed pass/fail records with least-recently-used eviction"""
+
+    def __init__(self, project_root, python_exe, max_entries=MAX_ENTRIES):
+        self.project_root = project_root
+        self.path = project_root / CACHE_FILE
+        self.max_entries = max_entries
+        self.entries = self._load()
+        self.graph, self.hashes = scan_graph(project_root)
+        self.environment = environment_fingerprint(project_root, python_exe)
+        self._dirty = False
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                return data["entries"]
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+        return {}
+
+    def key_for(self, test_file):
+        """Cache key for a test file, or None when it can't be hashed reliably"""
+        if self.graph is None or test_file not in self.hashes:
+            return None
+        digest = hashlib.sha256(self.environment.encode())
+        for path in [test_file] + sorted(dependency_closure(self.graph, test_file)):
+            digest.update(f"{path}:{self.hashes[path]}\n".encode())
+        return digest.hexdigest()
+
+    def is_cached_pass(self, test_file):
+        key = self.key_for(test_file)
+        entry = self.entries.get(key) if key else None
+        if entry is None or not entry["passed"]:
+            return False
+        entry["last_used"] = time.time()
+        self._dirty = True
+        return True
+
+    def record(self, test_file, passed):
+        key = self.key_for(test_file)
+        if key is None:
+            return
+        self.entries[key] = {"file": test_file, "passed": passed, "last_used": time.time()}
+        self._dirty = True
+
+    def save(self):
+        """Write the cache atomically, evicting the least recently used entries"""
+        if not self._dirty:
+            return
+        if len(self.entries) > self.max_entries:
+            newest = sorted(self.entries.items(), key=lambda item: item[1]["last_used"], reverse=True)
+            self.entries = dict(newest[:self.max_entries])
+
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, 'w') as f:
+            json.dump({"version": CACHE_VERSION, "entries": self.entries}, f)
+        os.replace(tmp, self.path)
+        self._dirty = False
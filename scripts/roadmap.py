@@ -0,0 +1,257 @@
+"""
+Roadmap engine
+
+Parses ROADMAP.md once into phases and tasks, with an index from branch
+names (the bold `**branch**` at the start of a task, or any word in it) to
+task lines. Status changes, implementation notes and the "Last Updated"
+stamp are applied in memory and written back in one atomic replace while
+holding a lock file, so concurrent workflow scripts can't interleave
+their edits. Used by update-roadmap.py.
+"""
+
+import os
+import re
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+
+TASK = re.compile(r"^(\s*)- \[([ xX])\] (.*)$")
+TASK_KEY = re.compile(r"^\*\*([^*]+)\*\*")
+WORD = re.compile(r"[\w./-]+")
+PHASE = re.compile(r"^### (.*Phase.*)$")
+LAST_UPDATED = re.compile(r"^((?:- )?\*\*Last Updated\*\*:)[^\n]*?(\s*)$")
+NOTES_HEADING = "### Completed Features"
+
+STATUSES = {"completed": True, "in-progress": False}
+
+class Task:
+    def __init__(self, line, indent, checked, text, phase):
+        self.line = line
+        self.indent = indent
+        self.checked = checked
+        self.text = text
+        self.phase = phase
+        match = TASK_KEY.match(text)
+        self.key = match.group(1) if match else None
+
+    def render(self):
+        return f"{self.indent}- [{'x' if self.checked else ' '}] {self.text}"
+
+class Roadmap:
+    def __init__(self, text):
+        self.lines = text.split("\n")
+        self.phases = {}      # phase title -> [Task]
+        self.tasks = {}       # line number -> Task
+        self.by_key = {}      # bold branch key -> [Task]
+        self.by_word = {}     # any word in a task -> [Task]
+        self.last_updated = None
+        self.notes_line = None
+        self.notes = []
+        self.dirty = False
+        self._parse()
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(f.read())
+
+    def _parse(self):
+        phase = None
+        for number, line in enumerate(self.lines):
+            match = TASK.match(line)
+            if match:
+                task = Task(number, match.group(1), match.group(2) != " ", match.group(3), phase)
+                self.tasks[number] = task
+                self.phases.setdefault(phase, []).append(task)
+                if task.key:
+                    self.by_key.setdefault(task.key, []).append(task)
+                for word in set(WORD.findall(task.text)):
+                    self.by_word.setdefault(word, []).append(task)
+                continue
+
+            if line.startswith("## "):
+                phase = None
+            match = PHASE.match(line)
+            if match:
+                phase = match.group(1).strip()
+            elif LAST_UPDATED.match(line):
+                self.last_updated = number
+            elif line.strip() == NOTES_HEADING:
+                self.notes_line = number
+
+    def find(self, branch):
+        """Tasks for a branch: exact bold-key matches first, then tasks mentioning it"""
+        return self.by_key.get(branch) or self.by_word.get(branch, [])
+
+    def set_status(self, branch, status):
+        """Check or uncheck a branch's tasks; returns the tasks found"""
+        tasks = self.find(branch)
+        for task in tasks:
+            checked = STATUSES[status]
+            if task.checked != checked:
+                task.checked = checked
+                self.lines[task.line] = task.render()
+                self.dirty = True
+        return tasks
+
+    def add_note(self, note, date=None):
+        """Queue a dated note for "Completed Features" (spliced in once, on render)"""
+        self.notes.append(f"- **{date or time.strftime('%Y-%m-%d')}**: {note}")
+        self.dirty = True
+
+    def touch(self, timestamp=None):
+        """Update the "Last Updated" stamp; returns False if the roadmap has none"""
+        if self.last_updated is None:
+            return False
+        stamp = timestamp or time.strftime("%Y-%m-%d %H:%M:%S")
+        self.lines[self.last_updated] = LAST_UPDATED.sub(lambda m: f"{m.group(1)} {stamp}{m.group(2)}",
+                                                         self.lines[self.last_updated])
+        self.dirty = True
+        return True
+
+    def render(self):
+        if not self.notes:
+            return "\n".join(self.lines)
+        # Newest first, directly under the heading
+        notes = list(reversed(self.notes))
+        if self.notes_line is None:
+            # New section just before the closing status footer (or at the end)
+            footer = max((n for n, line in enumerate(self.lines) if line.strip() == "---"), default=-1)
+            position = footer if footer > len(self.lines) // 2 else len(self.lines)
+            section = ["## Implementation Notes", "", NOTES_HEADING, ""] + notes + [""]
+            lines = self.lines[:position] + section + self.lines[position:]
+        else:
+            position = self.notes_line + 1
+            if position < len(self.lines) and self.lines[position] == "":
+                position += 1
+            lines = self.lines[:position] + notes + self.lines[position:]
+        return "\n".join(lines)
+
+    def save(self, path):
+        """Atomically replace path with the rendered roadmap"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(prefix=".roadmap-", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                f.write(self.render())
+            if os.path.exists(path):
+                os.chmod(tmp, os.stat(path).st_mode & 0o777)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        self.dirty = False
+
+def _read_pid(path):
+    try:
+        with open(path, "r") as f:
+            return int(f.read().strip() or 0) or None
+    except (OSError, ValueError):
+        return None
+
+def _pid_alive(pid):
+    """True or False where it can be checked; None on Windows, where signal 0 isn't a probe"""
+    if os.name == "nt":
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _same_file(a, b):
+    return (a.st_ino, a.st_dev, a.st_mtime_ns) == (b.st_ino, b.st_dev, b.st_mtime_ns)
+
+def _break_stale(lock, observed, pid):
+    """
+    Move a stale lock aside; True if what was moved is the lock judged stale.
+    The rename is atomic, so of several waiters that saw the same stale lock
+    only one moves it. A waiter that moved a fresh lock instead (taken by
+    another waiter in between) puts it back without clobbering.
+    """
+    aside = f"{lock}.stale-{os.getpid()}-{uuid.uuid4().hex}"
+    try:
+        os.rename(lock, aside)
+    except FileNotFoundError:
+        return False
+    if _same_file(os.stat(aside), observed) and _read_pid(aside) == pid:
+        os.unlink(aside)
+        return True
+    try:
+        os.link(aside, lock)
+    except OSError:
+        pass
+    os.unlink(aside)
+    return False
+
+@contextmanager
+def locked(path, timeout=10.0, stale_after=60.0):
+    """
+    Hold `<path>.lock` (created exclusively, so it works on every platform).
+    A lock whose recorded pid is dead, or older than stale_after, was left
+    behind by a crashed writer and is broken.
+    """
+    lock = f"{path}.lock"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                observed = os.stat(lock)
+            except FileNotFoundError:
+                continue
+            pid = _read_pid(lock)
+            alive = _pid_alive(pid) if pid is not None else None
+            if alive is False or time.time() - observed.st_mtime > stale_after:
+                _break_stale(lock, observed, pid)
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{lock} is held by another process")
+            time.sleep(0.05)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        ours = os.fstat(fd)
+        os.close(fd)
+        yield
+    finally:
+        try:
+            # Only remove the lock if it is still ours
+            if _same_file(os.stat(lock), ours):
+                os.unlink(lock)
+        except FileNotFoundError:
+            pass
+
+def apply_updates(path, updates, timestamp=None):
+    """
+    Apply a batch of updates under the lock with a single parse and write.
+
+    Each update is a dict with "status" (completed, in-progress or note),
+    "description" and, for status changes, "branch". Returns a list of
+    (update, tasks found) pairs.
+    """
+    with locked(path):
+        roadmap = Roadmap.load(path)
+        results = []
+        for update in updates:
+            status = update["status"]
+            description = update.get("description") or "Updated roadmap"
+            tasks = []
+            if status in STATUSES:
+                tasks = roadmap.set_status(update["branch"], status)
+                prefix = "Completed" if status == "completed" else "Started"
+                roadmap.add_note(f"{prefix}: {description}")
+            elif status == "note":
+                roadmap.add_note(description)
+            else:
+                raise ValueError(f"Unknown status: {status}")
+            results.append((update, tasks))
+        roadmap.touch(timestamp)
+        if roadmap.dirty:
+            roadmap.save(path)
+        return results
@@ -4,21 +4,305 @@ Cross-Platform Test Runner
 Replaces run-tests.sh with Python for Windows/macOS/Linux compatibility
 """
 
+import argparse
+import heapq
+import json
+import os
 import sys
 import subprocess
 import platform
+import queue
+import re
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
-def run_command(command, cwd=None):
-    """Run a command and return result"""
+from change_impact import select_tests
+from result_cache import ResultCache
+from timing_history import TimingHistory
+
+DURATIONS_FILE = ".test-durations.json"
+DEFAULT_DURATION = 1.0  # seconds assumed for files with no history
+
+# "tests/test_x.py::test_y PASSED [ 50%]" lines from pytest -v (not the summary's "FAILED tests/...")
+PYTEST_RESULT = re.compile(r"^\S+::.*? (PASSED|FAILED|ERROR|SKIPPED|XFAIL|XPASS)\b")
+PYTEST_SECTION = re.compile(r"^=+ (FAILURES|ERRORS|short test summary info) =+$")
+
+def start_streaming(command, cwd, key, lines):
+    """
+    Start a child process whose merged stdout/stderr is read by a background
+    thread and pushed to `lines` as (key, line), then (key, None) at EOF.
+    The caller never blocks on a single child's pipe.
+    """
+    env = os.environ.copy()
+    env["PYTHONUNBUFFERED"] = "1"
+    process = subprocess.Popen(command, cwd=cwd, env=env, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True, errors="replace", bufsize=1)
+    
+    def reader():
+        for line in process.stdout:
+            lines.put((key, line.rstrip("\n")))
+        process.stdout.close()
+        lines.put((key, None))
+    
+    threading.Thread(target=reader, daemon=True).start()
+    return process
+
+def run_command(command, cwd=None, indent="   "):
+    """Run a command, echoing its output line by line as it arrives; returns True on success"""
+    lines = queue.Queue()
+    try:
+        process = start_streaming(command, cwd, None, lines)
+    except OSError as e:
+        print(f"{indent}{e}")
+        return False
+    
+    while True:
+        _, line = lines.get()
+        if line is None:
+            break
+        print(f"{indent}{line}", flush=True)
+    return process.wait() == 0
+
+class LiveProgress:
+    """Running pass/fail counts, redrawn in place on a terminal"""
+    
+    def __init__(self):
+        self.counts = {"passed": 0, "failed": 0, "skipped": 0}
+        self.interactive = sys.stdout.isatty()
+        self._drawn = False
+    
+    def update(self, line):
+        match = PYTEST_RESULT.match(line)
+        if not match:
+            return
+        outcome = match.group(1)
+        if outcome in ("PASSED", "XFAIL"):
+            self.counts["passed"] += 1
+        elif outcome in ("SKIPPED",):
+            self.counts["skipped"] += 1
+        else:
+            self.counts["failed"] += 1
+        self.draw()
+    
+    def draw(self):
+        if self.interactive:
+            c = self.counts
+            sys.stdout.write(f"\r   ✅ {c['passed']} passed  ❌ {c['failed']} failed  ⏭️  {c['skipped']} skipped ")
+            sys.stdout.flush()
+            self._drawn = True
+    
+    def clear(self):
+        if self._drawn:
+            sys.stdout.write("\r\033[K")
+            sys.stdout.flush()
+            self._drawn = False
+
+def failure_excerpt(output):
+    """Pytest's FAILURES/ERRORS/summary sections, or the last lines if there are none"""
+    for i, line in enumerate(output):
+        if PYTEST_SECTION.match(line):
+            return output[i:]
+    return output[-40:]
+
+def discover_test_files(project_root):
+    """Pytest test files under tests/, as paths relative to the project root"""
+    tests_dir = project_root / "tests"
+    if not tests_dir.exists():
+        return []
+    return sorted(p.relative_to(project_root).as_posix() for p in tests_dir.rglob("test_*.py"))
+
+def load_durations(project_root):
     try:
-        result = subprocess.run(command, shell=True, cwd=cwd, check=False, 
-                              capture_output=True, text=True)
-        return result.returncode == 0, result.stdout, result.stderr
-    except Exception as e:
-        return False, "", str(e)
+        with open(project_root / DURATIONS_FILE, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_durations(project_root, durations):
+    path = project_root / DURATIONS_FILE
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, 'w') as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+def shard_files(files, durations, jobs):
+    """
+    Longest-processing-time-first bin packing: place each file, slowest
+    first, on the currently lightest shard.
+    """
+    known = [durations[f] for f in files if f in durations]
+    fallback = sorted(known)[len(known) // 2] if known else DEFAULT_DURATION
+    
+    shards = [[] for _ in range(min(jobs, len(files)))]
+    heap = [(0.0, i) for i in range(len(shards))]
+    for f in sorted(files, key=lambda f: durations.get(f, fallback), reverse=True):
+        load, i = heapq.heappop(heap)
+        shards[i].append(f)
+        heapq.heappush(heap, (load + durations.get(f, fallback), i))
+    return [shard for shard in shards if shard]
+
+def parse_junit(xml_path):
+    """Per-file totals {file: {"duration", "passed", "failed", "skipped", "cases"}} from a junit report"""
+    results = {}
+    try:
+        tree = ET.parse(xml_path)
+    except (FileNotFoundError, ET.ParseError):
+        return results
+    
+    for case in tree.iter("testcase"):
+        file = case.get("file")
+        if not file:
+            continue
+        file = Path(file).as_posix()
+        stats = results.setdefault(file, {"duration": 0.0, "passed": 0, "failed": 0, "skipped": 0, "cases": []})
+        duration = float(case.get("time") or 0)
+        stats["duration"] += duration
+        if case.find("failure") is not None or case.find("error") is not None:
+            outcome = "failed"
+        elif case.find("skipped") is not None:
+            outcome = "skipped"
+        else:
+            outcome = "passed"
+        stats[outcome] += 1
+        
+        # classname is "<module>[.<Class>]"; rebuild a pytest-style node id
+        module = file[:-3].replace("/", ".")
+        class_name = case.get("classname", "")[len(module) + 1:]
+        test_id = "::".join(part for part in [file, class_name, case.get("name")] if part)
+        stats["cases"].append((test_id, file, duration, outcome))
+    return results
+
+def run_pytest(python_exe, project_root, shards, verbose=False):
+    """
+    Run one pytest process per shard concurrently, streaming their output.
+    Returns (success, per-file results, elapsed seconds per shard).
+    """
+    with tempfile.TemporaryDirectory(prefix="run-tests-") as tmp:
+        lines = queue.Queue()
+        progress = LiveProgress()
+        running = {}
+        for i, shard in enumerate(shards):
+            junit = Path(tmp) / f"shard-{i}.xml"
+            command = [str(python_exe), "-m", "pytest", "-v", f"--rootdir={project_root}",
+                       f"--junitxml={junit}", "-o", "junit_family=xunit1", *shard]
+            if len(shards) > 1:
+                # Concurrent runs would race on .pytest_cache
+                command[3:3] = ["-p", "no:cacheprovider"]
+            try:
+                process = start_streaming(command, project_root, i, lines)
+            except OSError as e:
+                print(f"❌ Could not start pytest: {e}")
+                return False, {}, {}
+            running[i] = {"shard": shard, "process": process, "junit": junit,
+                          "output": [], "started": time.perf_counter()}
+        
+        all_passed = True
+        file_results = {}
+        elapsed = {}
+        remaining = len(running)
+        while remaining:
+            i, line = lines.get()
+            job = running[i]
+            if line is not None:
+                job["output"].append(line)
+                if verbose:
+                    progress.clear()
+                    prefix = f"[{i + 1}] " if len(shards) > 1 else ""
+                    print(f"   {prefix}{line}")
+                progress.update(line)
+                continue
+            
+            # Reader hit EOF: the shard is done
+            remaining -= 1
+            returncode = job["process"].wait()
+            elapsed[i] = time.perf_counter() - job["started"]
+            file_results.update(parse_junit(job["junit"]))
+            
+            # Exit code 5 means no tests were collected
+            passed = returncode in (0, 5)
+            all_passed = all_passed and passed
+            progress.clear()
+            if len(shards) > 1:
+                status = "✅" if passed else "❌"
+                print(f"{status} Shard {i + 1}: {len(job['shard'])} files in {elapsed[i]:.1f}s (exit {returncode})")
+            if not passed and not verbose:
+                for output_line in failure_excerpt(job["output"]):
+                    print(f"   {output_line}")
+            progress.draw()
+        progress.clear()
+    
+    totals = {key: sum(stats[key] for stats in file_results.values()) for key in ["passed", "failed", "skipped"]}
+    print(f"📋 Pytest: {totals['passed']} passed, {totals['failed']} failed, {totals['skipped']} skipped")
+    return all_passed, file_results, elapsed
+
+def run_sharded(python_exe, project_root, files, jobs, verbose=False):
+    """Run pytest shards concurrently and merge their results; returns (success, per-file results)"""
+    durations = load_durations(project_root)
+    shards = shard_files(files, durations, jobs)
+    
+    print(f"🔀 Running {len(files)} test files in {len(shards)} parallel shards...")
+    all_passed, file_results, _ = run_pytest(python_exe, project_root, shards, verbose)
+    
+    for file, stats in file_results.items():
+        # Smooth against history so one noisy run doesn't reshuffle shards
+        previous = durations.get(file)
+        durations[file] = stats["duration"] if previous is None else (previous + stats["duration"]) / 2
+    save_durations(project_root, durations)
+    return all_passed, file_results
+
+def show_slowest(project_root, limit):
+    """Print the slowest tests from the timing history with their trend"""
+    history = TimingHistory(project_root)
+    report = history.slowest(limit)
+    history.close()
+    
+    if not report:
+        print("ℹ️  No timing history yet - run the test suite first")
+        return
+    
+    print(f"🐢 {len(report)} slowest tests (latest run, avg of last 5 vs previous 5 runs)")
+    print("")
+    print(f"   {'latest':>9} {'recent':>9} {'trend':>8}  test")
+    for entry in report:
+        if entry["older_avg"]:
+            change = (entry["recent_avg"] - entry["older_avg"]) / entry["older_avg"] * 100
+            trend = f"{change:+.0f}%"
+        else:
+            trend = "new"
+        marker = " ❌" if entry["outcome"] == "failed" else ""
+        print(f"   {entry['latest']:>8.3f}s {entry['recent_avg']:>8.3f}s {trend:>8}  {entry['test_id']}{marker}")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the project test suite")
+    parser.add_argument("--verbose", action="store_true", help="Show test output for passing runs")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Run pytest files in N parallel shards (0 = one per CPU)")
+    parser.add_argument("--impact", action="store_true",
+                        help="Only run tests whose imports reach files changed against --base")
+    parser.add_argument("--base", default="main", help="Branch to diff against in --impact mode")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached passes and run every selected test")
+    parser.add_argument("--slowest", type=int, metavar="N",
+                        help="Show the N slowest tests from the timing history and exit")
+    return parser.parse_args()
+
+def check_coverage(python_exe, project_root):
+    """Run the 4-phase coverage check if the project has one; it reports, never fails the run"""
+    coverage_script = project_root / "scripts" / "check-test-coverage.py"
+    if coverage_script.exists():
+        print("📊 Checking test coverage...")
+        success = run_command([str(python_exe), str(coverage_script)], cwd=project_root)
+        if success:
+            print("✅ Coverage check: PASSED")
+        else:
+            print("⚠️  Coverage check: Issues found")
 
 def main():
+    args = parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
     project_root = Path(__file__).parent.parent
     is_windows = platform.system() == "Windows"
     
@@ -32,74 +316,118 @@ def main():
     if not python_exe.exists():
         python_exe = "python"
     
+    if args.slowest:
+        show_slowest(project_root, args.slowest)
+        return
+    
     print("🧪 Running Test Suite")
     print("====================")
     print("")
     
+    # Change-impact selection; None means everything runs
+    selected = None
+    if args.impact:
+        selected, reason = select_tests(project_root, args.base)
+        print(f"🎯 Impact mode: {reason}")
+        if selected is None:
+            print("   Falling back to the full suite")
+        print("")
+    
+    def is_selected(path):
+        return selected is None or path in selected
+    
+    # Skip files whose exact code already passed in this environment
+    cache = None if args.no_cache else ResultCache(project_root, python_exe)
+    cached = []
+    
+    def needs_run(path):
+        if cache is not None and cache.is_cached_pass(path):
+            cached.append(path)
+            return False
+        return True
+    
     test_files = []
     
     # Check for quick tests
     quick_test = project_root / "tests" / "quick_test.py"
-    if quick_test.exists():
-        test_files.append(("Quick Tests", str(quick_test)))
+    if quick_test.exists() and is_selected("tests/quick_test.py") and needs_run("tests/quick_test.py"):
+        test_files.append(("Quick Tests", "tests/quick_test.py"))
     
     # Check for main test suite
     test_suite = project_root / "tests" / "test_suite.py"
-    if test_suite.exists():
-        test_files.append(("Test Suite", str(test_suite)))
+    if test_suite.exists() and is_selected("tests/test_suite.py") and needs_run("tests/test_suite.py"):
+        test_files.append(("Test Suite", "tests/test_suite.py"))
     
-    # Run pytest if available
-    pytest_tests = list((project_root / "tests").glob("test_*.py"))
-    if pytest_tests:
-        test_files.append(("Pytest Suite", "pytest tests/"))
+    # Run pytest if available; test_suite.py already ran above as a script, under its own cache entry
+    all_pytest_tests = [f for f in discover_test_files(project_root)
+                        if not (f == "tests/test_suite.py" and test_suite.exists())]
+    pytest_tests = [f for f in all_pytest_tests if is_selected(f) and needs_run(f)]
+    if pytest_tests and jobs == 1:
+        test_files.append(("Pytest Suite", "pytest"))
+    
+    if cached:
+        print(f"⚡ {len(cached)} test files cached as passed (use --no-cache to rerun):")
+        for path in cached:
+            print(f"   ⚡ {path}: CACHED")
+        print("")
     
-    if not test_files:
+    if not test_files and not pytest_tests:
+        # Nothing to run, but new untested code is still worth reporting
+        if cached:
+            cache.save()
+            check_coverage(python_exe, project_root)
+            print("🎉 All tests passed! (cached)")
+            sys.exit(0)
+        if selected is not None and (all_pytest_tests or quick_test.exists() or test_suite.exists()):
+            check_coverage(python_exe, project_root)
+            print("✅ No tests are affected by the current changes")
+            sys.exit(0)
         print("⚠️  No test files found")
         print("Expected: tests/quick_test.py or tests/test_suite.py")
         return
     
     all_passed = True
+    file_results = {}
+    
+    if pytest_tests and jobs > 1:
+        success, file_results = run_sharded(python_exe, project_root, pytest_tests, jobs, args.verbose)
+        if not success:
+            all_passed = False
+        print("")
     
     for test_name, test_command in test_files:
         print(f"🔍 Running {test_name}...")
         
-        if test_command.startswith("pytest"):
-            success, stdout, stderr = run_command(f"{python_exe} -m {test_command}", 
-                                                 cwd=project_root)
+        if test_command == "pytest":
+            success, results, _ = run_pytest(python_exe, project_root, [pytest_tests], args.verbose)
+            file_results.update(results)
         else:
-            success, stdout, stderr = run_command(f"{python_exe} {test_command}", 
-                                                 cwd=project_root)
+            success = run_command([str(python_exe), test_command], cwd=project_root)
+            if cache is not None:
+                cache.record(test_command, success)
         
         if success:
             print(f"✅ {test_name}: PASSED")
-            if stdout and "--verbose" in sys.argv:
-                print(stdout)
         else:
             print(f"❌ {test_name}: FAILED")
-            if stderr:
-                print(f"Error: {stderr}")
-            if stdout:
-                print(f"Output: {stdout}")
             all_passed = False
         
         print("")
     
-    # Run coverage check if available
-    coverage_script = project_root / "scripts" / "check-test-coverage.py"
-    if coverage_script.exists():
-        print("📊 Checking test coverage...")
-        success, stdout, stderr = run_command(f"{python_exe} {coverage_script}", 
-                                             cwd=project_root)
-        if success:
-            print("✅ Coverage check: PASSED")
-            if stdout and "--verbose" in sys.argv:
-                print(stdout)
-        else:
-            print("⚠️  Coverage check: Issues found")
-            if stderr:
-                print(f"Error: {stderr}")
-            if stdout:
-                print(stdout)
+    if cache is not None:
+        for path, stats in file_results.items():
+            if path in pytest_tests:
+                cache.record(path, stats["failed"] == 0)
+        cache.save()
+    
+    # Keep per-test durations so --slowest can show trends
+    cases = [case for stats in file_results.values() for case in stats["cases"]]
+    if cases:
+        history = TimingHistory(project_root)
+        history.record_run(cases)
+        history.close()
+    
+    check_coverage(python_exe, project_root)
     
     # Final result
     if all_passed:
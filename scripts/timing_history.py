@@ -0,0 +1,92 @@
+"""
+Per-test timing history
+
+Stores the duration and outcome of every pytest test case per run in a
+local SQLite database so run-tests.py --slowest N can show which tests are
+slow and whether they are getting slower.
+"""
+
+import sqlite3
+import subprocess
+import time
+
+HISTORY_FILE = ".test-history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    git_commit TEXT
+);
+CREATE TABLE IF NOT EXISTS test_timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test_id TEXT NOT NULL,
+    file TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_test_timings_test ON test_timings(test_id, run_id);
+CREATE INDEX IF NOT EXISTS idx_test_timings_run ON test_timings(run_id);
+"""
+
+class TimingHistory:
+    def __init__(self, project_root):
+        self.project_root = project_root
+        self.connection = sqlite3.connect(project_root / HISTORY_FILE)
+        self.connection.executescript(SCHEMA)
+
+    def _git_commit(self):
+        try:
+            result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=self.project_root,
+                                    capture_output=True, text=True, check=True)
+            return result.stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def record_run(self, cases):
+        """Store one run; cases are (test_id, file, duration, outcome) tuples"""
+        if not cases:
+            return
+        with self.connection:
+            run_id = self.connection.execute(
+                "INSERT INTO runs (started_at, git_commit) VALUES (?, ?)",
+                (time.time(), self._git_commit())
+            ).lastrowid
+            self.connection.executemany(
+                "INSERT INTO test_timings (run_id, test_id, file, duration, outcome) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, *case) for case in cases]
+            )
+
+    def slowest(self, limit, window=5):
+        """
+        The `limit` slowest tests by their latest duration, with the average
+        of the last `window` runs and of the `window` runs before that.
+        """
+        latest = self.connection.execute("""
+            SELECT t.test_id, t.duration, t.outcome
+            FROM test_timings t
+            JOIN (SELECT test_id, MAX(run_id) AS run_id FROM test_timings GROUP BY test_id) last
+              ON t.test_id = last.test_id AND t.run_id = last.run_id
+            ORDER BY t.duration DESC
+            LIMIT ?
+        """, (limit,)).fetchall()
+
+        report = []
+        for test_id, duration, outcome in latest:
+            history = [row[0] for row in self.connection.execute(
+                "SELECT duration FROM test_timings WHERE test_id = ? ORDER BY run_id DESC LIMIT ?",
+                (test_id, window * 2)
+            )]
+            recent, older = history[:window], history[window:]
+            report.append({
+                "test_id": test_id,
+                "latest": duration,
+                "outcome": outcome,
+                "runs": len(history),
+                "recent_avg": sum(recent) / len(recent),
+                "older_avg": sum(older) / len(older) if older else None
+            })
+        return report
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Cross-Platform Roadmap Update
+Replaces update-roadmap.sh with Python for Windows/macOS/Linux compatibility
+
+Usage:
+  python scripts/update-roadmap.py [branch-name] [description] [completed|in-progress|note]
+  python scripts/update-roadmap.py --batch updates.json
+
+A batch file is a JSON list of {"branch", "description", "status"} objects
+(use - to read it from stdin); all of them are applied in one locked write.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from roadmap import STATUSES, apply_updates
+
+def current_branch():
+    try:
+        result = subprocess.run(["git", "branch", "--show-current"], capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Update ROADMAP.md with the current project status")
+    parser.add_argument("branch", nargs="?", help="Branch name (defaults to the current branch)")
+    parser.add_argument("description", nargs="?", default="Updated roadmap")
+    parser.add_argument("status", nargs="?", default="in-progress", choices=[*STATUSES, "note"])
+    parser.add_argument("--batch", metavar="FILE", help="Apply a JSON list of updates in one write")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    roadmap_file = Path(os.environ.get("ROADMAP_FILE", "ROADMAP.md"))
+
+    if not roadmap_file.exists():
+        print(f"❌ {roadmap_file} not found. Run this from project root.")
+        sys.exit(1)
+
+    if args.batch:
+        with (sys.stdin if args.batch == "-" else open(args.batch, "r")) as f:
+            updates = json.load(f)
+    else:
+        updates = [{"branch": args.branch or current_branch(), "description": args.description, "status": args.status}]
+
+    try:
+        results = apply_updates(roadmap_file, updates)
+    except (TimeoutError, ValueError, KeyError) as e:
+        print(f"❌ Roadmap update failed: {e}")
+        sys.exit(1)
+
+    for update, tasks in results:
+        branch, status = update.get("branch"), update["status"]
+        if status == "note":
+            print("📝 Added implementation note to roadmap")
+        elif not tasks:
+            print(f"⚠️  Could not find roadmap entry for: {branch}")
+        elif status == "completed":
+            print(f"✅ Marked {branch} as completed in roadmap ({len(tasks)} task{'s' if len(tasks) != 1 else ''})")
+        else:
+            print(f"🔄 Marked {branch} as in-progress in roadmap ({len(tasks)} task{'s' if len(tasks) != 1 else ''})")
+
+    print("🎯 Roadmap updated successfully!")
+    print(f"📄 View: cat {roadmap_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Template Self-Validation
+Replaces validate-template.sh with a single-process Python validator
+
+- Python files are compiled in-process with compile() (no bytecode written)
+- Shell scripts are checked with `bash -n`, all at once on a thread pool
+- Every template file is read once to build a placeholder index
+  ({{VARIABLE}} -> files and lines), checked against the registry in
+  scripts/template-variables.json for undefined and unused variables
+
+Usage:
+    python scripts/validate-template.py               # Human-readable report
+    python scripts/validate-template.py --json        # Machine-readable report
+    python scripts/validate-template.py --update-registry
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+PLACEHOLDER = re.compile(r"\{\{([A-Z][A-Z0-9_]*)\}\}")
+REGISTRY_FILE = "scripts/template-variables.json"
+
+SKIP_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__", ".pytest_cache",
+             "generated_projects", "bench-results", "profiles"}
+TEXT_SUFFIXES = {".py", ".sh", ".bat", ".md", ".txt", ".json", ".toml", ".ini", ".cfg",
+                 ".yml", ".yaml", ".html", ".css", ".js", ".env", ""}
+
+REQUIRED_FILES = [
+    "README.md",
+    "PROJECT_README.md",
+    "BOOTSTRAP_PROMPT.md",
+    "PROJECT_GOALS.md",
+    "ROADMAP.md",
+    "AI_PROJECT_INCEPTION_ROADMAP.md",
+    "PROOF_OF_CONCEPT_RESULTS.md",
+    "manage.py",
+    "manage.sh",
+    "inception.py",
+    "scripts/create-branch.sh",
+    "scripts/merge-to-main.sh",
+    "scripts/run-tests.sh",
+    ".github/copilot-instructions.md",
+]
+
+class Report:
+    def __init__(self):
+        self.checks = []  # {"check", "status", "message"}
+
+    def add(self, check, status, message):
+        self.checks.append({"check": check, "status": status, "message": message})
+
+    def count(self, status):
+        return sum(1 for check in self.checks if check["status"] == status)
+
+def template_files(project_root):
+    """Every text file in the template, as posix paths relative to the root"""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for name in sorted(filenames):
+            if Path(name).suffix not in TEXT_SUFFIXES and not name.startswith("."):
+                continue
+            files.append(Path(dirpath, name).relative_to(project_root).as_posix())
+    return files
+
+def read_files(project_root, files):
+    """Read each file once; binary or undecodable files are skipped"""
+    contents = {}
+    for path in files:
+        try:
+            contents[path] = (project_root / path).read_text(encoding="utf-8")
+        except (UnicodeDecodeError, OSError):
+            continue
+    return contents
+
+def check_python(contents, report):
+    for path, source in contents.items():
+        if not path.endswith(".py"):
+            continue
+        try:
+            compile(source, path, "exec", dont_inherit=True)
+            report.add("python-syntax", "pass", f"{path} syntax valid")
+        except SyntaxError as e:
+            report.add("python-syntax", "fail", f"{path}:{e.lineno}: {e.msg}")
+
+def start_shell_checks(project_root, contents, pool):
+    """Submit `bash -n` for every shell script; returns futures of (path, returncode, stderr)"""
+    bash = shutil.which("bash")
+    if bash is None:
+        return None
+
+    def bash_n(path):
+        result = subprocess.run([bash, "-n", path], cwd=project_root, capture_output=True, text=True)
+        return path, result.returncode, result.stderr.strip()
+
+    return [pool.submit(bash_n, path) for path in contents if path.endswith(".sh")]
+
+def collect_shell_checks(futures, contents, report):
+    if futures is None:
+        scripts = sum(1 for path in contents if path.endswith(".sh"))
+        report.add("shell-syntax", "warn", f"bash not found; {scripts} shell scripts not checked")
+        return
+    for future in futures:
+        path, returncode, stderr = future.result()
+        if returncode == 0:
+            report.add("shell-syntax", "pass", f"{path} syntax valid")
+        else:
+            report.add("shell-syntax", "fail", f"{path}: {stderr.splitlines()[-1] if stderr else 'syntax error'}")
+
+def check_structure(project_root, report):
+    for path in REQUIRED_FILES:
+        if (project_root / path).is_file():
+            report.add("structure", "pass", f"{path} exists")
+        else:
+            report.add("structure", "fail", f"{path} missing")
+
+    if not ((project_root / "scripts/run-tests.bat").exists() and (project_root / "manage.bat").exists()):
+        report.add("structure", "warn",
+                   "Windows batch files missing (AI Project Inception will generate project-specific files)")
+
+def build_placeholder_index(contents):
+    """{variable: [(file, line), ...]} from a single pass over every file"""
+    index = {}
+    for path, text in contents.items():
+        if "{{" not in text:
+            continue
+        for number, line in enumerate(text.splitlines(), 1):
+            if "{{" in line:
+                for name in PLACEHOLDER.findall(line):
+                    index.setdefault(name, []).append((path, number))
+    return index
+
+def load_registry(project_root):
+    try:
+        with open(project_root / REGISTRY_FILE, "r") as f:
+            return set(json.load(f)["variables"])
+    except FileNotFoundError:
+        return None
+
+def save_registry(project_root, names):
+    path = project_root / REGISTRY_FILE
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump({"variables": sorted(names)}, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+def check_placeholders(index, registry, report):
+    if not index:
+        report.add("placeholders", "warn", "No template variables found")
+        return
+    report.add("placeholders", "pass", f"{len(index)} template variables in use")
+
+    if registry is None:
+        report.add("placeholders", "warn", f"{REGISTRY_FILE} missing; run with --update-registry")
+        return
+    for name in sorted(set(index) - registry):
+        where = ", ".join(f"{path}:{line}" for path, line in index[name][:3])
+        report.add("placeholders", "fail", f"{{{{{name}}}}} is not defined in {REGISTRY_FILE} (used at {where})")
+    for name in sorted(registry - set(index)):
+        report.add("placeholders", "warn", f"{{{{{name}}}}} is defined but never used")
+
+def check_roadmap(project_root, report):
+    """Exercise the roadmap engine in memory (nothing is written)"""
+    sys.path.insert(0, str(project_root / "scripts"))
+    try:
+        from roadmap import Roadmap
+    except ImportError as e:
+        report.add("roadmap", "warn", f"Roadmap engine not importable: {e}")
+        return
+    finally:
+        sys.path.pop(0)
+
+    roadmap = Roadmap("- [ ] **test-feature** - Test feature description\n"
+                      "- [x] **completed-feature** - Already done\n")
+    roadmap.set_status("test-feature", "completed")
+    roadmap.set_status("completed-feature", "in-progress")
+    if roadmap.render().startswith("- [x] **test-feature** ") and "- [ ] **completed-feature**" in roadmap.render():
+        report.add("roadmap", "pass", "Roadmap engine updates task status")
+    else:
+        report.add("roadmap", "fail", "Roadmap engine did not update task status")
+
+def validate(project_root, update_registry=False):
+    start = time.perf_counter()
+    report = Report()
+    files = template_files(project_root)
+    contents = read_files(project_root, files)
+
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+        # Shell checks spawn processes; let them run while everything else happens in-process
+        shell = start_shell_checks(project_root, contents, pool)
+        check_python(contents, report)
+        check_structure(project_root, report)
+        index = build_placeholder_index(contents)
+        if update_registry:
+            save_registry(project_root, index)
+        check_placeholders(index, load_registry(project_root), report)
+        check_roadmap(project_root, report)
+        collect_shell_checks(shell, contents, report)
+
+    return report, index, time.perf_counter() - start
+
+def print_report(report, elapsed, quiet=False):
+    icons = {"pass": "✅", "fail": "❌", "warn": "⚠️ "}
+    print("🔍 AI-Native Template Validation")
+    print("=================================")
+    current = None
+    for check in report.checks:
+        if quiet and check["status"] == "pass":
+            continue
+        if check["check"] != current:
+            current = check["check"]
+            print("")
+            print(f"ℹ️  {current}")
+        print(f"{icons[check['status']]} {check['message']}")
+
+    errors, warnings = report.count("fail"), report.count("warn")
+    print("")
+    print("🏁 Validation Summary")
+    print("====================")
+    print(f"⏱️  {len(report.checks)} checks in {elapsed * 1000:.0f} ms")
+    if errors == 0:
+        print("✅ All critical validations passed!")
+        if warnings:
+            print(f"⚠️  {warnings} warnings found - template is functional but could be improved")
+        else:
+            print("🎉 Template is in excellent condition!")
+    else:
+        print(f"❌ {errors} critical errors found")
+        if warnings:
+            print(f"⚠️  {warnings} warnings found")
+        print("")
+        print("🔧 Fix critical errors before using template")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Validate the AI-native template")
+    parser.add_argument("--json", action="store_true", help="Print a machine-readable JSON report")
+    parser.add_argument("--update-registry", action="store_true",
+                        help=f"Rewrite {REGISTRY_FILE} from the variables currently in use")
+    parser.add_argument("--quiet", action="store_true", help="Only print failures and warnings")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    sys.dont_write_bytecode = True
+    project_root = Path(__file__).resolve().parent.parent
+    report, index, elapsed = validate(project_root, args.update_registry)
+
+    if args.json:
+        print(json.dumps({
+            "ok": report.count("fail") == 0,
+            "errors": report.count("fail"),
+            "warnings": report.count("warn"),
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "checks": report.checks,
+            "placeholders": {name: [{"file": path, "line": line} for path, line in uses]
+                             for name, uses in sorted(index.items())}
+        }, indent=2))
+    else:
+        print_report(report, elapsed, args.quiet)
+
+    return 1 if report.count("fail") else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+{{PROJECT_NAME}} - Flask service
+
+Routes live here; business logic lives in modules/.
+"""
+
+import os
+
+from flask import Flask, jsonify, request
+
+from modules import core
+from modules.jobs import JobQueue
+from modules.metrics import RequestMetrics
+from modules.response_cache import ResponseCache
+
+app = Flask(__name__)
+
+# Opt-in per route with @cache.cached(...); RESPONSE_CACHE_ENABLED=0 turns it off entirely
+cache = ResponseCache(app)
+
+# Per-route counters and latency histograms at /metrics (Prometheus text format)
+metrics = RequestMetrics(app)
+metrics.register_gauges("response_cache", cache.stats)
+
+# Slow work runs on background workers; routes answer 202 and clients poll /api/jobs/<id>
+jobs = JobQueue(app)
+metrics.register_gauges("jobs", jobs.stats)
+
+@jobs.task()
+def build_report(status=None):
+    return core.build_report(status=status)
+
+@app.route("/health")
+def health():
+    return jsonify({
+        "status": "healthy",
+        "service": "{{SERVICE_NAME}}",
+        "cache": cache.stats(),
+        "jobs": jobs.stats(),
+    })
+
+@app.route("/api/status")
+def api_status():
+    return jsonify(core.get_status())
+
+@app.route("/api/items")
+@cache.cached(ttl=30)
+def api_items():
+    return jsonify({"items": core.list_items(status=request.args.get("status"))})
+
+@app.route("/api/reports", methods=["POST"])
+def create_report():
+    return jobs.accepted(jobs.enqueue("build_report", status=request.args.get("status")))
+
+if __name__ == "__main__":
+    # python manage.py stop sends SIGTERM: finish running jobs before exiting.
+    # The handler goes in before any job starts, then jobs left from the last
+    # run start now rather than on the first request
+    jobs.drain_on_sigterm()
+    jobs.start()
+    port = int(os.environ.get("PORT", "{{PORT}}"))
+    app.run(host="0.0.0.0", port=port, threaded=True)
@@ -0,0 +1,39 @@
+"""
+{{PROJECT_NAME}} - Core business logic
+
+Framework-agnostic: routes in {{MAIN_FILE}} call these functions and turn
+their results into responses.
+"""
+
+import time
+
+STARTED_AT = time.time()
+
+ITEMS = [
+    {"id": 1, "name": "Example item", "status": "active"},
+    {"id": 2, "name": "Another item", "status": "archived"},
+]
+
+def get_status():
+    """Service status summary"""
+    return {
+        "service": "{{SERVICE_NAME}}",
+        "uptime_seconds": round(time.time() - STARTED_AT, 1),
+    }
+
+def list_items(status=None):
+    """Items, optionally filtered by status"""
+    if status:
+        return [item for item in ITEMS if item["status"] == status]
+    return list(ITEMS)
+
+def build_report(status=None):
+    """Item counts by status; stands in for work too slow to do inside a request"""
+    counts = {}
+    for item in list_items(status=status):
+        counts[item["status"]] = counts.get(item["status"], 0) + 1
+    return {
+        "total": sum(counts.values()),
+        "by_status": counts,
+        "generated_at": time.time(),
+    }
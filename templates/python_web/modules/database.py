@@ -0,0 +1,156 @@
+"""
+{{PROJECT_NAME}} - Database
+
+Pooled SQLite access for modules/. Opening a connection per request costs
+more than most queries do, so connections are opened once and shared:
+
+    db = Database()
+    db.executescript(SCHEMA)
+
+    db.query("SELECT * FROM items WHERE status = ?", (status,))
+    db.execute("INSERT INTO items (name, status) VALUES (?, ?)", (name, "active"))
+    db.execute_many("INSERT INTO events (item_id, kind) VALUES (?, ?)", rows)
+
+    with db.write() as conn:  # several statements, one transaction
+        ...
+
+The database runs in WAL mode, so readers never block the writer or each
+other. Reads go through a pool of read-only connections; SQLite allows one
+writer at a time, so writes share a single connection behind a lock and
+always run in a transaction. Every connection keeps a cache of prepared
+statements, so repeated SQL (always use ? parameters, never formatting)
+is parsed once. execute_many() sends a whole batch in one transaction,
+which is far cheaper than one commit per row.
+
+Configuration (environment):
+    DATABASE_PATH     data/app.db (":memory:" for a private in-memory database)
+    DATABASE_READERS  4 read connections
+"""
+
+import contextlib
+import os
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+
+STATEMENT_CACHE_SIZE = 256
+BUSY_TIMEOUT_MS = 5000
+BATCH_SIZE = 1000
+
+class Database:
+    def __init__(self, path=None, readers=None):
+        self.path = path or os.environ.get("DATABASE_PATH", "data/app.db")
+        self.readers = readers if readers is not None else int(os.environ.get("DATABASE_READERS", 4))
+        self.in_memory = self.path == ":memory:"
+        if self.in_memory:
+            self.readers = 0  # Nothing else can open a private in-memory database
+        else:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        # The writer is opened first: it creates the file and switches it to WAL
+        self._writer = self._connect(self.path)
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute("PRAGMA synchronous=NORMAL")  # Durable at checkpoints; safe with WAL
+        self._write_lock = threading.Lock()
+
+        self._read_pool = queue.LifoQueue()  # Most recently used first, so its page cache is warm
+        uri = Path(self.path).resolve().as_uri() + "?mode=ro"
+        for _ in range(self.readers):
+            self._read_pool.put(self._connect(uri, uri=True))
+
+    def _connect(self, target, uri=False):
+        conn = sqlite3.connect(target, uri=uri, check_same_thread=False, isolation_level=None,
+                               cached_statements=STATEMENT_CACHE_SIZE, timeout=BUSY_TIMEOUT_MS / 1000)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    # --- Connections ---
+
+    @contextlib.contextmanager
+    def read(self):
+        """A read-only connection from the pool, for the duration of the block"""
+        if not self.readers:
+            with self._write_lock:
+                yield self._writer
+            return
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
+    @contextlib.contextmanager
+    def write(self):
+        """The writer connection inside a transaction; committed on success, rolled back on error"""
+        with self._write_lock:
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._writer
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+            self._writer.execute("COMMIT")
+
+    # --- Queries ---
+
+    def query(self, sql, params=()):
+        """All matching rows, as dicts"""
+        with self.read() as conn:
+            return [dict(row) for row in conn.execute(sql, params)]
+
+    def query_one(self, sql, params=()):
+        """The first matching row as a dict, or None"""
+        with self.read() as conn:
+            row = conn.execute(sql, params).fetchone()
+        return dict(row) if row is not None else None
+
+    def execute(self, sql, params=()):
+        """Run one write; returns (lastrowid, rowcount)"""
+        with self.write() as conn:
+            cursor = conn.execute(sql, params)
+            return cursor.lastrowid, cursor.rowcount
+
+    def execute_many(self, sql, rows, batch_size=BATCH_SIZE):
+        """
+        Run one statement for every row in a single transaction; rows may be
+        any iterable and are sent batch_size at a time. Returns rows written.
+        """
+        total = 0
+        batch = []
+        with self.write() as conn:
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    total += conn.executemany(sql, batch).rowcount
+                    batch = []
+            if batch:
+                total += conn.executemany(sql, batch).rowcount
+        return total
+
+    def executescript(self, script):
+        """Run a schema or migration script (CREATE TABLE IF NOT EXISTS ...)"""
+        with self._write_lock:
+            self._writer.executescript(script)
+
+    # --- Management ---
+
+    def stats(self):
+        with self._write_lock:
+            journal_mode = self._writer.execute("PRAGMA journal_mode").fetchone()[0]
+        return {
+            "path": self.path,
+            "journal_mode": journal_mode,
+            "readers": self.readers,
+            "idle_readers": self._read_pool.qsize(),
+        }
+
+    def close(self):
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._write_lock:
+            self._writer.close()
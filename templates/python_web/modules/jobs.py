@@ -0,0 +1,363 @@
+"""
+{{PROJECT_NAME}} - Background jobs
+
+Moves slow work off the request threads without an external broker.
+Register a task, enqueue it from a route and answer 202 straight away:
+
+    jobs = JobQueue(app)
+
+    @jobs.task()
+    def build_report(status=None):
+        return core.build_report(status)
+
+    @app.route("/api/reports", methods=["POST"])
+    def create_report():
+        return jobs.accepted(jobs.enqueue("build_report", status=request.args.get("status")))
+
+Clients then poll GET /api/jobs/<id> for the job's status and
+GET /api/jobs/<id>/result for its return value (202 while it is queued
+or running, 500 if it failed).
+
+Jobs are rows in a SQLite table, so queued work survives a restart. A
+fixed pool of worker threads claims due jobs from the table, taking a
+lease on each (owner plus lease_until) that a background thread renews
+while the job runs. Several processes can share one database: a claim
+only succeeds on a row that is still claimable, and a running job is
+only taken over once its lease has expired, i.e. its process died or
+hung. Execution is at least once. Call jobs.start()
+once every task is registered so recovered jobs run straight away;
+otherwise the workers start on the first request or enqueue(). A task
+that raises is retried with exponential backoff until max_attempts, then
+marked failed. Task arguments and results must be JSON-serialisable.
+
+On SIGTERM (python manage.py stop) the queue stops accepting and starting
+jobs, waits up to JOBS_DRAIN_SECONDS for running ones, then exits; jobs
+still queued run on the next start.
+
+Configuration (environment):
+    JOBS_DB             data/jobs.db
+    JOBS_WORKERS        4 threads
+    JOBS_MAX_PENDING    1000 queued or running jobs before enqueue() refuses (503)
+    JOBS_MAX_ATTEMPTS   3
+    JOBS_BACKOFF        2 seconds before the first retry, doubling after each one
+    JOBS_DRAIN_SECONDS  20
+    JOBS_KEEP_DAYS      7 days finished jobs are kept (purged on start)
+    JOBS_LEASE_SECONDS  30 seconds a dead process's running jobs wait before another takes them
+"""
+
+import json
+import os
+import random
+import signal
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from flask import jsonify, url_for
+
+MAX_BACKOFF = 300
+# Upper bound on how long an idle worker sleeps, so jobs enqueued by other processes are seen
+POLL_SECONDS = 1.0
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    task TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    run_after REAL NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    lease_owner TEXT,
+    lease_until REAL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_due ON jobs (status, run_after);
+"""
+PUBLIC_FIELDS = ("id", "task", "status", "attempts", "max_attempts", "created_at", "started_at",
+                 "finished_at", "error")
+
+class JobQueueFull(RuntimeError):
+    """Too many jobs pending, or the queue is draining; the client should retry later"""
+
+class JobQueue:
+    def __init__(self, app=None, path=None, workers=None, max_pending=None, max_attempts=None,
+                 backoff=None, drain_seconds=None, lease_seconds=None):
+        env = os.environ.get
+        self.path = path or env("JOBS_DB", "data/jobs.db")
+        self.workers = workers or int(env("JOBS_WORKERS", 4))
+        self.max_pending = max_pending or int(env("JOBS_MAX_PENDING", 1000))
+        self.max_attempts = max_attempts or int(env("JOBS_MAX_ATTEMPTS", 3))
+        self.backoff = backoff if backoff is not None else float(env("JOBS_BACKOFF", 2))
+        self.drain_seconds = drain_seconds if drain_seconds is not None else float(env("JOBS_DRAIN_SECONDS", 20))
+        self.lease_seconds = lease_seconds or float(env("JOBS_LEASE_SECONDS", 30))
+        keep_seconds = float(env("JOBS_KEEP_DAYS", 7)) * 24 * 60 * 60
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self.tasks = {}  # name -> (function, max_attempts)
+        self._lock = threading.Lock()  # Guards the connection and this process's counters below
+        self._changed = threading.Condition(self._lock)  # A job became due, finished, or draining began
+        self._threads = []
+        self._accepting = True
+        self._busy = 0
+
+        self.succeeded = 0
+        self.failed = 0
+        self.retried = 0
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        # Jobs left running by a dead process are taken over when their lease expires (see _claim)
+        self._conn.execute("DELETE FROM jobs WHERE status IN ('succeeded', 'failed') AND finished_at < ?",
+                           (time.time() - keep_seconds,))
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions["jobs"] = self
+        # Fallback for servers that never call start(): by the first request every @jobs.task is registered
+        app.before_request(self.start)
+        app.add_url_rule("/api/jobs/<job_id>", "job_status", self.status_view)
+        app.add_url_rule("/api/jobs/<job_id>/result", "job_result", self.result_view)
+        app.register_error_handler(JobQueueFull, self._queue_full)
+
+    def task(self, name=None, max_attempts=None):
+        """Register a function as a task, under its own name unless given one"""
+        def decorator(func):
+            self.tasks[name or func.__name__] = (func, max_attempts or self.max_attempts)
+            return func
+        return decorator
+
+    # --- Submitting ---
+
+    def enqueue(self, task, **kwargs):
+        """
+        Queue a registered task with keyword arguments; returns the job id.
+        Raises JobQueueFull over max_pending or while draining.
+        """
+        if task not in self.tasks:
+            raise KeyError(f"Unknown task '{task}'")
+        _, max_attempts = self.tasks[task]
+        payload = json.dumps(kwargs)
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            if not self._accepting:
+                raise JobQueueFull("Shutting down; not accepting jobs")
+            pending = self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'running')").fetchone()[0]
+            if pending >= self.max_pending:
+                raise JobQueueFull(f"{self.max_pending} jobs already pending")
+            self._conn.execute(
+                "INSERT INTO jobs (id, task, payload, status, max_attempts, run_after, created_at) "
+                "VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+                (job_id, task, payload, max_attempts, now, now))
+            self._changed.notify()
+        self.start()
+        return job_id
+
+    def accepted(self, job_id):
+        """The 202 response for a newly queued job, pointing at its status"""
+        status_url = url_for("job_status", job_id=job_id)
+        response = jsonify({
+            "id": job_id,
+            "status": "queued",
+            "status_url": status_url,
+            "result_url": url_for("job_result", job_id=job_id),
+        })
+        response.status_code = 202
+        response.headers["Location"] = status_url
+        return response
+
+    # --- Workers ---
+
+    def start(self):
+        """Start the worker threads and the lease renewer, once"""
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads or not self._accepting:
+                return
+            targets = [(self._work, f"job-worker-{n}") for n in range(self.workers)]
+            for target, name in targets + [(self._renew_leases, "job-leases")]:
+                thread = threading.Thread(target=target, name=name, daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            job = self._claim()
+            if job is None:
+                return
+            self._run(job)
+
+    def _claim(self):
+        """The next due job, leased to this process; None once draining"""
+        due = ("(status = 'queued' AND run_after <= :now) "
+               "OR (status = 'running' AND lease_until < :now)")
+        with self._lock:
+            while self._accepting:
+                now = time.time()
+                candidate = self._conn.execute(
+                    f"SELECT id FROM jobs WHERE {due} ORDER BY run_after LIMIT 1", {"now": now}).fetchone()
+                if candidate is not None:
+                    # Conditional, so a row another process claimed meanwhile is left alone
+                    claimed = self._conn.execute(
+                        "UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = :now, "
+                        f"lease_owner = :owner, lease_until = :until WHERE id = :id AND ({due})",
+                        {"now": now, "owner": self.owner, "until": now + self.lease_seconds,
+                         "id": candidate["id"]})
+                    if claimed.rowcount == 1:
+                        self._busy += 1
+                        return self._conn.execute(
+                            "SELECT id, task, payload, attempts, max_attempts FROM jobs WHERE id = ?",
+                            (candidate["id"],)).fetchone()
+                    continue
+                next_due = self._conn.execute(
+                    "SELECT MIN(t) FROM (SELECT MIN(run_after) AS t FROM jobs WHERE status = 'queued' "
+                    "UNION ALL SELECT MIN(lease_until) FROM jobs WHERE status = 'running')").fetchone()[0]
+                wait = POLL_SECONDS if next_due is None else min(max(next_due - now, 0.01), POLL_SECONDS)
+                self._changed.wait(wait)
+            return None
+
+    def _renew_leases(self):
+        """Keep this process's running jobs leased while it is alive"""
+        while True:
+            time.sleep(self.lease_seconds / 3)
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE jobs SET lease_until = ? WHERE status = 'running' AND lease_owner = ?",
+                    (time.time() + self.lease_seconds, self.owner))
+
+    def _run(self, job):
+        attempts = job["attempts"]
+        func, _ = self.tasks.get(job["task"], (None, None))
+        try:
+            if func is None:
+                raise LookupError(f"Unknown task '{job['task']}'")
+            result, error = json.dumps(func(**json.loads(job["payload"]))), None
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+
+        now = time.time()
+        # Every update is conditional on still holding the lease; if it was lost, the new holder owns the job
+        held = "WHERE id = ? AND status = 'running' AND lease_owner = ?"
+        with self._lock:
+            if error is None:
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'succeeded', result = ?, error = NULL, finished_at = ?, "
+                    f"lease_until = NULL {held}", (result, now, job["id"], self.owner))
+                self.succeeded += 1
+            elif attempts < job["max_attempts"]:
+                # Exponential backoff with jitter, so a failing dependency isn't hit in lockstep
+                delay = min(self.backoff * 2 ** (attempts - 1), MAX_BACKOFF) * random.uniform(0.5, 1.0)
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'queued', error = ?, run_after = ?, lease_owner = NULL, "
+                    f"lease_until = NULL {held}", (error, now + delay, job["id"], self.owner))
+                self.retried += 1
+            else:
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, finished_at = ?, "
+                    f"lease_until = NULL {held}", (error, now, job["id"], self.owner))
+                self.failed += 1
+            self._busy -= 1
+            self._changed.notify_all()
+
+    # --- Shutdown ---
+
+    def shutdown(self, timeout=None):
+        """
+        Stop accepting and starting jobs, and wait up to timeout seconds
+        (default drain_seconds) for running ones; True if they all finished.
+        Jobs still running at the deadline are released back to the queue,
+        so the next process runs them without waiting for the lease.
+        """
+        deadline = time.monotonic() + (self.drain_seconds if timeout is None else timeout)
+        with self._lock:
+            self._accepting = False
+            self._changed.notify_all()
+            while self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = 'queued', run_after = ?, lease_owner = NULL, lease_until = NULL "
+                        "WHERE status = 'running' AND lease_owner = ?", (time.time(), self.owner))
+                    return False
+                self._changed.wait(remaining)
+        return True
+
+    def drain_on_sigterm(self):
+        """Drain, then exit, on SIGTERM; call from the main thread"""
+        def handle(signum, frame):
+            print(f"🛑 Draining background jobs (up to {self.drain_seconds:g}s)...", flush=True)
+            if self.shutdown():
+                print("✅ Background jobs drained", flush=True)
+            else:
+                print("⚠️  Jobs still running; they will run again on the next start", flush=True)
+            sys.exit(0)
+        signal.signal(signal.SIGTERM, handle)
+
+    # --- Status ---
+
+    def get(self, job_id):
+        """A job's status as a dict (with its result once it has succeeded), or None"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = {field: row[field] for field in PUBLIC_FIELDS}
+        if row["status"] == "succeeded":
+            job["result"] = json.loads(row["result"])
+        return job
+
+    def status_view(self, job_id):
+        job = self.get(job_id)
+        if job is None:
+            return jsonify({"error": "Job not found"}), 404
+        return jsonify(job)
+
+    def result_view(self, job_id):
+        job = self.get(job_id)
+        if job is None:
+            return jsonify({"error": "Job not found"}), 404
+        if job["status"] == "succeeded":
+            return jsonify({"id": job_id, "result": job["result"]})
+        if job["status"] == "failed":
+            return jsonify({"id": job_id, "status": "failed", "error": job["error"]}), 500
+        response = jsonify({"id": job_id, "status": job["status"]})
+        response.status_code = 202
+        response.headers["Retry-After"] = "1"
+        return response
+
+    def _queue_full(self, error):
+        response = jsonify({"error": str(error)})
+        response.status_code = 503
+        response.headers["Retry-After"] = "5"
+        return response
+
+    def stats(self):
+        """Queue depth across every process; busy workers and outcomes for this one"""
+        with self._lock:
+            queued = self._conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+            return {
+                "workers": self.workers,
+                "busy": self._busy,
+                "queued": queued,
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+                "retried": self.retried,
+            }
@@ -0,0 +1,171 @@
+"""
+{{PROJECT_NAME}} - Request metrics
+
+Per-route request counters and latency histograms, exposed at /metrics in
+the Prometheus text format:
+
+    http_requests_total{method,route,status}
+    http_request_duration_seconds_bucket{method,route,le}  (+ _sum, _count)
+
+Recording is cheap enough to leave on in production: each thread writes
+to its own shard of plain lists and dicts, and latencies go into fixed
+buckets (one bisect, one increment). The request path takes no locks:
+a thread's shard is held in a thread-local lease, and when the thread
+exits (the threaded dev server uses one per request) the lease returns
+the shard to a free list for the next new thread. Taking and returning
+shards, and registering new ones, are single atomic deque/list
+operations. There are only ever as many shards as the peak number of
+concurrent threads, and a scrape sums them.
+
+Routes are labelled by their URL rule (/api/items/<int:item_id>), not the
+raw path, and unmatched paths share one label, to keep cardinality fixed.
+
+Configuration (environment):
+    METRICS_ENABLED   1 (set 0 to stop recording; /metrics stays up)
+"""
+
+import bisect
+import collections
+import os
+import threading
+import time
+
+from flask import Response, g, request
+
+# Upper bounds in seconds (Prometheus client defaults)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = "<unmatched>"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+class Shard:
+    """Counts written by one thread at a time (whichever holds its lease)"""
+    __slots__ = ("histograms", "statuses")
+
+    def __init__(self):
+        self.histograms = {}  # (method, route) -> [sum, count, bucket counts..., +Inf count]
+        self.statuses = {}    # (method, route, status) -> count
+
+    def merge_into(self, histograms, statuses):
+        for key, values in list(self.histograms.items()):
+            total = histograms.setdefault(key, [0.0] * len(values))
+            for i, value in enumerate(values):
+                total[i] += value
+        for key, count in list(self.statuses.items()):
+            statuses[key] = statuses.get(key, 0) + count
+
+class ShardLease:
+    """Lives in a thread-local; dropped when its thread exits, handing the shard back"""
+    __slots__ = ("shard", "free")
+
+    def __init__(self, shard, free):
+        self.shard = shard
+        self.free = free
+
+    def __del__(self):
+        self.free.append(self.shard)
+
+class RequestMetrics:
+    def __init__(self, app=None, endpoint="/metrics", enabled=None):
+        self.endpoint = endpoint
+        self.enabled = enabled if enabled is not None else os.environ.get("METRICS_ENABLED", "1") != "0"
+        self.started_at = time.time()
+        self._local = threading.local()
+        self._shards = []                  # Every shard ever created
+        self._free = collections.deque()   # Shards whose threads have exited
+        self._gauges = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions["request_metrics"] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.add_url_rule(self.endpoint, "metrics", self.metrics_view)
+
+    def register_gauges(self, prefix, source):
+        """Export the numeric values of source() (a dict) as <prefix>_<key> gauges on each scrape"""
+        self._gauges[prefix] = source
+
+    # --- Recording ---
+
+    def _shard(self):
+        lease = getattr(self._local, "lease", None)
+        if lease is None:
+            try:
+                shard = self._free.pop()
+            except IndexError:
+                shard = Shard()
+                self._shards.append(shard)
+            lease = self._local.lease = ShardLease(shard, self._free)
+        return lease.shard
+
+    def _before_request(self):
+        g._metrics_started = time.perf_counter()
+
+    def _after_request(self, response):
+        started = g.pop("_metrics_started", None)
+        if started is not None and self.enabled and request.path != self.endpoint:
+            route = request.url_rule.rule if request.url_rule is not None else UNMATCHED_ROUTE
+            self.record(request.method, route, response.status_code, time.perf_counter() - started)
+        return response
+
+    def record(self, method, route, status, seconds):
+        shard = self._shard()
+        key = (method, route)
+        values = shard.histograms.get(key)
+        if values is None:
+            values = shard.histograms[key] = [0.0] * (len(BUCKETS) + 3)
+        values[0] += seconds
+        values[1] += 1
+        values[2 + bisect.bisect_left(BUCKETS, seconds)] += 1
+        status_key = (method, route, status)
+        shard.statuses[status_key] = shard.statuses.get(status_key, 0) + 1
+
+    # --- Exposition ---
+
+    def snapshot(self):
+        """Totals across every shard: (histograms, statuses)"""
+        histograms, statuses = {}, {}
+        for shard in list(self._shards):
+            shard.merge_into(histograms, statuses)
+        return histograms, statuses
+
+    def render(self):
+        histograms, statuses = self.snapshot()
+        lines = [
+            "# HELP http_requests_total Requests handled, by route and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status), count in sorted(statuses.items()):
+            lines.append(f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status}"}} {count}')
+
+        lines += [
+            "# HELP http_request_duration_seconds Request latency, by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), values in sorted(histograms.items()):
+            labels = f'method="{method}",route="{_escape(route)}"'
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ("+Inf",), values[2:]):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {int(cumulative)}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {values[0]:.6f}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {int(values[1])}")
+
+        for prefix, source in sorted(self._gauges.items()):
+            for key, value in sorted(source().items()):
+                if isinstance(value, (int, float)):
+                    lines.append(f"# TYPE {prefix}_{key} gauge")
+                    lines.append(f"{prefix}_{key} {float(value):g}")
+
+        lines += [
+            "# TYPE process_start_time_seconds gauge",
+            f"process_start_time_seconds {self.started_at:.3f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def metrics_view(self):
+        return Response(self.render(), content_type=CONTENT_TYPE)
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
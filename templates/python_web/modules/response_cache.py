@@ -0,0 +1,226 @@
+"""
+{{PROJECT_NAME}} - Response cache
+
+In-process response caching for read-heavy routes. Opt in per route:
+
+    cache = ResponseCache(app)
+
+    @app.route("/api/items")
+    @cache.cached(ttl=30, vary_headers=["Accept-Language"])
+    def api_items():
+        ...
+
+Cached responses are kept in an LRU bounded by total body bytes, expire
+after their TTL, and carry a strong ETag so clients revalidating with
+If-None-Match get a bodyless 304. The cache key is the route plus the
+request path, query string and any headers listed in vary_headers (also
+sent back as Vary). Only successful GET/HEAD responses without cookies
+or Cache-Control: no-store/private are stored.
+
+Requests carrying credentials (Authorization or Cookie) skip the cache,
+since the view may answer differently per user. A route whose responses
+are safe to keep per credential can pass per_user=True, which adds those
+headers to the key instead.
+
+Configuration (environment):
+    RESPONSE_CACHE_ENABLED          1 (set 0 to bypass every cached route)
+    RESPONSE_CACHE_MAX_BYTES        33554432 (32 MiB across all entries)
+    RESPONSE_CACHE_MAX_ENTRY_BYTES  1048576 (larger responses aren't stored)
+    RESPONSE_CACHE_TTL              60 seconds, when a route doesn't set one
+
+Hit/miss counters are in stats(), which /health reports.
+"""
+
+import functools
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from flask import Response, make_response, request
+
+# Per-entry bookkeeping on top of the body, so many tiny entries still count against the limit
+ENTRY_OVERHEAD = 256
+UNCACHEABLE_DIRECTIVES = ("no-store", "private")
+DROPPED_HEADERS = {"content-length", "date", "etag", "vary", "x-cache"}
+CREDENTIAL_HEADERS = ("Authorization", "Cookie")
+
+class CacheEntry:
+    __slots__ = ("body", "status", "headers", "etag", "expires_at", "size")
+
+    def __init__(self, body, status, headers, etag, expires_at):
+        self.body = body
+        self.status = status
+        self.headers = headers
+        self.etag = etag
+        self.expires_at = expires_at
+        self.size = len(body) + sum(len(k) + len(v) for k, v in headers) + ENTRY_OVERHEAD
+
+class ResponseCache:
+    def __init__(self, app=None, max_bytes=None, max_entry_bytes=None, default_ttl=None, enabled=None):
+        self.max_bytes = max_bytes or int(os.environ.get("RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+        self.max_entry_bytes = max_entry_bytes or int(os.environ.get("RESPONSE_CACHE_MAX_ENTRY_BYTES", 1024 * 1024))
+        self.default_ttl = default_ttl or float(os.environ.get("RESPONSE_CACHE_TTL", 60))
+        self.enabled = enabled if enabled is not None else os.environ.get("RESPONSE_CACHE_ENABLED", "1") != "0"
+
+        self._entries = OrderedDict()  # key -> CacheEntry, least recently used first
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.uncacheable = 0
+        self.credentialed = 0
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions["response_cache"] = self
+
+    # --- Decorator ---
+
+    def cached(self, ttl=None, vary_headers=(), query=True, per_user=False):
+        """
+        Cache a view's responses for `ttl` seconds, keyed on path, query
+        string (unless query=False) and the values of `vary_headers`.
+        Credentialed requests bypass the cache unless per_user=True.
+        """
+        vary_headers = tuple(vary_headers)
+        key_headers = vary_headers + CREDENTIAL_HEADERS if per_user else vary_headers
+
+        def decorator(view):
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                if not self.enabled or request.method not in ("GET", "HEAD"):
+                    return view(*args, **kwargs)
+                if not per_user and any(name in request.headers for name in CREDENTIAL_HEADERS):
+                    with self._lock:
+                        self.credentialed += 1
+                    response = make_response(view(*args, **kwargs))
+                    response.headers["X-Cache"] = "BYPASS"
+                    return response
+
+                key = self._key(query, key_headers)
+                entry = self._get(key)
+                if entry is not None:
+                    return self._respond(entry, key_headers, "HIT")
+
+                response = make_response(view(*args, **kwargs))
+                entry = self._store(key, response, ttl or self.default_ttl)
+                if entry is None:
+                    response.headers["X-Cache"] = "BYPASS"
+                    return response
+                return self._respond(entry, key_headers, "MISS")
+            return wrapper
+        return decorator
+
+    def _key(self, query, key_headers):
+        return (
+            request.endpoint,
+            request.path,
+            tuple(sorted(request.args.items(multi=True))) if query else (),
+            tuple(request.headers.get(name, "") for name in key_headers),
+        )
+
+    # --- Storage ---
+
+    def _get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _store(self, key, response, ttl):
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if (response.status_code != 200 or response.is_streamed or "Set-Cookie" in response.headers
+                or any(directive in cache_control for directive in UNCACHEABLE_DIRECTIVES)):
+            with self._lock:
+                self.uncacheable += 1
+            return None
+
+        body = response.get_data()
+        if len(body) > self.max_entry_bytes:
+            with self._lock:
+                self.uncacheable += 1
+            return None
+
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        headers = [(k, v) for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS]
+        entry = CacheEntry(body, response.status_code, headers, etag, time.monotonic() + ttl)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._bytes > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return entry
+
+    def _remove(self, key):
+        """Caller holds the lock"""
+        self._bytes -= self._entries.pop(key).size
+
+    # --- Responses ---
+
+    def _respond(self, entry, vary_headers, outcome):
+        if self._etag_matches(entry.etag):
+            with self._lock:
+                self.not_modified += 1
+            response = Response(status=304)
+        else:
+            response = Response(entry.body, status=entry.status, headers=entry.headers)
+        response.headers["ETag"] = entry.etag
+        if vary_headers:
+            response.headers["Vary"] = ", ".join(vary_headers)
+        response.headers["X-Cache"] = outcome
+        return response
+
+    def _etag_matches(self, etag):
+        header = request.headers.get("If-None-Match")
+        if not header:
+            return False
+        candidates = [tag.strip() for tag in header.split(",")]
+        # Weak comparison, as RFC 9110 requires for If-None-Match
+        return "*" in candidates or etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+    # --- Management ---
+
+    def invalidate(self, endpoint=None):
+        """Drop every entry for one endpoint (e.g. after a write), or everything"""
+        with self._lock:
+            for key in [k for k in self._entries if endpoint is None or k[0] == endpoint]:
+                self._remove(key)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "not_modified": self.not_modified,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "uncacheable": self.uncacheable,
+                "credentialed": self.credentialed,
+            }
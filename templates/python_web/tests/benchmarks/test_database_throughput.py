@@ -0,0 +1,70 @@
+"""
+Benchmark: database throughput under concurrent requests.
+
+Compares the pooled Database against opening a connection per request
+(the usual first attempt) with several request threads running at once,
+and batched execute_many() against one commit per row. Opt-in: run with
+RUN_BENCHMARKS=1 and -s to see the numbers; the assertions only check
+the pool and batching still come out ahead.
+"""
+
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from modules.database import Database
+
+THREADS = 8
+REQUESTS = 4000
+ROWS = 5000
+LOOKUP = "SELECT id, name, status FROM items WHERE id = ?"
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "bench.db"), readers=THREADS)
+    database.executescript("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, status TEXT)")
+    database.execute_many("INSERT INTO items (name, status) VALUES (?, ?)",
+                          ((f"item {i}", "active") for i in range(ROWS)))
+    yield database
+    database.close()
+
+def requests_per_second(handler):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        list(pool.map(handler, (i % ROWS + 1 for i in range(REQUESTS))))
+    return REQUESTS / (time.perf_counter() - started)
+
+def test_pooled_reads_beat_connect_per_request(db):
+    def naive(item_id):
+        conn = sqlite3.connect(db.path)
+        try:
+            return conn.execute(LOOKUP, (item_id,)).fetchone()
+        finally:
+            conn.close()
+
+    def pooled(item_id):
+        return db.query_one(LOOKUP, (item_id,))
+
+    naive_rate = requests_per_second(naive)
+    pooled_rate = requests_per_second(pooled)
+    print(f"\n{THREADS} threads: {naive_rate:,.0f} req/s connecting per request, "
+          f"{pooled_rate:,.0f} req/s pooled ({pooled_rate / naive_rate:.1f}x)")
+    assert pooled_rate > naive_rate
+
+def test_batched_writes_beat_commit_per_row(db):
+    rows = [(f"new {i}", "pending") for i in range(1000)]
+
+    started = time.perf_counter()
+    for row in rows:
+        db.execute("INSERT INTO items (name, status) VALUES (?, ?)", row)
+    per_row = time.perf_counter() - started
+
+    started = time.perf_counter()
+    db.execute_many("INSERT INTO items (name, status) VALUES (?, ?)", rows)
+    batched = time.perf_counter() - started
+
+    print(f"\n{len(rows)} inserts: {per_row * 1000:.1f} ms one commit per row, "
+          f"{batched * 1000:.1f} ms batched ({per_row / batched:.0f}x)")
+    assert batched < per_row
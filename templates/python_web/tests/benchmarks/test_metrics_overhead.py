@@ -0,0 +1,61 @@
+"""
+Benchmark: cost of request metrics, per record() call and per request.
+
+Opt-in: run with RUN_BENCHMARKS=1 and -s to see the numbers. The
+assertions are deliberately loose ceilings; they catch recording becoming
+expensive (a lock, a sort, an allocation per bucket), not normal
+machine-to-machine variation.
+"""
+
+import time
+
+from flask import Flask
+
+from modules.metrics import RequestMetrics
+
+RECORDS = 100_000
+REQUESTS = 500
+ROUNDS = 8
+
+def make_app(with_metrics):
+    app = Flask(__name__)
+    if with_metrics:
+        RequestMetrics(app, enabled=True)
+
+    @app.route("/api/items/<int:item_id>")
+    def item(item_id):
+        return {"id": item_id}
+
+    return app.test_client()
+
+def per_request_seconds(client):
+    started = time.perf_counter()
+    for i in range(REQUESTS):
+        client.get(f"/api/items/{i}")
+    return (time.perf_counter() - started) / REQUESTS
+
+def best_of_interleaved(*clients):
+    """Best per-request time for each client, alternating rounds so machine noise hits both alike"""
+    for client in clients:
+        client.get("/api/items/1")  # warm up
+    best = [float("inf")] * len(clients)
+    for _ in range(ROUNDS):
+        for i, client in enumerate(clients):
+            best[i] = min(best[i], per_request_seconds(client))
+    return best
+
+def test_record_cost():
+    metrics = RequestMetrics(enabled=True)
+    started = time.perf_counter()
+    for i in range(RECORDS):
+        metrics.record("GET", "/api/items/<int:item_id>", 200, (i % 100) / 1000)
+    per_call = (time.perf_counter() - started) / RECORDS
+    print(f"\nrecord(): {per_call * 1e6:.2f} µs/call")
+    assert per_call < 20e-6
+
+def test_request_overhead():
+    baseline, instrumented = best_of_interleaved(make_app(with_metrics=False), make_app(with_metrics=True))
+    overhead = instrumented - baseline
+    print(f"\nper request: {baseline * 1e6:.1f} µs without metrics, {instrumented * 1e6:.1f} µs with "
+          f"({overhead * 1e6:+.1f} µs, {overhead / baseline:+.1%})")
+    assert overhead < max(50e-6, baseline * 0.25)
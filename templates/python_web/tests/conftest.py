@@ -0,0 +1,8 @@
+"""
+Make the project root importable (modules/, {{MAIN_FILE}}) however pytest is invoked
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,86 @@
+"""
+The service as wired in app.py: health, cached routes, the report job and /metrics
+"""
+
+import importlib
+import os
+import sys
+import time
+
+import pytest
+
+ENVIRONMENT = {
+    "RESPONSE_CACHE_ENABLED": "1",
+    "METRICS_ENABLED": "1",
+    "JOBS_WORKERS": "1",
+}
+
+@pytest.fixture(scope="module")
+def service(tmp_path_factory):
+    environment = dict(ENVIRONMENT, JOBS_DB=str(tmp_path_factory.mktemp("jobs") / "jobs.db"))
+    saved = {name: os.environ.get(name) for name in environment}
+    os.environ.update(environment)
+    sys.modules.pop("app", None)  # Import fresh so the queue opens the database above
+    try:
+        module = importlib.import_module("app")
+        yield module
+        module.jobs.shutdown(timeout=5)
+    finally:
+        sys.modules.pop("app", None)
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+@pytest.fixture
+def client(service):
+    service.cache.invalidate()
+    return service.app.test_client()
+
+def test_health_reports_cache_and_jobs(service, client):
+    before = service.cache.stats()["misses"]
+    client.get("/api/items")
+    client.get("/api/items")
+    health = client.get("/health").get_json()
+    assert health["status"] == "healthy"
+    assert health["cache"]["misses"] == before + 1
+    assert health["cache"]["hits"] >= 1
+    assert "queued" in health["jobs"]
+
+def test_cached_items_revalidate_with_etag(client):
+    first = client.get("/api/items?status=active")
+    assert first.headers["X-Cache"] == "MISS"
+    assert [item["status"] for item in first.get_json()["items"]] == ["active"]
+    revalidated = client.get("/api/items?status=active", headers={"If-None-Match": first.headers["ETag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+
+def test_credentialed_requests_skip_the_cache(client):
+    client.get("/api/items")
+    response = client.get("/api/items", headers={"Authorization": "Bearer token"})
+    assert response.headers["X-Cache"] == "BYPASS"
+
+def test_report_is_accepted_and_built_in_the_background(client):
+    response = client.post("/api/reports")
+    assert response.status_code == 202
+    status_url = response.headers["Location"]
+    assert status_url == response.get_json()["status_url"]
+
+    deadline = time.monotonic() + 5
+    while client.get(status_url).get_json()["status"] != "succeeded":
+        assert time.monotonic() < deadline, "report job never finished"
+        time.sleep(0.02)
+    report = client.get(response.get_json()["result_url"]).get_json()["result"]
+    assert report["total"] == sum(report["by_status"].values())
+
+def test_unknown_job_is_404(client):
+    assert client.get("/api/jobs/missing").status_code == 404
+
+def test_metrics_cover_routes_and_registered_gauges(service, client):
+    assert "build_report" in service.jobs.tasks
+    client.get("/api/status")
+    body = client.get("/metrics").get_data(as_text=True)
+    assert 'http_requests_total{method="GET",route="/api/status",status="200"}' in body
+    assert "response_cache_hits " in body
+    assert "jobs_queued " in body
@@ -0,0 +1,102 @@
+"""
+Database: WAL pool, transactions, batched writes and concurrent access
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from modules.database import Database
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'active'
+);
+"""
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "data" / "test.db"), readers=4)
+    database.executescript(SCHEMA)
+    yield database
+    database.close()
+
+def test_creates_file_in_wal_mode(db, tmp_path):
+    assert (tmp_path / "data" / "test.db").exists()
+    assert db.stats()["journal_mode"] == "wal"
+    assert db.stats()["idle_readers"] == 4
+
+def test_execute_and_query(db):
+    item_id, rowcount = db.execute("INSERT INTO items (name) VALUES (?)", ("first",))
+    assert rowcount == 1
+    assert db.query_one("SELECT * FROM items WHERE id = ?", (item_id,)) == {
+        "id": item_id, "name": "first", "status": "active"}
+    assert db.query_one("SELECT * FROM items WHERE id = ?", (999,)) is None
+
+def test_read_pool_hands_out_its_connections(db):
+    with db.read() as first, db.read() as second, db.read() as third, db.read() as fourth:
+        assert len({id(first), id(second), id(third), id(fourth)}) == 4
+        assert db.stats()["idle_readers"] == 0
+    assert db.stats()["idle_readers"] == 4
+    with db.read() as again:
+        assert again is first  # Reused, not reopened; most recently returned first
+
+def test_execute_many_batches_in_one_transaction(db):
+    statements = []
+    db._writer.set_trace_callback(statements.append)
+    written = db.execute_many("INSERT INTO items (name) VALUES (?)",
+                              ((f"item {i}",) for i in range(2500)), batch_size=1000)
+    db._writer.set_trace_callback(None)
+    assert written == 2500
+    assert statements.count("BEGIN IMMEDIATE") == 1
+    assert statements.count("COMMIT") == 1
+    assert db.query_one("SELECT COUNT(*) AS n FROM items")["n"] == 2500
+
+def test_failed_write_rolls_back(db):
+    with pytest.raises(sqlite3.IntegrityError):
+        with db.write() as conn:
+            conn.execute("INSERT INTO items (name) VALUES (?)", ("kept?",))
+            conn.execute("INSERT INTO items (name) VALUES (NULL)")
+    assert db.query("SELECT * FROM items") == []
+
+def test_read_connections_are_read_only(db):
+    with pytest.raises(sqlite3.OperationalError):
+        with db.read() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('nope')")
+    assert db.stats()["idle_readers"] == 4
+
+def test_in_memory_database_reads_through_the_writer():
+    database = Database(":memory:")
+    database.executescript(SCHEMA)
+    database.execute("INSERT INTO items (name) VALUES (?)", ("only",))
+    assert [row["name"] for row in database.query("SELECT name FROM items")] == ["only"]
+    database.close()
+
+def test_concurrent_readers_and_writers(db):
+    errors = []
+
+    def writer(n):
+        try:
+            for i in range(50):
+                db.execute("INSERT INTO items (name) VALUES (?)", (f"{n}-{i}",))
+        except Exception as e:
+            errors.append(e)
+
+    def reader():
+        try:
+            for _ in range(200):
+                db.query("SELECT COUNT(*) AS n FROM items")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    threads += [threading.Thread(target=reader) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert db.query_one("SELECT COUNT(*) AS n FROM items")["n"] == 200
@@ -0,0 +1,291 @@
+"""
+Background jobs: 202 flow, retries with backoff, durability and draining
+"""
+
+import os
+import signal
+import socket
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from modules.jobs import JobQueue, JobQueueFull
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# The service's startup, as in app.py's __main__ block, with a slow task to drain
+SERVICE = """
+import sys, time
+import app as service
+
+@service.jobs.task()
+def nap(seconds):
+    time.sleep(seconds)
+    return seconds
+
+service.jobs.drain_on_sigterm()
+service.jobs.start()
+print(service.jobs.enqueue("nap", seconds=float(sys.argv[2])), flush=True)
+service.app.run(host="127.0.0.1", port=int(sys.argv[1]))
+"""
+
+def wait_for(jobs, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = jobs.get(job_id)
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} still {job['status']}")
+
+@pytest.fixture
+def service(tmp_path):
+    app = Flask(__name__)
+    jobs = JobQueue(app, path=str(tmp_path / "jobs.db"), workers=2, max_attempts=3, backoff=0.01)
+    calls = []
+
+    @jobs.task()
+    def add(a, b):
+        return a + b
+
+    @jobs.task()
+    def flaky(succeed_on):
+        calls.append(time.monotonic())
+        if len(calls) < succeed_on:
+            raise ConnectionError("upstream unavailable")
+        return "ok"
+
+    @app.route("/api/add", methods=["POST"])
+    def submit():
+        return jobs.accepted(jobs.enqueue("add", a=2, b=3))
+
+    yield app.test_client(), jobs, calls
+    jobs.shutdown(timeout=1)
+
+def test_endpoint_returns_202_then_result(service):
+    client, jobs, _ = service
+    response = client.post("/api/add")
+    assert response.status_code == 202
+    job_id = response.get_json()["id"]
+    assert response.headers["Location"].endswith(f"/api/jobs/{job_id}")
+
+    assert wait_for(jobs, job_id)["status"] == "succeeded"
+    assert client.get(f"/api/jobs/{job_id}").get_json()["result"] == 5
+    assert client.get(f"/api/jobs/{job_id}/result").get_json() == {"id": job_id, "result": 5}
+
+def test_unknown_job_is_404(service):
+    client, _, _ = service
+    assert client.get("/api/jobs/nope").status_code == 404
+    assert client.get("/api/jobs/nope/result").status_code == 404
+
+def test_retries_with_backoff_until_success(service):
+    client, jobs, calls = service
+    job = wait_for(jobs, jobs.enqueue("flaky", succeed_on=3))
+    assert job["status"] == "succeeded" and job["attempts"] == 3
+    assert len(calls) == 3
+    # Backoff 0.01s doubling, with jitter of up to half
+    assert calls[1] - calls[0] >= 0.005
+    assert calls[2] - calls[1] >= 0.01
+    assert jobs.stats()["retried"] == 2
+
+def test_fails_after_max_attempts(service):
+    client, jobs, calls = service
+    job_id = jobs.enqueue("flaky", succeed_on=99)
+    job = wait_for(jobs, job_id)
+    assert job["status"] == "failed" and job["attempts"] == 3
+    assert "ConnectionError" in job["error"]
+    response = client.get(f"/api/jobs/{job_id}/result")
+    assert response.status_code == 500
+
+def blocking_queue(tmp_path, **options):
+    """A queue whose 'slow' task holds its worker until the returned event is set"""
+    app = Flask(__name__)
+    jobs = JobQueue(app, path=str(tmp_path / "jobs.db"), workers=1, **options)
+    started, release = threading.Event(), threading.Event()
+
+    @jobs.task()
+    def slow():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    @jobs.task()
+    def add(a, b):
+        return a + b
+
+    return app, jobs, started, release
+
+def test_pending_result_is_202(tmp_path):
+    app, jobs, started, release = blocking_queue(tmp_path)
+    jobs.enqueue("slow")
+    assert started.wait(5)
+    job_id = jobs.enqueue("add", a=1, b=2)
+    response = app.test_client().get(f"/api/jobs/{job_id}/result")
+    assert response.status_code == 202
+    assert response.get_json()["status"] == "queued"
+    release.set()
+    assert wait_for(jobs, job_id)["result"] == 3
+
+def test_full_queue_answers_503(tmp_path):
+    app, jobs, started, release = blocking_queue(tmp_path, max_pending=2)
+
+    @app.route("/api/add", methods=["POST"])
+    def submit():
+        return jobs.accepted(jobs.enqueue("add", a=1, b=1))
+
+    jobs.enqueue("slow")
+    assert started.wait(5)
+    client = app.test_client()
+    responses = [client.post("/api/add") for _ in range(2)]
+    assert [r.status_code for r in responses] == [202, 503]
+    assert responses[1].headers["Retry-After"]
+    release.set()
+
+def test_live_leases_are_left_alone(tmp_path):
+    app, first, started, release = blocking_queue(tmp_path)
+    running = first.enqueue("slow")
+    assert started.wait(5)
+    queued = first.enqueue("add", a=2, b=2)
+
+    # Another process on the same database takes queued work, not the job the first is running
+    second = JobQueue(Flask(__name__), path=first.path, workers=1, lease_seconds=0.3)
+    second.task(name="slow")(lambda: "stolen")
+    second.task(name="add")(lambda a, b: a + b)
+    second.start()
+    assert wait_for(second, queued)["result"] == 4
+    time.sleep(0.5)  # Longer than a lease, but the first process keeps renewing its own
+    assert second.get(running)["status"] == "running"
+
+    release.set()
+    assert wait_for(first, running)["result"] == "done"
+    second.shutdown(timeout=1)
+
+def test_expired_lease_is_taken_over_on_start(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    jobs = JobQueue(Flask(__name__), path=path, workers=1)
+    jobs.task(name="add")(lambda a, b: a + b)
+    # Left running by a process that died; its lease ran out a second ago
+    jobs._conn.execute(
+        "INSERT INTO jobs (id, task, payload, status, attempts, max_attempts, run_after, created_at, "
+        "lease_owner, lease_until) VALUES ('orphan', 'add', '{\"a\": 1, \"b\": 1}', 'running', 1, 3, ?, ?, "
+        "'gone:1:0', ?)", (time.time(), time.time(), time.time() - 1))
+
+    # start() alone runs it, without any request arriving
+    jobs.start()
+    job = wait_for(jobs, "orphan")
+    assert job["result"] == 2 and job["attempts"] == 2
+    jobs.shutdown(timeout=1)
+
+def test_processes_sharing_a_database_run_each_job_once(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    ran = []
+    queues = []
+    for _ in range(2):
+        queue = JobQueue(path=path, workers=4)
+        queue.task(name="record")(lambda n: ran.append(n))
+        queues.append(queue)
+    ids = [queues[i % 2].enqueue("record", n=i) for i in range(200)]
+    for queue in queues:
+        queue.start()
+    for job_id in ids:
+        assert wait_for(queues[0], job_id)["status"] == "succeeded"
+    assert sorted(ran) == list(range(200))
+    for queue in queues:
+        queue.shutdown(timeout=1)
+
+def slow_task(jobs):
+    started, release = threading.Event(), threading.Event()
+
+    @jobs.task()
+    def slow():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    return started, release
+
+def test_shutdown_waits_for_running_jobs_and_refuses_new_ones(service):
+    client, jobs, _ = service
+    started, release = slow_task(jobs)
+    job_id = jobs.enqueue("slow")
+    assert started.wait(5)
+    threading.Timer(0.1, release.set).start()
+    assert jobs.shutdown(timeout=5) is True
+    assert jobs.get(job_id)["status"] == "succeeded"
+    with pytest.raises(JobQueueFull):
+        jobs.enqueue("add", a=1, b=1)
+
+def test_drain_timeout_releases_running_jobs(service):
+    client, jobs, _ = service
+    started, release = slow_task(jobs)
+    job_id = jobs.enqueue("slow")
+    assert started.wait(5)
+    assert jobs.shutdown(timeout=0.05) is False
+    assert jobs.get(job_id)["status"] == "queued"
+
+    # The abandoned run finishing late doesn't overwrite the released job
+    release.set()
+    time.sleep(0.1)
+    assert jobs.get(job_id)["status"] == "queued"
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def job_status(path, job_id):
+    conn = sqlite3.connect(path)
+    try:
+        row = conn.execute("SELECT status, attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    finally:
+        conn.close()
+    return row
+
+def start_service(tmp_path, nap_seconds, drain_seconds):
+    """Run the service in a subprocess; returns it, its jobs database and the queued job's id"""
+    path = str(tmp_path / "jobs.db")
+    script = tmp_path / "service.py"
+    script.write_text(SERVICE)
+    env = dict(os.environ, JOBS_DB=path, JOBS_DRAIN_SECONDS=str(drain_seconds), PYTHONUNBUFFERED="1",
+               PYTHONPATH=str(PROJECT_ROOT))
+    process = subprocess.Popen([sys.executable, str(script), str(free_port()), str(nap_seconds)],
+                               cwd=PROJECT_ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True)
+    job_id = process.stdout.readline().strip()
+    deadline = time.monotonic() + 10
+    while job_status(path, job_id)[0] != "running":
+        assert time.monotonic() < deadline, "job never started"
+        time.sleep(0.02)
+    return process, path, job_id
+
+@pytest.mark.skipif(os.name == "nt", reason="SIGTERM terminates immediately on Windows")
+def test_sigterm_drains_running_jobs(tmp_path):
+    process, path, job_id = start_service(tmp_path, nap_seconds=1.0, drain_seconds=10)
+    process.send_signal(signal.SIGTERM)
+    assert process.wait(timeout=10) == 0
+    assert "Background jobs drained" in process.stdout.read()
+    assert job_status(path, job_id) == ("succeeded", 1)
+
+@pytest.mark.skipif(os.name == "nt", reason="SIGTERM terminates immediately on Windows")
+def test_sigterm_requeues_jobs_that_outlast_the_drain(tmp_path):
+    process, path, job_id = start_service(tmp_path, nap_seconds=30, drain_seconds=0.2)
+    started = time.monotonic()
+    process.send_signal(signal.SIGTERM)
+    assert process.wait(timeout=10) == 0
+    assert time.monotonic() - started < 5
+    process.stdout.close()
+    assert job_status(path, job_id)[0] == "queued"
+
+    # The next start runs it straight away
+    restarted = JobQueue(path=path, workers=1)
+    restarted.task(name="nap")(lambda seconds: "resumed")
+    restarted.start()
+    job = wait_for(restarted, job_id)
+    assert job["result"] == "resumed" and job["attempts"] == 2
+    restarted.shutdown(timeout=1)
@@ -0,0 +1,89 @@
+"""
+Request metrics: per-route counters, cumulative histograms and the /metrics exposition
+"""
+
+import threading
+
+import pytest
+from flask import Flask
+
+from modules.metrics import BUCKETS, RequestMetrics
+
+@pytest.fixture
+def service():
+    app = Flask(__name__)
+    metrics = RequestMetrics(app, enabled=True)
+
+    @app.route("/api/items/<int:item_id>")
+    def item(item_id):
+        return {"id": item_id}
+
+    @app.route("/api/fail")
+    def fail():
+        return {"error": "nope"}, 503
+
+    return app.test_client(), metrics
+
+def sample(text, prefix):
+    return [line for line in text.splitlines() if line.startswith(prefix)]
+
+def test_counts_by_route_rule_and_status(service):
+    client, metrics = service
+    for item_id in range(3):
+        client.get(f"/api/items/{item_id}")
+    client.get("/api/fail")
+    text = client.get("/metrics").get_data(as_text=True)
+    assert 'http_requests_total{method="GET",route="/api/items/<int:item_id>",status="200"} 3' in text
+    assert 'http_requests_total{method="GET",route="/api/fail",status="503"} 1' in text
+
+def test_unmatched_paths_share_a_label(service):
+    client, metrics = service
+    client.get("/nope/1")
+    client.get("/nope/2")
+    text = client.get("/metrics").get_data(as_text=True)
+    assert 'route="<unmatched>",status="404"} 2' in text
+
+def test_histogram_is_cumulative(service):
+    client, metrics = service
+    metrics.record("GET", "/x", 200, 0.001)
+    metrics.record("GET", "/x", 200, 0.3)
+    metrics.record("GET", "/x", 200, 60.0)
+    lines = sample(metrics.render(), 'http_request_duration_seconds_bucket{method="GET",route="/x"')
+    counts = [int(line.rsplit(" ", 1)[1]) for line in lines]
+    assert len(counts) == len(BUCKETS) + 1
+    assert counts == sorted(counts)
+    assert counts[0] == 1 and counts[-2] == 2 and counts[-1] == 3
+    assert 'http_request_duration_seconds_count{method="GET",route="/x"} 3' in metrics.render()
+
+def test_threads_are_summed(service):
+    client, metrics = service
+
+    def work():
+        for _ in range(1000):
+            metrics.record("GET", "/t", 200, 0.002)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    histograms, statuses = metrics.snapshot()
+    assert statuses[("GET", "/t", 200)] == 8000
+    assert histograms[("GET", "/t")][1] == 8000
+
+def test_exited_threads_hand_their_shard_on(service):
+    client, metrics = service
+    # A thread per request, as the threaded dev server does
+    for _ in range(50):
+        thread = threading.Thread(target=metrics.record, args=("GET", "/t", 200, 0.002))
+        thread.start()
+        thread.join()
+    assert len(metrics._shards) == 1
+    assert metrics.snapshot()[1][("GET", "/t", 200)] == 50
+
+def test_metrics_endpoint_is_not_counted(service):
+    client, metrics = service
+    client.get("/metrics")
+    response = client.get("/metrics")
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+    assert 'route="/metrics"' not in response.get_data(as_text=True)
@@ -0,0 +1,126 @@
+"""
+Response cache: LRU/TTL storage, byte limits, ETag revalidation and per-route keys
+"""
+
+import time
+
+import pytest
+from flask import Flask, jsonify, request
+
+from modules.response_cache import ResponseCache
+
+@pytest.fixture
+def service():
+    app = Flask(__name__)
+    cache = ResponseCache(app, max_bytes=4096, max_entry_bytes=1024, default_ttl=60, enabled=True)
+    calls = {"count": 0}
+
+    @app.route("/api/echo")
+    @cache.cached(vary_headers=["Accept-Language"])
+    def echo():
+        calls["count"] += 1
+        return jsonify({"q": request.args.get("q"), "lang": request.headers.get("Accept-Language")})
+
+    @app.route("/api/short")
+    @cache.cached(ttl=0.05)
+    def short():
+        calls["count"] += 1
+        return jsonify({"n": calls["count"]})
+
+    @app.route("/api/big")
+    @cache.cached()
+    def big():
+        calls["count"] += 1
+        return "x" * 2048
+
+    @app.route("/api/private")
+    @cache.cached()
+    def private():
+        calls["count"] += 1
+        response = jsonify({})
+        response.headers["Cache-Control"] = "private"
+        return response
+
+    @app.route("/api/me")
+    @cache.cached(per_user=True)
+    def me():
+        calls["count"] += 1
+        return jsonify({"user": request.headers.get("Authorization")})
+
+    return app.test_client(), cache, calls
+
+def test_second_request_is_a_hit(service):
+    client, cache, calls = service
+    first = client.get("/api/echo?q=1")
+    second = client.get("/api/echo?q=1")
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.get_json() == first.get_json()
+    assert calls["count"] == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+def test_key_includes_query_and_selected_headers(service):
+    client, cache, calls = service
+    client.get("/api/echo?q=1")
+    client.get("/api/echo?q=2")
+    client.get("/api/echo?q=1", headers={"Accept-Language": "fr"})
+    client.get("/api/echo?q=1", headers={"User-Agent": "other"})  # not a vary header
+    assert calls["count"] == 3
+
+def test_if_none_match_returns_304(service):
+    client, cache, calls = service
+    etag = client.get("/api/echo").headers["ETag"]
+    revalidated = client.get("/api/echo", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+    assert revalidated.headers["ETag"] == etag
+    assert cache.stats()["not_modified"] == 1
+
+def test_entries_expire_after_ttl(service):
+    client, cache, calls = service
+    client.get("/api/short")
+    time.sleep(0.06)
+    assert client.get("/api/short").headers["X-Cache"] == "MISS"
+    assert cache.stats()["expirations"] == 1
+
+def test_total_bytes_stay_under_limit(service):
+    client, cache, calls = service
+    for i in range(50):
+        client.get(f"/api/echo?q={i}")
+    stats = cache.stats()
+    assert stats["bytes"] <= stats["max_bytes"]
+    assert stats["evictions"] > 0
+    # The most recent entry survives eviction
+    assert client.get("/api/echo?q=49").headers["X-Cache"] == "HIT"
+
+def test_uncacheable_responses_bypass(service):
+    client, cache, calls = service
+    assert client.get("/api/big").headers["X-Cache"] == "BYPASS"
+    assert client.get("/api/private").headers["X-Cache"] == "BYPASS"
+    assert cache.stats()["entries"] == 0
+
+def test_invalidate_endpoint(service):
+    client, cache, calls = service
+    client.get("/api/echo")
+    cache.invalidate("echo")
+    assert client.get("/api/echo").headers["X-Cache"] == "MISS"
+
+def test_credentialed_requests_bypass(service):
+    client, cache, calls = service
+    client.get("/api/echo")
+    raw = client.application.test_client(use_cookies=False)  # Sends the Cookie header as given
+    for headers in ({"Authorization": "Bearer alice"}, {"Cookie": "session=bob"}):
+        response = raw.get("/api/echo", headers=headers)
+        assert response.headers["X-Cache"] == "BYPASS"
+    assert calls["count"] == 3
+    assert cache.stats()["credentialed"] == 2
+
+def test_per_user_routes_key_on_credentials(service):
+    client, cache, calls = service
+    alice = client.get("/api/me", headers={"Authorization": "Bearer alice"})
+    bob = client.get("/api/me", headers={"Authorization": "Bearer bob"})
+    again = client.get("/api/me", headers={"Authorization": "Bearer alice"})
+    assert bob.get_json() == {"user": "Bearer bob"}
+    assert again.headers["X-Cache"] == "HIT" and again.get_json() == alice.get_json()
+    assert "Authorization" in again.headers["Vary"]
+    assert calls["count"] == 2
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+{{PROJECT_NAME}} - 4-phase test suite
+
+Business logic (modules/core.py) and the /api routes, one test per phase:
+backend (core functions directly), api (status codes), contract (response
+shape) and frontend (the flow a client follows). scripts/check-test-coverage.py
+reads the four dicts at the bottom, so add an entry there for every new
+core function or /api route.
+
+Runs under pytest or on its own: python tests/test_suite.py
+"""
+
+import importlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules import core
+
+_service = None
+_jobs_dir = tempfile.TemporaryDirectory(prefix="test-suite-jobs-")
+
+def client():
+    """The real app's test client, with jobs in a temporary database"""
+    global _service
+    if _service is None:
+        saved = os.environ.get("JOBS_DB")
+        os.environ["JOBS_DB"] = os.path.join(_jobs_dir.name, "jobs.db")
+        try:
+            _service = importlib.import_module("app")
+        finally:
+            sys.modules.pop("app", None)  # Other tests import their own copy
+            if saved is None:
+                os.environ.pop("JOBS_DB", None)
+            else:
+                os.environ["JOBS_DB"] = saved
+    return _service.app.test_client()
+
+def wait_for_job(http, status_url, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        job = http.get(status_url).get_json()
+        if job["status"] in ("succeeded", "failed") or time.monotonic() > deadline:
+            return job
+        time.sleep(0.02)
+
+# --- Backend ---
+
+def test_backend_get_status():
+    status = core.get_status()
+    assert status["service"]
+    assert status["uptime_seconds"] >= 0
+
+def test_backend_list_items():
+    assert len(core.list_items()) == len(core.ITEMS)
+    assert all(item["status"] == "active" for item in core.list_items(status="active"))
+    assert core.list_items(status="no-such-status") == []
+
+def test_backend_build_report():
+    report = core.build_report()
+    assert report["total"] == len(core.ITEMS)
+    assert sum(report["by_status"].values()) == report["total"]
+
+# --- API ---
+
+def test_api_status():
+    assert client().get("/api/status").status_code == 200
+
+def test_api_items():
+    assert client().get("/api/items").status_code == 200
+
+def test_api_reports():
+    assert client().post("/api/reports").status_code == 202
+    assert client().get("/api/reports").status_code == 405
+
+# --- Contract ---
+
+def test_contract_status():
+    body = client().get("/api/status").get_json()
+    assert set(body) == {"service", "uptime_seconds"}
+
+def test_contract_items():
+    body = client().get("/api/items?status=archived").get_json()
+    assert set(body) == {"items"}
+    assert all(set(item) == {"id", "name", "status"} for item in body["items"])
+
+def test_contract_reports():
+    response = client().post("/api/reports")
+    body = response.get_json()
+    assert set(body) == {"id", "status", "status_url", "result_url"}
+    assert response.headers["Location"] == body["status_url"]
+
+# --- Frontend ---
+
+def test_frontend_status():
+    response = client().get("/api/status")
+    assert response.mimetype == "application/json"
+
+def test_frontend_items():
+    http = client()
+    _service.cache.invalidate()  # Start cold, so this phase runs the view too
+    first = http.get("/api/items")
+    revalidated = http.get("/api/items", headers={"If-None-Match": first.headers["ETag"]})
+    assert revalidated.status_code == 304  # Browsers revalidate instead of re-downloading
+
+def test_frontend_reports():
+    http = client()
+    job = wait_for_job(http, http.post("/api/reports").headers["Location"])
+    assert job["status"] == "succeeded"
+    assert http.get(f"/api/jobs/{job['id']}/result").get_json()["result"]["total"] >= 0
+
+# --- Phases (read by scripts/check-test-coverage.py) ---
+
+backend_tests = {
+    "get_status": test_backend_get_status,
+    "list_items": test_backend_list_items,
+    "build_report": test_backend_build_report,
+}
+
+api_tests = {
+    "/api/status": test_api_status,
+    "/api/items": test_api_items,
+    "/api/reports": test_api_reports,
+}
+
+contract_tests = {
+    "/api/status": test_contract_status,
+    "/api/items": test_contract_items,
+    "/api/reports": test_contract_reports,
+}
+
+frontend_tests = {
+    "/api/status": test_frontend_status,
+    "/api/items": test_frontend_items,
+    "/api/reports": test_frontend_reports,
+}
+
+if __name__ == "__main__":
+    failures = 0
+    for phase, tests in [("Backend", backend_tests), ("API", api_tests),
+                         ("Contract", contract_tests), ("Frontend", frontend_tests)]:
+        for name, test in tests.items():
+            try:
+                test()
+                print(f"✅ {phase}: {name}")
+            except Exception as e:
+                failures += 1
+                print(f"❌ {phase}: {name}: {e!r}")
+    sys.exit(1 if failures else 0)